@@ -0,0 +1,154 @@
+﻿######################################################################################################
+################################# CROWNED DUELS - BALANCE REGRESSION #################################
+######################################################################################################
+# Checks the canonical matchups in balance_corpus.json against their recorded results and flags
+# drift after any change to PERK_STAT_MODIFIERS or the engines.
+#
+# - "exchange" entries are checked exactly with odds.py (initiative, crits, damage, ranged hits).
+# - "duel" entries are simulated with fixed seeds and stop early: batches run until the win rate's
+#   interval sits clearly inside (pass) or clearly outside (drift) the tolerance band.
+# - Entries are checked in parallel.
+#
+# Usage:
+# python balance.py                   (check the corpus - exits 1 on drift)
+# python balance.py --rebase          (record the current results as expected)
+######################################################################################################
+
+import argparse
+import json
+import multiprocessing
+import os
+import sys
+
+import workspace
+from batch import run_duel
+from odds import as_floats, exchange_odds
+
+CORPUS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "balance_corpus.json")
+BATCH_RUNS = 500                                            # Runs Between Early-Stopping Checks
+MAX_RUNS = 8000                                             # Runs Before a Duel Entry Is Judged As-Is
+REBASE_RUNS = 20000                                         # Runs Behind a Recorded Win Rate
+Z = 3.0                                                     # Interval Width - Wide for Repeated Looks
+
+######################################################################################################
+# Exchange Entries
+######################################################################################################
+
+def exchange_values(entry):
+    """Exact Exchange Odds an Entry Tracks"""
+    characters = workspace.side_initialization([entry["side1"], entry["side2"]])
+    ranged = entry.get("ranged", False)
+    for character in characters:
+        if ranged:
+            workspace.ranged_initialization(character)
+        else:
+            workspace.melee_initialization(character)
+    odds = as_floats(exchange_odds(*characters, ranged=ranged))
+    values = {
+        "side1_initiative": odds["initiative"]["side1"],
+        "side2_initiative": odds["initiative"]["side2"],
+        "side1_crit_success": odds["side1_crits"]["crit_success"],
+        "side2_crit_success": odds["side2_crits"]["crit_success"],
+        "side1_expected_damage": odds["side1_expected_damage"],
+        "side2_expected_damage": odds["side2_expected_damage"],
+    }
+    if ranged:
+        values["side1_ranged_hit"] = odds["side1_ranged_hit"]
+        values["side2_ranged_hit"] = odds["side2_ranged_hit"]
+    return values
+
+def check_exchange(entry):
+    """Exact Check - Any Change Is Drift"""
+    values = exchange_values(entry)
+    drift = {key: {"expected": entry["expected"].get(key), "actual": value}
+             for key, value in values.items() if abs(value - entry["expected"].get(key, float("nan"))) > 1e-9 or key not in entry["expected"]}
+    return {"id": entry["id"], "status": "drift" if drift else "pass", "drift": drift}
+
+######################################################################################################
+# Duel Entries
+######################################################################################################
+
+def duel_rate(entry, start, stop, counts):
+    """Play Runs [start, stop) & Update (Side One Wins, Completed) Counts"""
+    for index in range(start, stop):
+        outcome = run_duel(entry["combat_data"], entry["side1_data"], entry["side2_data"],
+                           entry.get("seed", 1), index, entry.get("max_rounds", 1000))
+        if outcome is not None:                             # - Faulted Runs Excluded
+            counts[1] += 1
+            counts[0] += outcome["winner"] == 1
+    return counts
+
+def check_duel(entry):
+    """Early-Stopping Monte Carlo Check Against the Expected Win Rate"""
+    expected = entry["expected"]
+    tolerance = entry["tolerance"]
+    counts = [0, 0]
+    runs = 0
+    rate, gap = 0.0, float("inf")
+    status = "pass"
+    while runs < MAX_RUNS:
+        duel_rate(entry, runs, runs + BATCH_RUNS, counts)
+        runs += BATCH_RUNS
+        if not counts[1]:
+            continue
+        rate = counts[0] / counts[1]
+        error = (rate * (1 - rate) / counts[1]) ** 0.5
+        gap = abs(rate - expected)
+        if gap + Z * error <= tolerance:                    # - Clearly Within Tolerance
+            break
+        if gap - Z * error > tolerance:                     # - Clearly Drifted
+            status = "drift"
+            break
+    else:                                                   # - Out of Runs - Judge the Estimate
+        status = "pass" if gap <= tolerance else "drift"
+    return {"id": entry["id"], "status": status, "expected": expected, "actual": rate, "runs": runs}
+
+def check_entry(entry):
+    """Check One Corpus Entry"""
+    if entry["kind"] == "exchange":
+        return check_exchange(entry)
+    return check_duel(entry)
+
+def rebase_entry(entry):
+    """Record an Entry's Current Results As Expected"""
+    entry = dict(entry)
+    if entry["kind"] == "exchange":
+        entry["expected"] = exchange_values(entry)
+    else:
+        counts = duel_rate(entry, 0, REBASE_RUNS, [0, 0])
+        entry["expected"] = round(counts[0] / counts[1], 4)
+    return entry
+
+######################################################################################################
+# CLI Interface
+######################################################################################################
+
+def main(argv=None):
+    """Balance Regression CLI"""
+    parser = argparse.ArgumentParser(description="Check canonical matchups for balance drift.")
+    parser.add_argument("--corpus", default=CORPUS_PATH, help="corpus JSON file")
+    parser.add_argument("--rebase", action="store_true", help="record current results as expected")
+    parser.add_argument("--workers", type=int, default=multiprocessing.cpu_count(), help="worker processes")
+    args = parser.parse_args(argv)
+
+    with open(args.corpus, encoding="utf-8") as f:
+        corpus = json.load(f)
+
+    with multiprocessing.Pool(args.workers) as pool:
+        if args.rebase:
+            corpus["entries"] = pool.map(rebase_entry, corpus["entries"])
+            with open(args.corpus, "w", encoding="utf-8") as f:
+                json.dump(corpus, f, indent=2)
+                f.write("\n")
+            print(f"Rebased {len(corpus['entries'])} entries in {args.corpus}")
+            return
+
+        drifted = 0
+        for result in pool.imap_unordered(check_entry, corpus["entries"]):
+            drifted += result["status"] == "drift"
+            print(json.dumps(result))
+    print(f"{len(corpus['entries']) - drifted} passed, {drifted} drifted", file=sys.stderr)
+    sys.exit(1 if drifted else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,569 @@
+﻿######################################################################################################
+################################### CROWNED DUELS - BATCH RUNNER #####################################
+######################################################################################################
+# Runs duel scenarios through the engines without the interactive menu.
+# Reads scenarios from a JSON or JSONL file (or stdin) and streams one JSONL result per scenario.
+#
+# Scenario Format (One Per Line):
+# {"id": "arya-jaime", "combat_data": "Live Melee vs Melee", "runs": 10000, "seed": 42, "max_rounds": 1000,
+#  "side1_data": [{"name": "Arya", "age": 18, "perks": ["Born Lucky"]}],
+#  "side2_data": [{"name": "Jaime", "age": 35, "perks": ["Blade Specialist T3"]}]}
+#
+# Paired Comparison - Add "compare" With the Fields Variant B Changes:
+# {"id": "live-vs-blunted", "combat_data": "Live Melee vs Melee", "side1_data": [...], "side2_data": [...],
+#  "compare": {"combat_data": "Blunted Melee vs Melee"}, "confidence": 0.95}
+# Both variants play every run from the same seed, and the result reports B - A in side one's win rate
+# with its paired confidence interval.
+#
+# Variance-Reduced Batches - Add "sampling": "stratified":
+# Runs are stratified over side one's first-round initiative dice and played in antithetic pairs
+# (every die d mirrored to its opposite face, 21 - d on a d20), then recombined with stratum weights.
+# Each pass over the 400 strata visits them in a seeded random order, so a batch shorter than a pass
+# (800 runs) covers a random subset of strata rather than the lowest first dice. Use a multiple of 800
+# runs for even allocation. The standard error needs two pairs per stratum, so strata holding fewer
+# are merged with their neighbours (in dice order) until each holds two.
+#
+# Replaying One Run:
+# Every run of a batch is fixed by (master seed, run) - "run" is its position in the batch (0 to runs - 1).
+# Results name the longest run and the first faulted runs, and --replay re-plays any run with the full
+# combat log (stratified runs come in pairs: run 2i is index i, run 2i + 1 its mirror).
+#
+# Memory:
+# A batch keeps running totals only - logs are dropped round by round, no per-run results are kept and
+# only the first FAULT_RUNS_KEPT faulted runs are named - so it runs in constant memory however many runs
+# it plays. memory.py checks this for every engine.
+#
+# Per-Duel Rows:
+# --store DIR keeps one row per duel (run, dice seed, winner, rounds, final morale, worst injury & whether
+# each combatant was taken out) in a columnar store under DIR/<scenario id> - see store.py. Comparisons write DIR/<id>/a
+# & DIR/<id>/b. Not with --checkpoint: a resumed batch would write its last unsaved runs twice.
+#
+# Mechanic Counters:
+# Results total how often each combatant's perks & mechanics fired (Born Lucky, Bloodlust, Berserker,
+# Terrifying Presence, crit successes / fails, Thrown Projectile Specialist T3 free throws & attacks on a
+# target already at its max combatants) plus stalemate rounds, and give each per completed duel.
+#
+# Usage:
+# python batch.py scenarios.jsonl -o results.jsonl
+# cat scenarios.jsonl | python batch.py > results.jsonl
+# python batch.py sweep.jsonl -o results.jsonl --checkpoint sweep.ckpt   (rerun the same command to resume)
+# python batch.py scenarios.jsonl --replay arya-jaime 4127 --seed 42    (seed only if the scenario has none)
+# python batch.py scenarios.jsonl --phases                               (time per engine phase on stderr)
+# python batch.py scenarios.jsonl --profile slow                         (cProfile: slow.pstats & slow.collapsed)
+# python batch.py research.jsonl --store results                         (one row per duel, memory-mappable)
+######################################################################################################
+
+import argparse
+import json
+import os
+import random
+import re
+import statistics
+import sys
+import traceback
+
+import workspace
+from checkpoint import Checkpoint
+from phases import PhaseProfile, format_report
+from profiling import TOP, CallProfile
+from store import ResultsWriter
+
+ENGINE_FAULTS = (IndexError, TypeError)                     # Known Engine List Faults - Counted, Not Raised
+FAULT_RUNS_KEPT = 10                                        # Faulted Runs Named per Batch - For Replay
+
+def same_file(path, other):
+    """Two Paths Name the Same Source File"""
+    return os.path.normcase(os.path.abspath(path)) == os.path.normcase(os.path.abspath(other))
+
+def engine_fault(error):
+    """Known Engine Fault - Raised in workspace.py or the Dice It Called - Anything Else Is a Real Bug"""
+    if not isinstance(error, ENGINE_FAULTS):
+        return False
+    frames = traceback.extract_tb(error.__traceback__)
+    engine = [k for k, frame in enumerate(frames) if same_file(frame.filename, workspace.__file__)]
+    if not engine:
+        return False
+    return all(same_file(frame.filename, random.__file__) for frame in frames[engine[-1] + 1:])  # - e.g. rng.choice([])
+
+######################################################################################################
+# Seeds
+######################################################################################################
+
+def run_seed(seed, index):
+    """Dice Seed for One Run of a Batch"""
+    return seed * 4294967296 + index                        # - Unique Per (Master Seed, Run Index)
+
+def new_seed():
+    """Pick a Master Seed When None Is Given"""
+    return random.randrange(4294967296)
+
+######################################################################################################
+# Batch Statistics
+######################################################################################################
+
+def new_stats():
+    """Empty Batch Statistics"""
+    return {"runs": 0, "side1_wins": 0, "side2_wins": 0, "draws": 0, "errors": 0, "rounds": 0,
+            "longest_run": None, "fault_runs": [], "stalemates": 0, "mechanics": {}}
+
+def add_mechanics(totals, mechanics):
+    """Add One Duel's Per-Combatant Mechanic Counters to the Batch Totals"""
+    for side, combatants in mechanics.items():
+        side_totals = totals.setdefault(side, [])
+        for position, counts in enumerate(combatants):
+            if position == len(side_totals):                # - First Duel - Take the Names Too
+                side_totals.append(dict(counts))
+                continue
+            for mechanic in workspace.MECHANICS:
+                side_totals[position][mechanic] += counts[mechanic]
+
+def mechanics_per_duel(totals, completed):
+    """Mechanic Counters Averaged Over Completed Duels"""
+    return {side: [dict(counts, **{mechanic: counts[mechanic] / completed if completed else 0.0
+                                   for mechanic in workspace.MECHANICS})
+                   for counts in combatants]
+            for side, combatants in totals.items()}
+
+def add_outcome(stats, outcome):
+    """Add One Duel Outcome to Batch Statistics - The Outcome's Run Is Its Position in the Batch"""
+    run = stats["runs"]
+    stats["runs"] += 1
+    if outcome is None:                                     # - Engine Fault
+        stats["errors"] += 1
+        fault_runs = stats.setdefault("fault_runs", [])     # -- Checkpoints From Before Replay Lack It
+        if len(fault_runs) < FAULT_RUNS_KEPT:
+            fault_runs.append(run)
+        return
+    longest = stats.get("longest_run")
+    if longest is None or outcome["rounds"] > longest["rounds"]:
+        stats["longest_run"] = {"run": run, "rounds": outcome["rounds"]}
+    if outcome["winner"] == 1:                              # - Side One
+        stats["side1_wins"] += 1
+    elif outcome["winner"] == 2:                            # - Side Two
+        stats["side2_wins"] += 1
+    else:                                                   # - No Winner
+        stats["draws"] += 1
+    stats["rounds"] += outcome["rounds"]
+    stats["stalemates"] = stats.get("stalemates", 0) + outcome["stalemates"]  # - Older Checkpoints Lack Counters
+    add_mechanics(stats.setdefault("mechanics", {}), outcome["mechanics"])
+
+def summarize(stats):
+    """Batch Statistics With Win Rates & Averages"""
+    summary = dict(stats)
+    completed = stats["runs"] - stats["errors"]             # - Rates Exclude Faulted Runs
+    summary["side1_win_rate"] = stats["side1_wins"] / completed if completed else 0.0
+    summary["side2_win_rate"] = stats["side2_wins"] / completed if completed else 0.0
+    summary["avg_rounds"] = stats["rounds"] / completed if completed else 0.0
+    summary["mechanics_per_duel"] = mechanics_per_duel(stats.get("mechanics", {}), completed)
+    return summary
+
+######################################################################################################
+# Batch Runs
+######################################################################################################
+
+def run_duel(combat_data, side1_data, side2_data, seed, index, max_rounds=1000):
+    """Run One Seeded Duel Quietly - None on Engine Fault"""
+    workspace.rng.seed(run_seed(seed, index))
+    try:
+        return workspace.combat_initialization(combat_data, side1_data, side2_data, False, max_rounds)
+    except ENGINE_FAULTS as error:
+        if not engine_fault(error):
+            raise
+        return None
+
+def run_batch(combat_data, side1_data, side2_data, runs=10000, seed=None, max_rounds=1000, stats=None, progress=None, store=None):
+    """Run a Batch of Duels & Return Win Statistics"""
+    if seed is None:
+        seed = new_seed()
+    if stats is None:
+        stats = new_stats()
+    for index in range(stats["runs"], runs):                # - Resume After the Last Finished Run
+        outcome = run_duel(combat_data, side1_data, side2_data, seed, index, max_rounds)
+        add_outcome(stats, outcome)
+        if store is not None:                               # - Per-Duel Row
+            store.append(index, run_seed(seed, index), outcome)
+        if progress is not None:
+            progress(seed, stats)
+    summary = summarize(stats)
+    summary["seed"] = seed
+    return summary
+
+######################################################################################################
+# Variance Reduction
+######################################################################################################
+
+INITIATIVE_STRATA = [(d1, d2) for d1 in range(1, 21) for d2 in range(1, 21)]  # Equally Likely 2d20 Cells
+
+def strata_order(seed, pass_number):
+    """Seeded Random Order of the Strata for One Pass - Short Batches Sample Strata Evenly"""
+    return random.Random(f"strata-{seed}-{pass_number}").sample(range(len(INITIATIVE_STRATA)), len(INITIATIVE_STRATA))
+
+def stratum_cell(seed, index):
+    """Stratum of a Pair Index"""
+    pass_number, position = divmod(index, len(INITIATIVE_STRATA))
+    return strata_order(seed, pass_number)[position]
+
+class DiceStream(random.Random):
+    """Dice Stream With Forced Opening d20s & Optional Mirrored Faces"""
+    def __init__(self):
+        super().__init__()
+        self.forced = []                                    # d20 Faces Dealt Before the Stream
+        self.mirror = False                                 # Mirror Every Die to Its Opposite Face
+
+    def start(self, seed, forced=(), mirror=False):
+        """Reset for One Run"""
+        self.seed(seed)
+        self.forced = list(forced)
+        self.mirror = mirror
+
+    def randint(self, a, b):
+        """Roll a Die - Forced Faces First, Then the Seeded Stream"""
+        if self.forced and a == 1 and b == 20:
+            value = self.forced.pop(0)
+        else:
+            value = super().randint(a, b)
+        return a + b - value if self.mirror else value
+
+dice = DiceStream()
+
+def run_stream_duel(combat_data, side1_data, side2_data, seed, index, forced, mirror, max_rounds=1000):
+    """Run One Duel on the Forced / Mirrored Dice Stream - None on Engine Fault"""
+    dice.start(run_seed(seed, index), forced, mirror)
+    engine_rng, workspace.rng = workspace.rng, dice
+    try:
+        return workspace.combat_initialization(combat_data, side1_data, side2_data, False, max_rounds)
+    except ENGINE_FAULTS as error:
+        if not engine_fault(error):
+            raise
+        return None
+    finally:
+        workspace.rng = engine_rng
+
+def new_strata_stats():
+    """Empty Stratified Statistics - Per Stratum [Pairs, Side One Sum, Squares, Side Two Sum, Squares]"""
+    stats = new_stats()
+    stats["strata"] = [[0, 0.0, 0.0, 0.0, 0.0] for _ in INITIATIVE_STRATA]
+    return stats
+
+def stratified_estimate(strata, column):
+    """Weighted Win Rate & Standard Error Over Strata - Error None Below Two Pairs"""
+    filled = [stratum for stratum in strata if stratum[0]]
+    if not filled:
+        return 0.0, 0.0
+    groups = []                                             # [Cells, Pairs, Sum, Squares] per Measured Stratum
+    for stratum in filled:                                  # - Collapse Neighbouring Cells Until Two Pairs Each
+        if groups and groups[-1][1] < 2:
+            group = groups[-1]
+        else:
+            group = [0, 0, 0.0, 0.0]
+            groups.append(group)
+        group[0] += 1
+        group[1] += stratum[0]
+        group[2] += stratum[column]
+        group[3] += stratum[column + 1]
+    if len(groups) > 1 and groups[-1][1] < 2:               # - Fold a Short Last Group Into the One Before
+        last = groups.pop()
+        groups[-1] = [total + part for total, part in zip(groups[-1], last)]
+
+    estimate = 0.0
+    variance = 0.0
+    for cells, pairs, total, squares in groups:
+        weight = cells / len(filled)                        # - Equally Likely Cells
+        estimate += weight * total / pairs
+        if pairs > 1:
+            variance += weight * weight * max((squares - total ** 2 / pairs) / (pairs - 1), 0.0) / pairs
+    if groups[0][1] < 2:                                    # - A Single Pair - No Spread to Measure
+        return estimate, None
+    return estimate, variance ** 0.5
+
+def run_stratified(combat_data, side1_data, side2_data, runs=10000, seed=None, max_rounds=1000, stats=None, progress=None, store=None):
+    """Run a Stratified Batch of Antithetic Duel Pairs & Return Weighted Win Rates"""
+    if seed is None:
+        seed = new_seed()
+    if stats is None:
+        stats = new_strata_stats()
+    order = None
+    for index in range(stats["runs"] // 2, runs // 2):     # - One Pair Per Index
+        pass_number, position = divmod(index, len(INITIATIVE_STRATA))
+        if order is None or position == 0:                  # - New Pass (or Resumed Mid-Pass)
+            order = strata_order(seed, pass_number)
+        cell = order[position]
+        forced = INITIATIVE_STRATA[cell]
+        outcome = run_stream_duel(combat_data, side1_data, side2_data, seed, index, forced, False, max_rounds)
+        mirrored = run_stream_duel(combat_data, side1_data, side2_data, seed, index, forced, True, max_rounds)
+        add_outcome(stats, outcome)
+        add_outcome(stats, mirrored)
+        if store is not None:                               # - Per-Duel Rows: Run 2i & Its Mirror
+            store.append(2 * index, run_seed(seed, index), outcome, cell)
+            store.append(2 * index + 1, run_seed(seed, index), mirrored, cell, True)
+        if outcome is not None and mirrored is not None:    # - Mirror Lands in Its Own Cell - Pair Counts Once
+            side1 = ((outcome["winner"] == 1) + (mirrored["winner"] == 1)) / 2
+            side2 = ((outcome["winner"] == 2) + (mirrored["winner"] == 2)) / 2
+            stratum = stats["strata"][cell]
+            stratum[0] += 1
+            stratum[1] += side1
+            stratum[2] += side1 * side1
+            stratum[3] += side2
+            stratum[4] += side2 * side2
+        if progress is not None:
+            progress(seed, stats)
+
+    # Weighted Recombination
+    summary = summarize({key: value for key, value in stats.items() if key != "strata"})
+    summary["side1_win_rate"], summary["side1_std_error"] = stratified_estimate(stats["strata"], 1)
+    summary["side2_win_rate"], summary["side2_std_error"] = stratified_estimate(stats["strata"], 3)
+    summary["strata"] = sum(1 for stratum in stats["strata"] if stratum[0])
+    duels = stats["runs"] - stats["errors"]
+    rate, error = summary["side1_win_rate"], summary["side1_std_error"]
+    summary["variance_reduction"] = rate * (1 - rate) / duels / error ** 2 if duels and error else None
+    summary["seed"] = seed
+    return summary
+
+######################################################################################################
+# Paired Comparisons
+######################################################################################################
+
+def new_paired_stats():
+    """Empty Paired Comparison Statistics"""
+    return {"runs": 0, "a": new_stats(), "b": new_stats(), "pairs": 0, "diff_sum": 0, "diff_sq_sum": 0}
+
+def run_comparison(variant_a, variant_b, runs=10000, seed=None, max_rounds=1000, confidence=0.95, stats=None, progress=None, stores=None):
+    """Run Two Variants on Identical Dice Streams & Compare Side One's Win Rate"""
+    if seed is None:
+        seed = new_seed()
+    if stats is None:
+        stats = new_paired_stats()
+    for index in range(stats["runs"], runs):
+        outcome_a = run_duel(variant_a["combat_data"], variant_a["side1_data"], variant_a["side2_data"], seed, index, max_rounds)
+        outcome_b = run_duel(variant_b["combat_data"], variant_b["side1_data"], variant_b["side2_data"], seed, index, max_rounds)
+        add_outcome(stats["a"], outcome_a)
+        add_outcome(stats["b"], outcome_b)
+        if stores is not None:                              # - Per-Duel Rows, One Store per Variant
+            stores[0].append(index, run_seed(seed, index), outcome_a)
+            stores[1].append(index, run_seed(seed, index), outcome_b)
+        if outcome_a is not None and outcome_b is not None:  # - Pair Only Runs Both Variants Finished
+            diff = (outcome_b["winner"] == 1) - (outcome_a["winner"] == 1)
+            stats["pairs"] += 1
+            stats["diff_sum"] += diff
+            stats["diff_sq_sum"] += diff * diff
+        stats["runs"] += 1
+        if progress is not None:
+            progress(seed, stats)
+
+    # Paired Difference & Confidence Interval
+    summary = {"seed": seed, "runs": stats["runs"], "pairs": stats["pairs"], "a": summarize(stats["a"]), "b": summarize(stats["b"])}
+    pairs = stats["pairs"]
+    mean = stats["diff_sum"] / pairs if pairs else 0.0
+    variance = (stats["diff_sq_sum"] / pairs - mean * mean) * pairs / (pairs - 1) if pairs > 1 else 0.0
+    error = (variance / pairs) ** 0.5 if pairs else 0.0
+    z = statistics.NormalDist().inv_cdf(0.5 + confidence / 2)
+    summary["difference"] = mean                            # - B - A, Side One Win Rate
+    summary["std_error"] = error
+    summary["confidence"] = confidence
+    summary["ci_low"] = mean - z * error
+    summary["ci_high"] = mean + z * error
+
+    # Runs an Unpaired Comparison Would Need for the Same Interval
+    rate_a, rate_b = summary["a"]["side1_win_rate"], summary["b"]["side1_win_rate"]
+    unpaired_variance = rate_a * (1 - rate_a) + rate_b * (1 - rate_b)
+    summary["variance_reduction"] = unpaired_variance / variance if variance else None
+    return summary
+
+######################################################################################################
+# Replay
+######################################################################################################
+
+def replay_run(scenario, run, seed=None, variant="a", verbose=True, max_rounds=None):
+    """Re-Play One Run of a Scenario's Batch on the Same Dice - Engine Faults Are Raised, Not Counted"""
+    seed = scenario.get("seed") if scenario.get("seed") is not None else seed  # - "seed": null Takes --seed, Like run_scenario
+    if seed is None:
+        raise ValueError("Invalid replay: scenario has no seed - pass the seed its batch result reports")
+    if variant not in ("a", "b") or (variant == "b" and "compare" not in scenario):
+        raise ValueError(f"Invalid replay variant: {variant}")
+    fields = {key: scenario[key] for key in ("combat_data", "side1_data", "side2_data")}
+    if variant == "b":                                      # - Paired Comparison's Variant B
+        fields.update(scenario["compare"])
+    if max_rounds is None:
+        max_rounds = int(scenario.get("max_rounds", 1000))
+
+    engine_rng = workspace.rng
+    if scenario.get("sampling") == "stratified" and "compare" not in scenario:
+        index, mirror = divmod(run, 2)                      # - Antithetic Pair: Run 2i, Then Its Mirror
+        dice.start(run_seed(seed, index), INITIATIVE_STRATA[stratum_cell(seed, index)], bool(mirror))
+        workspace.rng = dice
+    else:
+        workspace.rng.seed(run_seed(seed, run))
+    try:
+        return workspace.combat_initialization(fields["combat_data"], fields["side1_data"], fields["side2_data"],
+                                               verbose, max_rounds)
+    finally:
+        workspace.rng = engine_rng
+
+def find_scenario(scenarios, wanted):
+    """Scenario by ID - Or by Position When No ID Matches"""
+    scenarios = list(scenarios)
+    for index, scenario in enumerate(scenarios):
+        if str(scenario.get("id", index)) == wanted:
+            return scenario
+    if wanted.isdigit() and int(wanted) < len(scenarios):
+        return scenarios[int(wanted)]
+    raise ValueError(f"Invalid scenario: {wanted}")
+
+######################################################################################################
+# Scenarios
+######################################################################################################
+
+def read_scenarios(stream):
+    """Yield Scenarios From JSON or JSONL Text"""
+    first = stream.readline()
+    while first and not first.strip():                      # - Skip Leading Blank Lines
+        first = stream.readline()
+    if not first:
+        return
+    try:
+        data = json.loads(first)                            # - JSONL (Or Single-Line JSON)
+    except json.JSONDecodeError:
+        data = json.loads(first + stream.read())            # - Multi-Line JSON Document
+    if isinstance(data, list):
+        yield from data
+    else:
+        yield data
+    for line in stream:                                     # - Remaining JSONL Lines
+        if line.strip():
+            yield json.loads(line)
+
+def store_path(store_root, scenario, index):
+    """Results Store Directory of a Scenario - Named After Its ID"""
+    return os.path.join(store_root, re.sub(r"[^\w.-]", "_", str(scenario.get("id", index))))
+
+def run_scenario(scenario, index, checkpoint=None, store_root=None):
+    """Run One Scenario & Return Its Result Record"""
+    seed, stats, progress = scenario.get("seed"), None, None
+    if checkpoint is not None:                              # - Resume From Checkpoint
+        key = checkpoint.job_key(scenario)
+        result = checkpoint.finished(index, key)
+        if result is not None:                              # -- Already Finished
+            return result
+        partial_seed, stats = checkpoint.partial(index, key)
+        if partial_seed is not None:                        # -- Interrupted Mid-Batch
+            seed = partial_seed
+        progress = lambda batch_seed, batch_stats: checkpoint.progress(index, key, batch_seed, batch_stats)
+
+    result = {"id": scenario.get("id", index), "combat_data": scenario.get("combat_data")}
+    writers = []                                            # Per-Duel Results Stores
+    try:
+        if "compare" in scenario:                           # - Paired Comparison
+            variant_a = {key: scenario[key] for key in ("combat_data", "side1_data", "side2_data")}
+            variant_b = dict(variant_a, **scenario["compare"])
+            result["compare"] = scenario["compare"]
+            if store_root is not None:
+                writers = [ResultsWriter(os.path.join(store_path(store_root, scenario, index), name),
+                                         variant["side1_data"], variant["side2_data"],
+                                         {"id": result["id"], "variant": name, "combat_data": variant["combat_data"]})
+                           for name, variant in (("a", variant_a), ("b", variant_b))]
+            result.update(run_comparison(
+                variant_a,
+                variant_b,
+                runs=int(scenario.get("runs", 10000)),
+                seed=seed,
+                max_rounds=int(scenario.get("max_rounds", 1000)),
+                confidence=float(scenario.get("confidence", 0.95)),
+                stats=stats,
+                progress=progress,
+                stores=writers or None,
+            ))
+        else:                                               # - Single Batch
+            run = run_stratified if scenario.get("sampling") == "stratified" else run_batch
+            if store_root is not None:
+                writers = [ResultsWriter(store_path(store_root, scenario, index), scenario["side1_data"], scenario["side2_data"],
+                                         {"id": result["id"], "combat_data": scenario["combat_data"],
+                                          "sampling": scenario.get("sampling", "plain")})]
+            result.update(run(
+                scenario["combat_data"],
+                scenario["side1_data"],
+                scenario["side2_data"],
+                runs=int(scenario.get("runs", 10000)),
+                seed=seed,
+                max_rounds=int(scenario.get("max_rounds", 1000)),
+                stats=stats,
+                progress=progress,
+                store=writers[0] if writers else None,
+            ))
+    except (KeyError, ValueError) as error:                 # - Bad Scenario - Report & Move On
+        result["error"] = f"{type(error).__name__}: {error}"
+    finally:
+        for writer in writers:
+            writer.close(seed=result.get("seed"))
+
+    if checkpoint is not None:
+        checkpoint.finish(index, key, result)
+    return result
+
+def run_scenarios(stream, out, checkpoint=None, store_root=None):
+    """Stream Results for Every Scenario as JSONL"""
+    for index, scenario in enumerate(read_scenarios(stream)):
+        out.write(json.dumps(run_scenario(scenario, index, checkpoint, store_root)) + "\n")
+        out.flush()                                         # - One Line Per Finished Scenario
+    if checkpoint is not None:                              # - Whole Sweep Done
+        checkpoint.remove()
+
+######################################################################################################
+# CLI Interface
+######################################################################################################
+
+def main(argv=None):
+    """Batch Runner CLI"""
+    parser = argparse.ArgumentParser(description="Run Crowned Stag duel scenarios from JSON/JSONL.")
+    parser.add_argument("scenarios", nargs="?", default="-", help="scenario file (default: stdin)")
+    parser.add_argument("-o", "--output", default="-", help="JSONL results file (default: stdout)")
+    parser.add_argument("--checkpoint", help="save progress here and resume from it if it exists")
+    parser.add_argument("--checkpoint-interval", type=float, default=30.0, help="seconds between checkpoint saves")
+    parser.add_argument("--replay", nargs=2, metavar=("SCENARIO", "RUN"), help="re-play one run (scenario id or position) with the full log")
+    parser.add_argument("--seed", type=int, help="master seed for --replay when the scenario has none")
+    parser.add_argument("--variant", choices=("a", "b"), default="a", help="comparison variant for --replay")
+    parser.add_argument("--phases", action="store_true", help="time the engines by phase & print the table on stderr")
+    parser.add_argument("--profile", metavar="PREFIX", help="run under cProfile & write PREFIX.pstats & PREFIX.collapsed")
+    parser.add_argument("--profile-top", type=int, default=TOP, help="hot functions listed on stderr with --profile")
+    parser.add_argument("--store", metavar="DIR", help="keep one row per duel in a columnar store under DIR/<scenario id>")
+    args = parser.parse_args(argv)
+    if args.store and args.checkpoint:
+        parser.error("--store cannot be combined with --checkpoint")
+
+    if args.replay:
+        stream = sys.stdin if args.scenarios == "-" else open(args.scenarios, encoding="utf-8-sig")
+        try:
+            scenario = find_scenario(read_scenarios(stream), args.replay[0])
+        finally:
+            if stream is not sys.stdin:
+                stream.close()
+        outcome = replay_run(scenario, int(args.replay[1]), args.seed, args.variant)
+        print(json.dumps(outcome))
+        return
+
+    checkpoint = Checkpoint(args.checkpoint, args.checkpoint_interval) if args.checkpoint else None
+
+    stream = sys.stdin if args.scenarios == "-" else open(args.scenarios, encoding="utf-8-sig")
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    profile = PhaseProfile() if args.phases else None
+    try:
+        with CallProfile(args.profile, args.profile_top):   # - No-Op Without --profile
+            if profile is not None:
+                with profile:
+                    run_scenarios(stream, out, checkpoint, args.store)
+                print(format_report(profile.report()), file=sys.stderr)
+            else:
+                run_scenarios(stream, out, checkpoint, args.store)
+    except KeyboardInterrupt:
+        if checkpoint is None:
+            raise
+        checkpoint.save()                                   # - Keep Everything Up to the Last Run
+        print(f"Interrupted - progress saved to {args.checkpoint}, rerun to resume.", file=sys.stderr)
+        sys.exit(130)
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+        if out is not sys.stdout:
+            out.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,174 @@
+﻿######################################################################################################
+################################# CROWNED DUELS - ENGINE BENCHMARKS ##################################
+######################################################################################################
+# Duels per second & per-duel latency for melee_melee, ranged_melee and ranged_ranged, over a grid of
+# team sizes (1v1, 3v3, 10v10, 100v100), loadouts (no perks / heavy perks) and steel vs blunted.
+#
+# - Every cell plays the same seeded duels on every pass & every machine (run_seed(seed, index)),
+#   so two reports differ only in speed - the rounds & faults columns double as a sanity check.
+# - Each cell is played --repeat times and the fastest pass is kept, which filters out
+#   scheduler noise; latency percentiles come from that pass, and every pass's rate is kept in
+#   "pass_rates" as a measure of the noise.
+# - 100v100 cells play a tenth of the duels.
+# - Faulted duels are timed like the rest and counted under "faults".
+#
+# Usage:
+# python bench.py -o bench.json                       (full grid)
+# python bench.py --engine melee_melee --sizes 1 10   (part of the grid)
+######################################################################################################
+
+import argparse
+import json
+import platform
+import sys
+import time
+
+import workspace
+from batch import ENGINE_FAULTS, engine_fault, run_seed
+
+ENGINES = {                                                 # Engine, Side One Ranged, Side Two Ranged
+    "melee_melee": (workspace.melee_melee, False, False),
+    "ranged_melee": (workspace.ranged_melee, True, False),
+    "ranged_ranged": (workspace.ranged_ranged, True, True),
+}
+TEAM_SIZES = (1, 3, 10, 100)
+LOADOUTS = ("none", "heavy")
+COMBAT_TYPES = ("steel", "blunted")
+
+HEAVY_MELEE = ["Blade Specialist T3", "Duelist T3", "Shield Specialist T3", "Steel Tempest T3", "Sworn Sword T2",
+               "Born Lucky", "Bloodlust", "Berserker", "Battlefield Champion T3", "Terrifying Presence T2",
+               "Timeless Quality", "Ageing With Grace"]
+HEAVY_RANGED = ["Bow Specialist T3", "Marksman T3", "Thrown Projectile Specialist T3", "Shield Specialist T3",
+                "Born Lucky", "Bloodlust", "Battlefield Champion T3", "Terrifying Presence T2", "Timeless Quality"]
+
+######################################################################################################
+# Cells
+######################################################################################################
+
+def team(prefix, size, ranged, loadout):
+    """Side Data for One Benchmark Side"""
+    if loadout == "heavy":
+        perks = HEAVY_RANGED if ranged else HEAVY_MELEE
+        items = ["Valyrian Steel Sword", "Valyrian Steel Armor"]
+    else:
+        perks, items = [], []
+    return [{"name": f"{prefix}{i + 1}", "age": 30, "perks": perks, "items": items} for i in range(size)]
+
+def cell_duels(duels, size):
+    """Duels a Cell Plays - Big Teams Play Fewer"""
+    return max(10, duels // 10) if size >= 100 else duels
+
+def percentile(ordered, fraction):
+    """Nearest-Rank Percentile of a Sorted List"""
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+def bench_cell(engine, size, loadout, ct, duels=200, seed=1, repeat=3, max_rounds=1000):
+    """Time One Grid Cell - Fastest of Several Passes Over the Same Seeded Duels"""
+    fight, ranged1, ranged2 = ENGINES[engine]
+    side1 = team("A", size, ranged1, loadout)
+    side2 = team("B", size, ranged2, loadout)
+    duels = cell_duels(duels, size)
+
+    best = None
+    pass_rates = []
+    for _ in range(repeat):
+        latencies = []
+        faults = 0
+        rounds = 0
+        for index in range(duels):
+            workspace.rng.seed(run_seed(seed, index))
+            start = time.perf_counter()
+            try:
+                rounds += fight(side1, side2, ct, False, max_rounds)["rounds"]
+            except ENGINE_FAULTS as error:                  # - Timed Like Any Other Duel
+                if not engine_fault(error):
+                    raise
+                faults += 1
+            latencies.append(time.perf_counter() - start)
+        pass_rates.append(duels / sum(latencies) if sum(latencies) else 0.0)
+        if best is None or sum(latencies) < sum(best[0]):
+            best = (latencies, faults, rounds)
+
+    latencies, faults, rounds = best
+    ordered = sorted(latencies)
+    total = sum(latencies)
+    return {
+        "engine": engine,
+        "team_size": size,
+        "loadout": loadout,
+        "ct": ct,
+        "duels": duels,
+        "faults": faults,
+        "avg_rounds": rounds / (duels - faults) if duels > faults else 0.0,
+        "duels_per_sec": duels / total if total else 0.0,
+        "pass_rates": pass_rates,
+        "latency_ms": {
+            "mean": total / duels * 1000,
+            "p50": percentile(ordered, 0.50) * 1000,
+            "p95": percentile(ordered, 0.95) * 1000,
+            "max": ordered[-1] * 1000,
+        },
+    }
+
+######################################################################################################
+# Suite
+######################################################################################################
+
+def run_suite(engines=None, sizes=TEAM_SIZES, loadouts=LOADOUTS, cts=COMBAT_TYPES, duels=200, seed=1, repeat=3, progress=None):
+    """Benchmark Every Cell of the Grid"""
+    cells = []
+    for engine in engines or list(ENGINES):
+        for size in sizes:
+            for loadout in loadouts:
+                for ct in cts:
+                    cell = bench_cell(engine, size, loadout, ct, duels, seed, repeat)
+                    cells.append(cell)
+                    if progress is not None:
+                        progress(cell)
+    return {
+        "seed": seed,
+        "duels": duels,
+        "repeat": repeat,
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "cells": cells,
+    }
+
+def cell_key(cell):
+    """Grid Position of a Cell - For Matching Reports"""
+    return f"{cell['engine']}/{cell['team_size']}v{cell['team_size']}/{cell['loadout']}/{cell['ct']}"
+
+######################################################################################################
+# CLI Interface
+######################################################################################################
+
+def main(argv=None):
+    """Engine Benchmark CLI"""
+    parser = argparse.ArgumentParser(description="Duels per second & latency for the combat engines.")
+    parser.add_argument("-o", "--output", default="-", help="JSON report file (default: stdout)")
+    parser.add_argument("--engine", action="append", choices=list(ENGINES), help="engine to time (repeatable, default: all)")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(TEAM_SIZES), help="team sizes per side")
+    parser.add_argument("--loadout", action="append", choices=LOADOUTS, help="loadout (repeatable, default: both)")
+    parser.add_argument("--ct", action="append", choices=COMBAT_TYPES, help="combat type (repeatable, default: both)")
+    parser.add_argument("--duels", type=int, default=200, help="duels per cell (100v100 cells play a tenth)")
+    parser.add_argument("--seed", type=int, default=1, help="master seed")
+    parser.add_argument("--repeat", type=int, default=3, help="passes per cell - the fastest is kept")
+    args = parser.parse_args(argv)
+
+    def progress(cell):
+        print(f"{cell_key(cell):40} {cell['duels_per_sec']:10.1f} duels/s  p50 {cell['latency_ms']['p50']:8.3f} ms",
+              file=sys.stderr)
+
+    report = run_suite(args.engine, args.sizes, args.loadout or LOADOUTS, args.ct or COMBAT_TYPES,
+                       args.duels, args.seed, args.repeat, progress)
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        json.dump(report, out, indent=2)
+        out.write("\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+if __name__ == "__main__":
+    main()
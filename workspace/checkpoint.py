@@ -0,0 +1,78 @@
+﻿######################################################################################################
+################################### CROWNED DUELS - CHECKPOINTS ######################################
+######################################################################################################
+# Resumable progress for long batch runs and sweeps.
+# Finished jobs keep their result; the job in progress keeps its seed and partial statistics.
+# Runs are seeded per (master seed, run index), so the next run index is the dice stream position
+# and a resumed job produces exactly the aggregates of an uninterrupted one.
+######################################################################################################
+
+import copy
+import hashlib
+import json
+import os
+import time
+
+class Checkpoint:
+    """Resumable Progress Saved to a JSON File"""
+    def __init__(self, path, interval=30.0):
+
+        self.path = path                                    # Checkpoint File
+        self.interval = interval                            # Seconds Between Periodic Saves
+        self.state = {"done": {}, "partial": None}          # Finished Results & Job In Progress
+        self.last_save = time.monotonic()                   # Last Save Time
+
+        if os.path.exists(path):                            # Resume Previous Progress
+            with open(path, encoding="utf-8") as f:
+                self.state = json.load(f)
+
+    @staticmethod
+    def job_key(job):
+        """Fingerprint of a Job Definition"""
+        return hashlib.sha1(json.dumps(job, sort_keys=True).encode("utf-8")).hexdigest()
+
+    def _check(self, index, key, entry):
+        """Refuse to Resume Against Different Jobs"""
+        if entry["key"] != key:
+            raise ValueError(f"Checkpoint {self.path} does not match job {index}")
+
+    def finished(self, index, key):
+        """Stored Result for a Finished Job - None if Not Finished"""
+        entry = self.state["done"].get(str(index))
+        if entry is None:
+            return None
+        self._check(index, key, entry)
+        return entry["result"]
+
+    def partial(self, index, key):
+        """Stored (Seed, Statistics) for a Job In Progress - (None, None) if Not Started"""
+        entry = self.state["partial"]
+        if entry is None or entry["index"] != index:
+            return None, None
+        self._check(index, key, entry)
+        return entry["seed"], copy.deepcopy(entry["stats"])
+
+    def progress(self, index, key, seed, stats):
+        """Record Progress After a Run - Saves Periodically"""
+        self.state["partial"] = {"index": index, "key": key, "seed": seed, "stats": stats}  # - Live Totals - save() Writes Them Whole
+        if time.monotonic() - self.last_save >= self.interval:
+            self.save()
+
+    def finish(self, index, key, result):
+        """Record a Finished Job & Save"""
+        self.state["done"][str(index)] = {"key": key, "result": result}
+        self.state["partial"] = None
+        self.save()
+
+    def save(self):
+        """Write the Checkpoint Atomically"""
+        temp_path = self.path + ".tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self.state, f)
+        os.replace(temp_path, self.path)                    # - Never Leave a Half-Written File
+        self.last_save = time.monotonic()
+
+    def remove(self):
+        """Delete the Checkpoint Once the Whole Job Is Done"""
+        if os.path.exists(self.path):
+            os.remove(self.path)
@@ -0,0 +1,156 @@
+﻿######################################################################################################
+################################### CROWNED DUELS - MEMORY BENCHMARK #################################
+######################################################################################################
+# Peak & steady-state allocation of long batches, one per engine, and a check that a batch runs in
+# constant memory, whatever its run count.
+#
+# - Batches go through batch.run_batch, which keeps only running totals: no logs outlive their round,
+#   no per-run results are kept, and only the first few faulted runs are named.
+# - The interpreter's live block count (sys.getallocatedblocks) is sampled at evenly spaced runs, after
+#   a gc pass so cyclic garbage waiting for the collector is not counted, and a line is fitted to the
+#   samples past the warm-up - "block_growth" is that line's rise over the batch.
+# - At each sample the next WINDOW runs are played under tracemalloc: "peak_bytes" is the most any
+#   window held at once, "retained_bytes" the most a window left alive once it was over (the batch
+#   totals it updated - a leak shows up here with the line that allocated it, via tracemalloc).
+# - tracemalloc slows the engines down by one to two orders of magnitude, so only the windows are
+#   traced - the rest of the batch runs at full speed.
+# - Samples are written into preallocated arrays, so measuring adds no live blocks of its own.
+# - A batch that keeps anything per run fails: even one object a run is 100k blocks by the end of a
+#   100k batch, far over BLOCK_LIMIT.
+#
+# Usage:
+# python memory.py                                    (100k duels per engine - exits 1 on growth)
+# python memory.py --engine melee_melee --runs 20000
+######################################################################################################
+
+import argparse
+import array
+import gc
+import json
+import sys
+import tracemalloc
+
+from batch import run_batch
+from bench import ENGINES, team
+
+COMBAT_DATA = {                                             # Engine: Batch Runner Combat Type
+    "melee_melee": "Live Melee vs Melee",
+    "ranged_melee": "Live Ranged vs Melee",
+    "ranged_ranged": "Live Ranged vs Ranged",
+}
+SAMPLES = 10                                                # Memory Samples per Batch
+WINDOW = 50                                                 # Runs Traced After Each Sample
+WARMUP = 0.1                                                # Share of the Batch Left Out of the Fit
+BLOCK_LIMIT = 1000                                          # Live Blocks a Batch May Gain Before It Fails
+
+######################################################################################################
+# Measurement
+######################################################################################################
+
+def fitted_growth(samples):
+    """Rise of the Least-Squares Line Through (Run, Level) Samples, Over Their Span"""
+    if len(samples) < 2:
+        return 0.0
+    mean_run = sum(run for run, _ in samples) / len(samples)
+    mean_level = sum(level for _, level in samples) / len(samples)
+    spread = sum((run - mean_run) ** 2 for run, _ in samples)
+    if not spread:
+        return 0.0
+    slope = sum((run - mean_run) * (level - mean_level) for run, level in samples) / spread
+    return slope * (samples[-1][0] - samples[0][0])
+
+def memory_profile(engine, runs=100000, size=3, loadout="heavy", seed=1):
+    """Run One Engine's Batch - Live Block Samples Throughout, tracemalloc Windows at Each Sample"""
+    _, ranged1, ranged2 = ENGINES[engine]
+    side1 = team("A", size, ranged1, loadout)
+    side2 = team("B", size, ranged2, loadout)
+    every = max(WINDOW + 1, runs // SAMPLES)
+    slots = runs // every
+    sample_runs = array.array("q", [0] * slots)             # Run, Live Blocks & Window Bytes per Sample
+    sample_blocks = array.array("q", [0] * slots)
+    window_peaks = array.array("q", [0] * slots)
+    window_retained = array.array("q", [0] * slots)
+    taken = array.array("q", [0])                           # Samples Taken So Far
+
+    def progress(batch_seed, stats):
+        index = taken[0] - 1
+        if index >= 0 and stats["runs"] == sample_runs[index] + WINDOW:  # - Close the Traced Window
+            gc.collect()
+            window_retained[index], window_peaks[index] = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+        if stats["runs"] % every == 0 and taken[0] < slots:
+            gc.collect()
+            index = taken[0]
+            sample_runs[index] = stats["runs"]
+            sample_blocks[index] = sys.getallocatedblocks()
+            taken[0] += 1
+            if stats["runs"] + WINDOW <= runs:              # - Open the Next One
+                tracemalloc.start()
+
+    try:
+        summary = run_batch(COMBAT_DATA[engine], side1, side2, runs, seed, progress=progress)
+    finally:
+        if tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    steady = [(run, blocks) for run, blocks in zip(sample_runs, sample_blocks) if run > runs * WARMUP]
+    growth = fitted_growth(steady)
+    return {
+        "engine": engine,
+        "team_size": size,
+        "loadout": loadout,
+        "runs": runs,
+        "errors": summary["errors"],
+        "peak_bytes": max(window_peaks, default=0),
+        "retained_bytes": max(window_retained, default=0),
+        "block_growth": growth,
+        "samples": steady,
+        "status": "pass" if growth <= BLOCK_LIMIT else "growth",
+    }
+
+def peak_bytes(engine, duels=WINDOW, size=3, loadout="heavy", seed=1):
+    """Most Memory a Short Seeded Batch Holds at Once, Under tracemalloc"""
+    _, ranged1, ranged2 = ENGINES[engine]
+    side1 = team("A", size, ranged1, loadout)
+    side2 = team("B", size, ranged2, loadout)
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run_batch(COMBAT_DATA[engine], side1, side2, duels, seed)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+######################################################################################################
+# CLI Interface
+######################################################################################################
+
+def main(argv=None):
+    """Memory Benchmark CLI"""
+    parser = argparse.ArgumentParser(description="Peak & steady-state memory of long batches, per engine.")
+    parser.add_argument("-o", "--output", default="-", help="JSON report file (default: stdout)")
+    parser.add_argument("--engine", action="append", choices=list(ENGINES), help="engine to measure (repeatable, default: all)")
+    parser.add_argument("--runs", type=int, default=100000, help="duels per batch")
+    parser.add_argument("--size", type=int, default=3, help="team size per side")
+    parser.add_argument("--loadout", choices=("none", "heavy"), default="heavy", help="loadout for both sides")
+    parser.add_argument("--seed", type=int, default=1, help="master seed")
+    args = parser.parse_args(argv)
+
+    reports = []
+    for engine in args.engine or list(ENGINES):
+        report = memory_profile(engine, args.runs, args.size, args.loadout, args.seed)
+        reports.append(report)
+        print(f"{engine:14} peak {report['peak_bytes'] / 1024:8.1f} KiB  retained {report['retained_bytes']:7} B  "
+              f"block growth {report['block_growth']:8.1f}  {report['status']}", file=sys.stderr)
+
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        json.dump({"block_limit": BLOCK_LIMIT, "batches": reports}, out, indent=2)
+        out.write("\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    sys.exit(1 if any(report["status"] != "pass" for report in reports) else 0)
+
+if __name__ == "__main__":
+    main()
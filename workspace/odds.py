@@ -0,0 +1,179 @@
+﻿######################################################################################################
+################################### CROWNED DUELS - EXCHANGE ODDS ####################################
+######################################################################################################
+# Exact probabilities for a single exchange between two stat lines - no sampling.
+# Distributions are dicts of outcome: Fraction and follow the engines' rules:
+#
+# - Initiative: 2d20 + speed, Born Lucky re-rolls a pair holding a 1 (once per duel).
+#   Side one only strikes on a strictly higher total.
+# - Crits: a 1 is a crit fail, a 20 (or a 19 with Duelist T3) a crit success, a 1 and a 20 cancel.
+# - Damage: 3d5 + attack - defense, doubled by Steel Tempest T3, then raised to a minimum of 1.
+#   Timeless Quality weapons halve defense (rounded up), Timeless Quality armor doubles it.
+# - Ranged: side one's shot lands on 2d20 + speed of at least 30, side two's only above 30
+#   (Ranged vs Ranged - the engine checks side two strictly).
+#
+# Usage: python odds.py '{"name": "Arya", "age": 18}' '{"name": "Jaime", "age": 35}' [--ranged]
+######################################################################################################
+
+import argparse
+import json
+from fractions import Fraction
+from itertools import product
+
+import workspace
+
+######################################################################################################
+# Dice
+######################################################################################################
+
+D20_PAIRS = list(product(range(1, 21), repeat=2))         # Every 2d20 Roll, Equally Likely
+
+def initiative_rolls(born_lucky=False):
+    """Distribution of the Final 2d20 Pair - Born Lucky Re-Rolls a Pair Holding a 1"""
+    chance = Fraction(1, len(D20_PAIRS))
+    rolls = {}
+    for pair in D20_PAIRS:
+        if born_lucky and 1 in pair:                        # - Re-Roll Spreads Over Every Pair
+            for reroll in D20_PAIRS:
+                rolls[reroll] = rolls.get(reroll, 0) + chance * chance
+        else:
+            rolls[pair] = rolls.get(pair, 0) + chance
+    return rolls
+
+def three_d5():
+    """Distribution of 3d5"""
+    sums = {}
+    for dice in product(range(1, 6), repeat=3):
+        sums[sum(dice)] = sums.get(sum(dice), 0) + Fraction(1, 125)
+    return sums
+
+######################################################################################################
+# Initiative & Crits
+######################################################################################################
+
+def initiative_distribution(speed, born_lucky=False):
+    """Distribution of 2d20 + Speed"""
+    totals = {}
+    for pair, chance in initiative_rolls(born_lucky).items():
+        totals[sum(pair) + speed] = totals.get(sum(pair) + speed, 0) + chance
+    return totals
+
+def initiative_odds(speed1, speed2, born_lucky1=False, born_lucky2=False):
+    """Chance Side One Rolls Higher, Side Two Rolls Higher, or They Tie"""
+    odds = {"side1": Fraction(0), "side2": Fraction(0), "tie": Fraction(0)}
+    totals2 = initiative_distribution(speed2, born_lucky2)
+    for total1, chance1 in initiative_distribution(speed1, born_lucky1).items():
+        for total2, chance2 in totals2.items():
+            key = "side1" if total1 > total2 else "side2" if total2 > total1 else "tie"
+            odds[key] += chance1 * chance2
+    return odds
+
+def crit_flags(pair, duelist=False):
+    """(Crit Fail, Crit Success) Flags an Initiative Pair Sets"""
+    crit_fail = 1 in pair
+    crit_success = 20 in pair or (duelist and 19 in pair)
+    if 1 in pair and 20 in pair:                            # - A 1 & a 20 Cancel
+        return False, False
+    return crit_fail, crit_success
+
+def crit_odds(duelist=False, born_lucky=False):
+    """Chance of Each Crit Flag - Fail & Success Can Both Be Set (1 & 19 With Duelist T3)"""
+    odds = {"crit_fail": Fraction(0), "crit_success": Fraction(0), "both": Fraction(0)}
+    for pair, chance in initiative_rolls(born_lucky).items():
+        crit_fail, crit_success = crit_flags(pair, duelist)
+        odds["crit_fail"] += chance * crit_fail
+        odds["crit_success"] += chance * crit_success
+        odds["both"] += chance * (crit_fail and crit_success)
+    return odds
+
+######################################################################################################
+# Damage & Ranged Hits
+######################################################################################################
+
+def effective_defense(defense, timeless_weapon=False, timeless_armor=False):
+    """Defense an Attack Rolls Against - Timeless Quality Checks"""
+    if timeless_weapon and timeless_armor:                  # - Cancel Out
+        return defense
+    if timeless_armor:
+        return defense * 2
+    if timeless_weapon:
+        return (defense + 1) // 2
+    return defense
+
+def damage_distribution(attack, defense, steel_tempest=False):
+    """Distribution of Morale Damage From One Attack"""
+    damage = {}
+    for roll, chance in three_d5().items():
+        hit = roll + attack - defense
+        if steel_tempest:                                   # - Doubled Before the Minimum
+            hit *= 2
+        hit = max(hit, 1)
+        damage[hit] = damage.get(hit, 0) + chance
+    return damage
+
+def ranged_hit_chance(speed, born_lucky=False, threshold=30, strict=False):
+    """Chance 2d20 + Speed Reaches the Ranged Threshold"""
+    return sum((chance for total, chance in initiative_distribution(speed, born_lucky).items()
+                if total > threshold or (total == threshold and not strict)), Fraction(0))
+
+def expected(distribution):
+    """Mean of a Distribution"""
+    return sum(value * chance for value, chance in distribution.items())
+
+######################################################################################################
+# Exchange Odds
+######################################################################################################
+
+def timeless(character, items):
+    """Timeless Quality Perk With One of the Given Items"""
+    return "Timeless Quality" in character.perks and any(item in character.items for item in items)
+
+def exchange_odds(character1, character2, ranged=False):
+    """Exact Odds for One Exchange Between Two Initialized Characters"""
+    lucky1 = "Born Lucky" in character1.perks and character1.you_lucky == 0
+    lucky2 = "Born Lucky" in character2.perks and character2.you_lucky == 0
+    odds = {
+        "initiative": initiative_odds(character1.current_speed, character2.current_speed, lucky1, lucky2),
+        "side1_crits": crit_odds("Duelist T3" in character1.perks, lucky1),
+        "side2_crits": crit_odds("Duelist T3" in character2.perks, lucky2),
+    }
+    for key, attacker, defender in (("side1", character1, character2), ("side2", character2, character1)):
+        defense = effective_defense(defender.current_defense,
+                                    timeless(attacker, ("Valyrian Steel Sword", "Qohorik Steel Weapon")),
+                                    timeless(defender, ("Valyrian Steel Armor", "Qohorik Armor")))
+        damage = damage_distribution(attacker.current_attack, defense, "Steel Tempest T3" in attacker.perks)
+        odds[f"{key}_damage"] = damage
+        odds[f"{key}_expected_damage"] = expected(damage)
+    if ranged:
+        odds["side1_ranged_hit"] = ranged_hit_chance(character1.current_speed, lucky1)
+        odds["side2_ranged_hit"] = ranged_hit_chance(character2.current_speed, lucky2, strict=True)
+    return odds
+
+def as_floats(odds):
+    """Odds With Fractions as Floats - For Printing"""
+    if isinstance(odds, dict):
+        return {key: as_floats(value) for key, value in odds.items()}
+    return float(odds)
+
+######################################################################################################
+# CLI Interface
+######################################################################################################
+
+def main(argv=None):
+    """Exchange Odds CLI"""
+    parser = argparse.ArgumentParser(description="Exact odds for one exchange between two characters.")
+    parser.add_argument("side1", help="side one character as JSON")
+    parser.add_argument("side2", help="side two character as JSON")
+    parser.add_argument("--ranged", action="store_true", help="use ranged stats & add ranged hit chances")
+    args = parser.parse_args(argv)
+
+    characters = workspace.side_initialization([json.loads(args.side1), json.loads(args.side2)])
+    for character in characters:
+        if args.ranged:
+            workspace.ranged_initialization(character)
+        else:
+            workspace.melee_initialization(character)
+    print(json.dumps(as_floats(exchange_odds(*characters, ranged=args.ranged)), indent=2))
+
+if __name__ == "__main__":
+    main()
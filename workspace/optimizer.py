@@ -0,0 +1,275 @@
+﻿######################################################################################################
+################################## CROWNED DUELS - LOADOUT OPTIMIZER #################################
+######################################################################################################
+# Searches the PERK_STAT_MODIFIERS perk trees and the item tiers for the loadout that maximizes a
+# character's win probability against an opponent (or a pool of opponents).
+#
+# - A tier-N perk costs N perk points (single perks cost 1), an item costs its tier in item points.
+# - Only loadouts that cannot fit another perk / item are searched - every modifier is a bonus.
+# - Loadouts the engines cannot tell apart (same initialized stats, same special perks) are raced once,
+#   and loadouts beaten on every stat by one with the same special perks are dropped up front.
+# - Every candidate plays the same seeded runs (common random numbers), so candidates are compared
+#   on identical dice streams and run by run.
+# - Candidates race in rounds: after each round, any candidate whose paired win-rate difference to
+#   the leader is significantly negative is dropped.
+#
+# Config Format (JSON):
+# {"combat_data": "Live Melee vs Melee", "side": 1, "perk_budget": 6, "item_budget": 4, "seed": 1,
+#  "character": {"name": "Arya", "age": 18},
+#  "opponents": [[{"name": "Jaime", "age": 35, "perks": ["Blade Specialist T3"]}]]}
+#
+# Usage: python optimizer.py config.json --workers 8
+######################################################################################################
+
+import argparse
+import json
+import multiprocessing
+import statistics
+import sys
+
+import workspace
+from batch import new_seed, run_duel
+
+######################################################################################################
+# Items
+######################################################################################################
+
+ITEM_TIERS = {                                              # Mirrors melee_ / ranged_initialization
+    "weapon": ["Castle-Forged Weapon", "Masterwork Weapon", "Qohorik Steel Weapon", "Valyrian Steel Weapon"],
+    "armor":  ["Castle-Forged Plate", "Ornate Platemail", "Qohorik Armor", "Valyrian Steel Armor"],
+    "bow":    ["Fine-Strung Bow", "Goldenheart Bow", "Dragonbone Bow"],
+}
+
+SPECIAL_PERKS = {                                           # Perks the Engines Check by Name
+    "Born Lucky", "Bloodlust", "Berserker", "Duelist T3", "Steel Tempest T3", "Shield Specialist T3",
+    "Sworn Sword T1", "Sworn Sword T2", "Battlefield Champion T3", "Marksman T3",
+    "Thrown Projectile Specialist T2", "Thrown Projectile Specialist T3",
+}
+
+######################################################################################################
+# Search Space
+######################################################################################################
+
+def combat_context(combat_data, side):
+    """Stat Contexts a Side Fights In"""
+    if "Melee vs Melee" in combat_data:
+        return {"melee", "all"}
+    if "Ranged vs Ranged" in combat_data:
+        return {"ranged", "all"}
+    if "Ranged vs Melee" in combat_data:
+        return {"ranged", "melee", "all"} if side == 1 else {"melee", "all"}
+    raise ValueError(f"Invalid combat type: {combat_data}")
+
+def perk_trees(context):
+    """Perk Trees With Modifiers in Context - Tree Name: [(Cost, Perk)]"""
+    trees = {}
+    for perk, modifiers in workspace.PERK_STAT_MODIFIERS.items():
+        if not context & modifiers.keys():                  # - No Effect In This Duel
+            continue
+        tree, _, tier = perk.rpartition(" T")
+        if tree and tier.isdigit():                         # - Tiered Perk
+            trees.setdefault(tree, []).append((int(tier), perk))
+        else:                                               # - Single Perk
+            trees[perk] = [(1, perk)]
+    return trees
+
+def item_slots(context):
+    """Item Slots Used in Context - Slot Name: [(Cost, Item)]"""
+    slots = ["armor"]
+    if "melee" in context:
+        slots.append("weapon")
+    if "ranged" in context:
+        slots.append("bow")
+    return {slot: [(tier + 1, item) for tier, item in enumerate(ITEM_TIERS[slot])] for slot in slots}
+
+def maximal_picks(groups, budget):
+    """Every Pick of At Most One Option Per Group That Leaves No Room for Another"""
+    names = list(groups)
+    picks = []
+
+    def extend(position, remaining, chosen):
+        if position == len(names):
+            cheapest = [min(cost for cost, _ in groups[name]) for name in names if not any(p in chosen for _, p in groups[name])]
+            if not cheapest or min(cheapest) > remaining:   # - Nothing Else Fits
+                picks.append(list(chosen))
+            return
+        extend(position + 1, remaining, chosen)             # - Skip This Group
+        for cost, option in groups[names[position]]:
+            if cost <= remaining:
+                chosen.append(option)
+                extend(position + 1, remaining - cost, chosen)
+                chosen.pop()
+
+    extend(0, budget, [])
+    return picks
+
+def initialized_stats(spec, context):
+    """Stat Line(s) the Engines Start a Character With"""
+    character = workspace.side_initialization([spec])[0]
+    if "ranged" in context and "melee" in context:          # - Ranged Opening, Then Melee
+        initializations = [workspace.ranged_initialization, workspace.mixed_initialization]
+    elif "ranged" in context:
+        initializations = [workspace.ranged_initialization]
+    else:
+        initializations = [workspace.melee_initialization]
+    stat_lines = ()
+    for initialization in initializations:
+        initialization(character)
+        stat_lines += (character.current_speed, character.current_attack, character.current_defense,
+                       character.current_morale, character.max_combatants, character.max_mixed_rounds,
+                       character.major_injury_buff)
+    return stat_lines
+
+def loadouts(character, combat_data, side, perk_budget, item_budget):
+    """Candidate Character Specs for Every Maximal Perk & Item Pick - Pruned"""
+    context = combat_context(combat_data, side)
+    perk_picks = maximal_picks(perk_trees(context), perk_budget)
+    item_picks = maximal_picks(item_slots(context), item_budget)
+
+    # Group Engine-Identical Loadouts
+    groups = {}
+    for perks in perk_picks:
+        specials = frozenset(perk for perk in perks if perk in SPECIAL_PERKS)
+        for items in item_picks:
+            spec = dict(character)
+            spec["perks"] = list(character.get("perks", [])) + perks
+            spec["items"] = list(character.get("items", [])) + items
+            groups.setdefault(specials, {}).setdefault(initialized_stats(spec, context), spec)
+
+    # Keep the Pareto Front of Each Special-Perk Group
+    candidates = []
+    for group in groups.values():
+        front = []
+        for stats in sorted(group, key=sum, reverse=True):  # - Dominators Come First
+            if not any(all(a >= b for a, b in zip(kept, stats)) for kept in front):
+                front.append(stats)
+        candidates.extend(group[stats] for stats in front)
+    return candidates
+
+######################################################################################################
+# Evaluation
+######################################################################################################
+
+def evaluate_runs(task):
+    """Play Runs [start, stop) for One Candidate - Returns (Win Bits, Valid Bits)"""
+    combat_data, side, spec, opponents, seed, start, stop, max_rounds = task
+    wins = 0
+    valid = 0
+    for index in range(start, stop):
+        opponent = opponents[index % len(opponents)]        # - Same Opponent Per Run for Every Candidate
+        side1, side2 = ([spec], opponent) if side == 1 else (opponent, [spec])
+        outcome = run_duel(combat_data, side1, side2, seed, index, max_rounds)
+        if outcome is None:                                 # - Engine Fault - Run Excluded
+            continue
+        bit = 1 << (index - start)
+        valid |= bit
+        if outcome["winner"] == side:
+            wins |= bit
+    return wins, valid
+
+def paired_difference(wins_a, valid_a, wins_b, valid_b):
+    """Paired Win-Rate Difference (A - B) & Its Standard Error Over Shared Runs"""
+    shared = valid_a & valid_b
+    n = shared.bit_count()
+    if n < 2:
+        return 0.0, float("inf")
+    diff = ((wins_a & shared).bit_count() - (wins_b & shared).bit_count()) / n
+    discordant = ((wins_a ^ wins_b) & shared).bit_count() / n  # - Mean of Squared Differences
+    variance = max(discordant - diff * diff, 0.0) * n / (n - 1)
+    return diff, (variance / n) ** 0.5
+
+def win_rate(wins, valid):
+    """Win Rate Over Valid Runs"""
+    n = valid.bit_count()
+    return (wins & valid).bit_count() / n if n else 0.0
+
+######################################################################################################
+# Racing
+######################################################################################################
+
+def optimize(combat_data, character, opponents, side=1, perk_budget=6, item_budget=4, seed=None,
+             batch_runs=200, max_runs=10000, confidence=0.99, max_rounds=1000, workers=1):
+    """Race Every Candidate Loadout & Return Them Ranked"""
+    if seed is None:
+        seed = new_seed()
+    candidates = loadouts(character, combat_data, side, perk_budget, item_budget)
+    z = statistics.NormalDist().inv_cdf(confidence)
+    wins = [0] * len(candidates)
+    valid = [0] * len(candidates)
+    alive = list(range(len(candidates)))
+    runs = [0] * len(candidates)
+
+    pool = multiprocessing.Pool(workers) if workers > 1 else None
+    try:
+        done = 0
+        while done < max_runs and len(alive) > 1:
+            stop = min(done + batch_runs, max_runs)
+            tasks = [(combat_data, side, candidates[c], opponents, seed, done, stop, max_rounds) for c in alive]
+            chunks = pool.map(evaluate_runs, tasks) if pool else map(evaluate_runs, tasks)
+            for c, (chunk_wins, chunk_valid) in zip(alive, chunks):
+                wins[c] |= chunk_wins << done
+                valid[c] |= chunk_valid << done
+                runs[c] = stop
+            done = stop
+
+            # Drop Candidates Significantly Behind the Leader
+            leader = max(alive, key=lambda c: win_rate(wins[c], valid[c]))
+            survivors = []
+            for c in alive:
+                diff, error = paired_difference(wins[c], valid[c], wins[leader], valid[leader])
+                if c == leader or diff + z * error >= 0:
+                    survivors.append(c)
+            alive = survivors
+    finally:
+        if pool:
+            pool.close()
+            pool.join()
+
+    ranked = sorted(range(len(candidates)), key=lambda c: (c in alive, runs[c], win_rate(wins[c], valid[c])), reverse=True)
+    return {
+        "seed": seed,
+        "candidates": len(candidates),
+        "results": [{
+            "perks": candidates[c]["perks"],
+            "items": candidates[c]["items"],
+            "win_rate": win_rate(wins[c], valid[c]),
+            "runs": runs[c],
+            "alive": c in alive,
+        } for c in ranked],
+    }
+
+######################################################################################################
+# CLI Interface
+######################################################################################################
+
+def main(argv=None):
+    """Loadout Optimizer CLI"""
+    parser = argparse.ArgumentParser(description="Find the best perk & item loadout for a character.")
+    parser.add_argument("config", help="JSON config file")
+    parser.add_argument("--workers", type=int, default=multiprocessing.cpu_count(), help="worker processes")
+    parser.add_argument("--top", type=int, default=10, help="number of loadouts to print")
+    args = parser.parse_args(argv)
+
+    with open(args.config, encoding="utf-8-sig") as f:
+        config = json.load(f)
+    opponents = config.get("opponents") or [config["opponent"]]
+    result = optimize(
+        config["combat_data"],
+        config["character"],
+        opponents,
+        side=int(config.get("side", 1)),
+        perk_budget=int(config.get("perk_budget", 6)),
+        item_budget=int(config.get("item_budget", 4)),
+        seed=config.get("seed"),
+        batch_runs=int(config.get("batch_runs", 200)),
+        max_runs=int(config.get("max_runs", 10000)),
+        confidence=float(config.get("confidence", 0.99)),
+        max_rounds=int(config.get("max_rounds", 1000)),
+        workers=args.workers,
+    )
+    result["results"] = result["results"][:args.top]
+    json.dump(result, sys.stdout, indent=2)
+    print()
+
+if __name__ == "__main__":
+    main()
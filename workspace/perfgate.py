@@ -0,0 +1,172 @@
+﻿######################################################################################################
+################################# CROWNED DUELS - PERFORMANCE GATE ###################################
+######################################################################################################
+# Runs the engine benchmark grid and a tracemalloc peak per engine, then compares both against the
+# committed perf_baseline.json and exits 1 on a regression - one command after any engine change.
+#
+# - The grid is played --repeat times over, one pass per cell each time, and each cell keeps its fastest
+#   pass - a slow spell on a shared machine then costs one pass of many cells rather than every pass
+#   of a few.
+# - Throughput: a cell regresses when its duels/sec drops by more than its noise allows - Z times the
+#   spread of its passes (baseline & current together), and never less than CELL_TOLERANCE.
+# - Every cell is also folded into one geometric-mean speed ratio, which is far steadier than any
+#   single cell and is held to the tighter OVERALL_TOLERANCE.
+# - Memory: an engine regresses when its peak grows by more than MEMORY_TOLERANCE (plus a small
+#   slack for interpreter noise). Peaks come from seeded duels, so they barely move between runs.
+# - Throughput only compares on the machine & Python the baseline was recorded on - rebase after
+#   moving either (the gate warns when they differ).
+#
+# Usage:
+# python perfgate.py                  (check against the baseline - exits 1 on regression)
+# python perfgate.py --rebase         (record the current numbers as the baseline)
+######################################################################################################
+
+import argparse
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+
+from bench import ENGINES, cell_key, run_suite
+from memory import peak_bytes
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "perf_baseline.json")
+Z = 3.0                                                     # Noise Multiples a Cell May Drop
+CELL_TOLERANCE = 0.15                                       # Smallest Drop a Single Cell Is Allowed
+OVERALL_TOLERANCE = 0.05                                    # Largest Drop of the Geometric Mean
+MEMORY_TOLERANCE = 0.10                                     # Largest Relative Growth of a Peak
+MEMORY_SLACK = 1024                                         # Bytes of Peak Growth Always Allowed
+
+######################################################################################################
+# Measurement
+######################################################################################################
+
+def measure(duels=200, repeat=5, seed=1, progress=None):
+    """Benchmark Grid, Interleaved Passes - Plus Each Engine's tracemalloc Peak"""
+    report = None
+    for _ in range(repeat):
+        grid = run_suite(duels=duels, seed=seed, repeat=1, progress=progress)
+        if report is None:
+            report = grid
+            continue
+        for best, cell in zip(report["cells"], grid["cells"]):  # - Same Grid, Same Order
+            best["pass_rates"] += cell["pass_rates"]
+            if cell["duels_per_sec"] > best["duels_per_sec"]:
+                cell["pass_rates"] = best["pass_rates"]
+                best.clear()
+                best.update(cell)
+    report["repeat"] = repeat
+    report["peak_bytes"] = {engine: peak_bytes(engine, seed=seed) for engine in ENGINES}
+    return report
+
+def relative_noise(cell):
+    """Spread of a Cell's Passes as a Share of Their Mean"""
+    rates = cell.get("pass_rates", [])
+    if len(rates) < 2 or not statistics.fmean(rates):
+        return 0.0
+    return statistics.stdev(rates) / statistics.fmean(rates)
+
+######################################################################################################
+# Comparison
+######################################################################################################
+
+def compare(baseline, current):
+    """Cell, Overall & Memory Verdicts of a Current Report Against the Baseline"""
+    recorded = {cell_key(cell): cell for cell in baseline["cells"]}
+    cells = []
+    ratios = []
+    for cell in current["cells"]:
+        key = cell_key(cell)
+        base = recorded.get(key)
+        if base is None or not base["duels_per_sec"]:      # - New Cell - Nothing to Hold It To
+            cells.append({"cell": key, "status": "new"})
+            continue
+        ratio = cell["duels_per_sec"] / base["duels_per_sec"]
+        allowed = max(CELL_TOLERANCE, Z * math.hypot(relative_noise(base), relative_noise(cell)))
+        ratios.append(ratio)
+        cells.append({
+            "cell": key,
+            "baseline": base["duels_per_sec"],
+            "current": cell["duels_per_sec"],
+            "ratio": ratio,
+            "allowed_drop": allowed,
+            "status": "regression" if ratio < 1 - allowed else "pass",
+        })
+
+    overall = math.exp(sum(math.log(ratio) for ratio in ratios) / len(ratios)) if ratios else 1.0
+    memory = []
+    for engine, peak in current["peak_bytes"].items():
+        base = baseline.get("peak_bytes", {}).get(engine)
+        if base is None:
+            memory.append({"engine": engine, "status": "new"})
+            continue
+        limit = base * (1 + MEMORY_TOLERANCE) + MEMORY_SLACK
+        memory.append({"engine": engine, "baseline": base, "current": peak, "limit": limit,
+                       "status": "regression" if peak > limit else "pass"})
+
+    regressions = sum(entry["status"] == "regression" for entry in cells + memory)
+    regressions += overall < 1 - OVERALL_TOLERANCE
+    return {
+        "overall_ratio": overall,
+        "overall_status": "regression" if overall < 1 - OVERALL_TOLERANCE else "pass",
+        "regressions": regressions,
+        "cells": cells,
+        "memory": memory,
+    }
+
+def environment_changes(baseline, current):
+    """Machine & Python Fields That Differ From the Baseline's"""
+    return [field for field in ("python", "implementation", "machine") if baseline.get(field) != current.get(field)]
+
+######################################################################################################
+# CLI Interface
+######################################################################################################
+
+def main(argv=None):
+    """Performance Gate CLI"""
+    parser = argparse.ArgumentParser(description="Check engine speed & memory against the stored baseline.")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="baseline JSON file")
+    parser.add_argument("--rebase", action="store_true", help="record the current numbers as the baseline")
+    parser.add_argument("--duels", type=int, help="duels per cell (default: the baseline's, or 200)")
+    parser.add_argument("--repeat", type=int, help="passes per cell (default: the baseline's, or 5)")
+    parser.add_argument("-o", "--output", help="write the full comparison JSON here")
+    args = parser.parse_args(argv)
+
+    baseline = None
+    if not args.rebase:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+    settings = baseline or {}
+    duels = args.duels or settings.get("duels", 200)
+    repeat = args.repeat or settings.get("repeat", 5)
+
+    def progress(cell):
+        print(f"{cell_key(cell):40} {cell['duels_per_sec']:10.1f} duels/s", file=sys.stderr)
+
+    current = measure(duels, repeat, settings.get("seed", 1), progress)
+    if args.rebase:
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(current, f, indent=2)
+            f.write("\n")
+        print(f"Rebased {len(current['cells'])} cells in {args.baseline}")
+        return
+
+    changed = environment_changes(baseline, current)
+    if changed:
+        print(f"Warning: {', '.join(changed)} differ from the baseline ({platform.python_version()} here) - "
+              f"rebase on this machine for a meaningful check", file=sys.stderr)
+    result = compare(baseline, current)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+            f.write("\n")
+    for entry in result["cells"] + result["memory"]:
+        if entry["status"] == "regression":
+            print(json.dumps(entry))
+    print(f"overall speed {result['overall_ratio']:.3f}x baseline - {result['regressions']} regression(s)", file=sys.stderr)
+    sys.exit(1 if result["regressions"] else 0)
+
+if __name__ == "__main__":
+    main()
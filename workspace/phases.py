@@ -0,0 +1,91 @@
+﻿######################################################################################################
+################################### CROWNED DUELS - PHASE PROFILING ##################################
+######################################################################################################
+# Where a duel's wall time goes, phase by phase, with call counts.
+#
+# - While a PhaseProfile is active, the engine functions behind each phase are swapped for timed
+#   wrappers in workspace; outside one, the engines run untouched - disabled costs nothing.
+# - Times are self times: a phase nested in another is taken out of its parent's total.
+# - "engagement_resolution" is the engines' own time once every other phase is taken out - target
+#   picks, damage, injury bookkeeping & the log lines the engines build inline as they fight.
+# - "log_formatting" is combat_log_string, which prints the finished log when verbose.
+# - Each wrapped call costs a couple of microseconds, so a profiled batch runs slower than a plain one -
+#   read the shares rather than the absolute seconds.
+#
+# Usage: python batch.py scenarios.jsonl --phases      (phase table on stderr after the batch)
+######################################################################################################
+
+import time
+
+import workspace
+
+PHASES = {                                                  # Phase: Engine Functions Timed Under It
+    "stat_initialization": ("side_initialization", "melee_initialization", "ranged_initialization", "mixed_initialization"),
+    "initiative_rolls": ("roll_2d20",),
+    "sorting": ("initiative_order",),
+    "engagement_resolution": ("melee_melee", "ranged_melee", "ranged_ranged"),
+    "injury_rolls": ("primary_injury_roll", "secondary_injury_roll", "critical_injury"),
+    "perk_checks": ("RoundTriggers.round_start", "terrifying_presence", "battlefield_champion_aura", "combat_seeking"),
+    "log_formatting": ("combat_log_string",),
+}
+
+######################################################################################################
+# Profiler
+######################################################################################################
+
+class PhaseProfile:
+    """Per-Phase Wall Time & Call Counts - Timed Wrappers Swapped Into workspace While Active"""
+    def __init__(self):
+        self.totals = {phase: {"calls": 0, "seconds": 0.0} for phase in PHASES}
+        self.nested = []                                    # Child Time of Each Open Call
+        self.originals = {}                                 # (Owner, Name): Engine Function Replaced
+
+    def timed(self, phase, function):
+        """Wrap an Engine Function - Adds Its Self Time to a Phase"""
+        totals = self.totals[phase]
+        nested = self.nested
+        clock = time.perf_counter
+
+        def wrapper(*args, **kwargs):
+            nested.append(0.0)
+            start = clock()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = clock() - start
+                child = nested.pop()
+                totals["calls"] += 1
+                totals["seconds"] += elapsed - child
+                if nested:                                  # - Out of the Parent's Self Time
+                    nested[-1] += elapsed
+        return wrapper
+
+    def __enter__(self):
+        for phase, names in PHASES.items():
+            for name in names:
+                owner = workspace
+                if "." in name:                             # - Method - Wrap It on Its Class
+                    owner_name, name = name.split(".")
+                    owner = getattr(workspace, owner_name)
+                self.originals[(owner, name)] = getattr(owner, name)
+                setattr(owner, name, self.timed(phase, getattr(owner, name)))
+        return self
+
+    def __exit__(self, *exc):
+        for (owner, name), function in self.originals.items():
+            setattr(owner, name, function)
+        self.originals = {}
+
+    def report(self):
+        """Phase Totals With Each Phase's Share of the Profiled Time"""
+        total = sum(entry["seconds"] for entry in self.totals.values())
+        return {phase: {"calls": entry["calls"], "seconds": entry["seconds"],
+                        "share": entry["seconds"] / total if total else 0.0}
+                for phase, entry in self.totals.items()}
+
+def format_report(report):
+    """Phase Table for the Terminal"""
+    lines = [f"{'phase':24} {'calls':>10} {'seconds':>10} {'share':>7}"]
+    for phase, entry in sorted(report.items(), key=lambda item: -item[1]["seconds"]):
+        lines.append(f"{phase:24} {entry['calls']:>10} {entry['seconds']:>10.3f} {entry['share']:>7.1%}")
+    return "\n".join(lines)
@@ -0,0 +1,99 @@
+﻿######################################################################################################
+################################### CROWNED DUELS - CALL PROFILING ###################################
+######################################################################################################
+# Runs a batch under cProfile and writes what it found, for the batch & rare event runners' --profile.
+#
+# - PREFIX.pstats       the raw profile - python -m pstats PREFIX.pstats, snakeviz, etc.
+# - PREFIX.collapsed    collapsed stacks ("a;b;c microseconds" per line) for flamegraph.pl, speedscope
+#                       or inferno.
+# - A top-N table of the hottest functions by self time on stderr.
+#
+# - cProfile records caller -> callee edges, not whole stacks: a function reached along several paths
+#   has its time shared between them by each caller's share of its cumulative time, which is exact for
+#   the engines' tree-shaped calls and an estimate where paths rejoin.
+# - Profiling adds a fixed cost to every call, so small functions look heavier than they run.
+# - Worker processes are not profiled - profile with --workers 1 where a runner has them.
+######################################################################################################
+
+import cProfile
+import io
+import os
+import pstats
+import sys
+
+TOP = 25                                                    # Functions in the Summary Table
+
+######################################################################################################
+# Collapsed Stacks
+######################################################################################################
+
+def frame_label(function):
+    """Flame Graph Label for a pstats Function Key - No Semicolons"""
+    filename, line, name = function
+    if filename == "~":                                     # - Built-In
+        return name.replace(";", ",")
+    return f"{os.path.basename(filename)}:{line}({name})".replace(";", ",")
+
+def collapsed_stacks(stats):
+    """Self Time in Microseconds per Call Stack From a pstats Table"""
+    callees = {}
+    for function, (_, _, _, _, callers) in stats.items():
+        for caller, edge in callers.items():
+            callees.setdefault(caller, {})[function] = edge[3]  # - Time Spent in Function When Called From Caller
+
+    stacks = {}
+
+    def walk(function, stack, fraction):
+        _, _, self_time, cumulative, _ = stats[function]
+        stack = stack + [frame_label(function)]
+        weight = round(self_time * fraction * 1e6)
+        if weight > 0:
+            key = ";".join(stack)
+            stacks[key] = stacks.get(key, 0) + weight
+        for callee, edge_time in callees.get(function, {}).items():
+            if frame_label(callee) in stack or not stats[callee][3]:  # - Recursion / Nothing to Share
+                continue
+            walk(callee, stack, fraction * edge_time / stats[callee][3])
+
+    for function, (_, _, _, _, callers) in stats.items():
+        if not callers:                                     # - Roots: Entered With the Profiler Already On
+            walk(function, [], 1.0)
+    return stacks
+
+######################################################################################################
+# Profiler
+######################################################################################################
+
+class CallProfile:
+    """cProfile Around a Block - Writes PREFIX.pstats & PREFIX.collapsed, Prints the Top Functions"""
+    def __init__(self, prefix=None, top=TOP, stream=sys.stderr):
+        self.prefix = prefix                                # Output Path Prefix - None Disables Profiling
+        self.top = top                                      # Functions in the Summary
+        self.stream = stream                                # Where the Summary Goes
+        self.profile = None
+
+    def __enter__(self):
+        if self.prefix is not None:
+            self.profile = cProfile.Profile()
+            self.profile.enable()
+        return self
+
+    def __exit__(self, *exc):
+        if self.profile is None:
+            return
+        self.profile.disable()
+        self.profile.dump_stats(self.prefix + ".pstats")
+        stats = pstats.Stats(self.profile)
+        with open(self.prefix + ".collapsed", "w", encoding="utf-8") as f:
+            for stack, weight in sorted(collapsed_stacks(stats.stats).items()):
+                f.write(f"{stack} {weight}\n")
+        print(top_functions(stats, self.top), file=self.stream)
+        print(f"Profile written to {self.prefix}.pstats & {self.prefix}.collapsed", file=self.stream)
+        self.profile = None
+
+def top_functions(stats, top=TOP):
+    """Hottest Functions by Self Time - pstats Table Text"""
+    text = io.StringIO()
+    stats.stream = text
+    stats.strip_dirs().sort_stats("tottime").print_stats(top)
+    return text.getvalue().strip()
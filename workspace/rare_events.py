@@ -0,0 +1,230 @@
+﻿######################################################################################################
+################################# CROWNED DUELS - RARE EVENT ESTIMATOR ###############################
+######################################################################################################
+# Estimates how likely a duel is to end in a death or a critical injury when plain batches see too
+# few of them (heavily armored or Sworn Sword characters under live steel).
+#
+# - Importance sampling: the primary injury d100 is biased toward the faces that still kill after the
+#   Sworn Sword bonus, the critical injury d20 toward Death and, optionally, the damage d5s toward
+#   high faces. Secondary injury rolls stay fair - they come often and rarely kill, and biasing them
+#   would only blow up the weights.
+# - Every biased roll multiplies the run's weight by P(face) / Q(face), so the weighted event
+#   rates are unbiased estimates of the real ones.
+# - A run the engine faults on still counts: its events up to the fault are scored and it stays in
+#   the denominator. Dropping it would bias the rates, since faults can follow the very injuries
+#   being estimated.
+# - Initiative, hit and targeting dice are left alone.
+#
+# Scenario Format - Batch Runner Scenarios Plus Optional Bias Settings:
+# {"id": "ser-arthur", "combat_data": "Live Melee vs Melee", "runs": 20000, "seed": 1,
+#  "injury_bias": 0.5, "critical_bias": 0.5, "damage_tilt": 1.0,
+#  "side1_data": [...], "side2_data": [...]}
+#
+# Usage:
+# python rare_events.py scenarios.jsonl -o results.jsonl
+# python rare_events.py scenarios.jsonl --profile slow      (cProfile: slow.pstats & slow.collapsed)
+######################################################################################################
+
+import argparse
+import json
+import statistics
+import sys
+
+import workspace
+from batch import ENGINE_FAULTS, engine_fault, new_seed, read_scenarios, run_seed
+from profiling import TOP, CallProfile
+
+LETHAL_ROLL = 40                                            # Highest Primary Injury Roll That Can Kill (1-25 Death, 26-40 Critical)
+
+######################################################################################################
+# Biased Dice
+######################################################################################################
+
+def biased_die(sides, weights):
+    """Die Drawn From Weights - (Faces, Cumulative Weights, Likelihood Ratios)"""
+    total = sum(weights)
+    cumulative = []
+    running = 0.0
+    for weight in weights:
+        running += weight / total
+        cumulative.append(running)
+    ratios = [total / (sides * weight) for weight in weights]  # - P(Face) / Q(Face)
+    return list(range(1, sides + 1)), cumulative, ratios
+
+class TiltedDice:
+    """Injury & Damage Dice Biased Toward Lethal Paths - Tracks Each Run's Weight & Events"""
+    def __init__(self, injury_bias=0.5, critical_bias=0.5, damage_tilt=1.0):
+
+        # Biased Dice - Mixture of the Fair Die & the Lethal Faces
+        self.injury_bias = injury_bias
+        self.d100 = {}                                      # Primary Injury Dice by Lethal Face Count
+        self.lethal_faces = 0                               # Lethal Faces of the Primary Roll Underway
+        self.d20 = biased_die(20, [(1 - critical_bias) / 20 + (critical_bias if face == 1 else 0)
+                                   for face in range(1, 21)])
+        self.d5 = biased_die(5, [damage_tilt ** face for face in range(1, 6)])
+
+        self.weight = 1.0                                   # Likelihood Ratio of the Current Run
+        self.death = False                                  # Someone Died This Run
+        self.critical = False                               # Someone Suffered a Critical Injury This Run
+        self.originals = {}                                 # Engine Functions Replaced While Active
+
+    def start(self, seed):
+        """Reset for One Run"""
+        workspace.rng.seed(seed)
+        self.weight = 1.0
+        self.death = False
+        self.critical = False
+
+    def roll(self, die):
+        """Roll a Biased Die & Reweight"""
+        faces, cumulative, ratios = die
+        face = workspace.rng.choices(faces, cum_weights=cumulative)[0]
+        self.weight *= ratios[face - 1]
+        return face
+
+    def primary_die(self, lethal_faces):
+        """Primary Injury d100 Biased Toward Its Lethal Faces"""
+        if lethal_faces not in self.d100:
+            self.d100[lethal_faces] = biased_die(100, [(1 - self.injury_bias) / 100 + (self.injury_bias / lethal_faces if face <= lethal_faces else 0)
+                                                       for face in range(1, 101)])
+        return self.d100[lethal_faces]
+
+    # Engine Replacements
+    def roll_1d100(self):
+        """Roll 1d100 - Biased for Primary Injuries That Can Still Kill"""
+        if self.lethal_faces > 0:
+            return self.roll(self.primary_die(self.lethal_faces))
+        return workspace.rng.randint(1, 100)
+
+    def roll_1d20(self):
+        """Roll 1d20 - Biased"""
+        return self.roll(self.d20)
+
+    def roll_3d5(self):
+        """Roll 3d5 - Biased"""
+        rolls = (self.roll(self.d5), self.roll(self.d5), self.roll(self.d5))
+        return sum(rolls), rolls
+
+    def primary_injury_roll(self, weapons, bonus):
+        """Primary Injury - Biased & Records Deaths"""
+        if weapons.lower() == "steel":
+            self.lethal_faces = min(max(LETHAL_ROLL - bonus, 0), 100)
+        try:
+            result = self.originals["primary_injury_roll"](weapons, bonus)
+        finally:
+            self.lethal_faces = 0
+        if result == "Death":
+            self.death = True
+        return result
+
+    def critical_injury(self):
+        """Critical Injury - Records Criticals & Deaths"""
+        result = self.originals["critical_injury"]()
+        self.critical = True
+        if result == "Death":
+            self.death = True
+        return result
+
+    def __enter__(self):
+        for name in ("roll_1d100", "roll_1d20", "roll_3d5", "primary_injury_roll", "critical_injury"):
+            self.originals[name] = getattr(workspace, name)
+            setattr(workspace, name, getattr(self, name))
+        return self
+
+    def __exit__(self, *exc):
+        for name, function in self.originals.items():
+            setattr(workspace, name, function)
+        self.originals = {}
+
+######################################################################################################
+# Estimation
+######################################################################################################
+
+def weighted_rate(total, squares, runs, confidence):
+    """Weighted Event Rate With Its Standard Error & Confidence Interval"""
+    if runs < 2:
+        return {"rate": total / runs if runs else 0.0, "std_error": None, "ci_low": None, "ci_high": None}
+    rate = total / runs
+    error = (max(squares / runs - rate * rate, 0.0) / (runs - 1)) ** 0.5
+    z = statistics.NormalDist().inv_cdf(0.5 + confidence / 2)
+    return {"rate": rate, "std_error": error, "ci_low": max(rate - z * error, 0.0), "ci_high": rate + z * error}
+
+def estimate_rare_events(combat_data, side1_data, side2_data, runs=20000, seed=None, max_rounds=1000,
+                         injury_bias=0.5, critical_bias=0.5, damage_tilt=1.0, confidence=0.95):
+    """Importance-Sampled Death & Critical Injury Probabilities for One Matchup"""
+    if seed is None:
+        seed = new_seed()
+    dice = TiltedDice(injury_bias, critical_bias, damage_tilt)
+    sums = {"death": [0.0, 0.0, 0], "critical": [0.0, 0.0, 0]}  # Weighted Sum, Squared Sum, Raw Hits
+    weight_sum = 0.0
+    weight_squares = 0.0
+    errors = 0
+    with dice:
+        for index in range(runs):
+            dice.start(run_seed(seed, index))
+            try:
+                workspace.combat_initialization(combat_data, side1_data, side2_data, False, max_rounds)
+            except ENGINE_FAULTS as error:                  # - Faulted Runs Scored Up to the Fault
+                if not engine_fault(error):
+                    raise
+                errors += 1
+            weight_sum += dice.weight
+            weight_squares += dice.weight * dice.weight
+            for event, happened in (("death", dice.death), ("critical", dice.critical)):
+                if happened:
+                    sums[event][0] += dice.weight
+                    sums[event][1] += dice.weight * dice.weight
+                    sums[event][2] += 1
+
+    result = {"seed": seed, "runs": runs, "errors": errors}
+    for event, (total, squares, hits) in sums.items():
+        result[event] = weighted_rate(total, squares, runs, confidence)
+        result[event]["hits"] = hits                        # - Biased Runs That Saw the Event
+    result["confidence"] = confidence
+    result["effective_runs"] = weight_sum * weight_sum / weight_squares if weight_squares else 0.0  # - Weight Degeneracy Check
+    return result
+
+######################################################################################################
+# CLI Interface
+######################################################################################################
+
+def main(argv=None):
+    """Rare Event Estimator CLI"""
+    parser = argparse.ArgumentParser(description="Estimate death & critical injury probabilities with importance sampling.")
+    parser.add_argument("scenarios", nargs="?", default="-", help="scenario file (default: stdin)")
+    parser.add_argument("-o", "--output", default="-", help="JSONL results file (default: stdout)")
+    parser.add_argument("--profile", metavar="PREFIX", help="run under cProfile & write PREFIX.pstats & PREFIX.collapsed")
+    parser.add_argument("--profile-top", type=int, default=TOP, help="hot functions listed on stderr with --profile")
+    args = parser.parse_args(argv)
+
+    stream = sys.stdin if args.scenarios == "-" else open(args.scenarios, encoding="utf-8-sig")
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        with CallProfile(args.profile, args.profile_top):   # - No-Op Without --profile
+            for index, scenario in enumerate(read_scenarios(stream)):
+                result = {"id": scenario.get("id", index), "combat_data": scenario.get("combat_data")}
+                try:
+                    result.update(estimate_rare_events(
+                        scenario["combat_data"],
+                        scenario["side1_data"],
+                        scenario["side2_data"],
+                        runs=int(scenario.get("runs", 20000)),
+                        seed=scenario.get("seed"),
+                        max_rounds=int(scenario.get("max_rounds", 1000)),
+                        injury_bias=float(scenario.get("injury_bias", 0.5)),
+                        critical_bias=float(scenario.get("critical_bias", 0.5)),
+                        damage_tilt=float(scenario.get("damage_tilt", 1.0)),
+                        confidence=float(scenario.get("confidence", 0.95)),
+                    ))
+                except (KeyError, ValueError) as error:     # - Bad Scenario - Report & Move On
+                    result["error"] = f"{type(error).__name__}: {error}"
+                out.write(json.dumps(result) + "\n")
+                out.flush()
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+        if out is not sys.stdout:
+            out.close()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+﻿######################################################################################################
+################################### CROWNED DUELS - ROSTER RATINGS ###################################
+######################################################################################################
+# Fits a Bradley-Terry strength rating to every roster character from a tournament matrix, on the
+# Elo scale (mean 1500, 400 points = 10 to 1 odds), so any pairing's odds come from two numbers.
+#
+# - The fit is the MM (minorize-maximize) iteration for Bradley-Terry, warm-started from the last
+#   ratings when refreshing.
+# - Draws and faulted runs are left out: a cell's share of decisive wins is what gets fitted.
+# - Refreshing after a loadout change reruns the tournament against the pair cache, so only the
+#   changed character's pairs are simulated.
+#
+# Usage:
+# python ratings.py matrix.jsonl                                  (fit the last matrix a tournament wrote)
+# python ratings.py --roster roster.json --cache pairs.jsonl      (simulate missing pairs, then fit)
+# python ratings.py --roster roster.json --cache pairs.jsonl --previous ratings.json   (refresh)
+# python ratings.py matrix.jsonl --odds Arya Jaime                (expected outcome of one pairing)
+######################################################################################################
+
+import argparse
+import json
+import math
+import multiprocessing
+import sys
+
+from tournament import run_tournament
+
+BASE_RATING = 1500                                          # Mean Rating
+SCALE = 400 / math.log(10)                                  # Elo Points per Unit of Log-Strength
+CLAMP = 0.001                                               # Keeps Clean Sweeps From Rating at Infinity
+
+######################################################################################################
+# Fitting
+######################################################################################################
+
+def decisive_share(matrix, i, j):
+    """Row's Share of Decisive Results Against Column - None if Unknown"""
+    if matrix[i][j] is None or matrix[j][i] is None:
+        return None
+    decisive = matrix[i][j] + matrix[j][i]
+    if not decisive:
+        return None
+    return min(max(matrix[i][j] / decisive, CLAMP), 1 - CLAMP)
+
+def fit_ratings(matrix, start=None, iterations=1000, tolerance=1e-9):
+    """Bradley-Terry Ratings From a Win-Probability Matrix"""
+    count = len(matrix)
+    shares = [[decisive_share(matrix, i, j) if i != j else None for j in range(count)] for i in range(count)]
+    strengths = [math.exp((rating - BASE_RATING) / SCALE) for rating in start] if start else [1.0] * count
+    for _ in range(iterations):
+        change = 0.0
+        for i in range(count):
+            wins = sum(share for share in shares[i] if share is not None)
+            games = sum(1 / (strengths[i] + strengths[j]) for j in range(count) if shares[i][j] is not None)
+            if not games:                                   # - No Known Pairs
+                continue
+            updated = wins / games
+            change = max(change, abs(math.log(updated / strengths[i])))
+            strengths[i] = updated
+        mean = sum(math.log(strength) for strength in strengths) / count
+        strengths = [strength / math.exp(mean) for strength in strengths]  # - Anchor the Mean
+        if change < tolerance:
+            break
+    return [BASE_RATING + SCALE * math.log(strength) for strength in strengths]
+
+def expected_outcome(rating_a, rating_b):
+    """Chance A Beats B From Their Ratings"""
+    return 1 / (1 + 10 ** ((rating_b - rating_a) / 400))
+
+def fit_error(matrix, ratings):
+    """Root Mean Square Gap Between Fitted & Simulated Decisive Shares"""
+    gaps = [expected_outcome(ratings[i], ratings[j]) - decisive_share(matrix, i, j)
+            for i in range(len(matrix)) for j in range(len(matrix))
+            if i != j and decisive_share(matrix, i, j) is not None]
+    return (sum(gap * gap for gap in gaps) / len(gaps)) ** 0.5 if gaps else 0.0
+
+def rating_table(snapshot, start=None):
+    """Ratings for a Tournament Snapshot"""
+    ratings = fit_ratings(snapshot["matrix"], start)
+    return {
+        "entrants": snapshot["entrants"],
+        "ratings": ratings,
+        "rms_error": fit_error(snapshot["matrix"], ratings),
+    }
+
+def refresh_ratings(config, table=None, workers=1, cache_path=None):
+    """Rerun a Roster Against the Pair Cache & Refit - Only Changed Pairs Are Simulated"""
+    snapshot = run_tournament(config, workers=workers, cache_path=cache_path, every=0)
+    start = None
+    if table is not None:                                   # - Warm Start From Matching Names
+        previous = dict(zip(table["entrants"], table["ratings"]))
+        start = [previous.get(name, BASE_RATING) for name in snapshot["entrants"]]
+    return rating_table(snapshot, start)
+
+######################################################################################################
+# CLI Interface
+######################################################################################################
+
+def main(argv=None):
+    """Roster Ratings CLI"""
+    parser = argparse.ArgumentParser(description="Bradley-Terry ratings from a tournament matrix.")
+    parser.add_argument("matrix", nargs="?", help="tournament JSONL output (last matrix is fitted)")
+    parser.add_argument("--roster", help="tournament config - simulate missing pairs, then fit")
+    parser.add_argument("--cache", help="JSONL pair cache for --roster")
+    parser.add_argument("--previous", help="earlier ratings JSON to warm-start --roster from")
+    parser.add_argument("--workers", type=int, default=multiprocessing.cpu_count(), help="worker processes for --roster")
+    parser.add_argument("--odds", nargs=2, metavar=("A", "B"), help="print the chance A beats B")
+    args = parser.parse_args(argv)
+
+    if args.roster:
+        previous = None
+        if args.previous:
+            with open(args.previous, encoding="utf-8") as f:
+                previous = json.load(f)
+        with open(args.roster, encoding="utf-8-sig") as f:
+            table = refresh_ratings(json.load(f), previous, workers=args.workers, cache_path=args.cache)
+    elif args.matrix:
+        with open(args.matrix, encoding="utf-8") as f:
+            lines = [line for line in f if line.strip()]
+        table = rating_table(json.loads(lines[-1]))
+    else:
+        parser.error("give a tournament matrix or --roster")
+
+    if args.odds:
+        ratings = dict(zip(table["entrants"], table["ratings"]))
+        json.dump({"a": args.odds[0], "b": args.odds[1],
+                   "a_wins": expected_outcome(ratings[args.odds[0]], ratings[args.odds[1]])}, sys.stdout, indent=2)
+    else:
+        json.dump(table, sys.stdout, indent=2)
+    print()
+
+if __name__ == "__main__":
+    main()
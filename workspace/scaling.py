@@ -0,0 +1,153 @@
+﻿######################################################################################################
+################################## CROWNED DUELS - TEAM SIZE SCALING #################################
+######################################################################################################
+# How the cost of a duel grows with team size, for melee_melee and ranged_melee, from 1 to 500 per side.
+#
+# - Each size plays seeded duels (run_seed(seed, index)) until --budget seconds have gone by, so small
+#   teams get many duels and big teams a few.
+# - Cost is measured per duel and per round (completed duels only - a faulted duel has no round count).
+# - The empirical complexity exponent k in cost ~ size^k is the least-squares slope of log cost on
+#   log size, fitted from FIT_FROM up - below that the fixed per-duel overhead hides the loops.
+# - Local exponents between neighbouring sizes show where the nested engagement loops & list.pop
+#   calls take over: 1 is linear, 2 quadratic.
+# - --max-exponent turns the report into a gate: exits 1 if either fitted exponent is over it.
+#
+# Usage:
+# python scaling.py -o scaling.json
+# python scaling.py --engine ranged_melee --sizes 10 50 100 500 --max-exponent 2.2
+######################################################################################################
+
+import argparse
+import json
+import math
+import sys
+import time
+
+import workspace
+from batch import ENGINE_FAULTS, engine_fault, run_seed
+from bench import ENGINES, team
+
+SCALING_ENGINES = ("melee_melee", "ranged_melee")
+SIZES = (1, 2, 5, 10, 20, 50, 100, 200, 500)
+FIT_FROM = 10                                               # Smallest Size in the Exponent Fit
+MIN_DUELS = 5                                               # Duels per Size However Slow
+
+######################################################################################################
+# Measurement
+######################################################################################################
+
+def time_size(engine, size, loadout="none", ct="steel", seed=1, budget=1.0, max_rounds=1000):
+    """Play Seeded Duels at One Team Size Until the Budget Runs Out - Per-Duel & Per-Round Cost"""
+    fight, ranged1, ranged2 = ENGINES[engine]
+    side1 = team("A", size, ranged1, loadout)
+    side2 = team("B", size, ranged2, loadout)
+    duels = faults = rounds = 0
+    spent = completed_time = 0.0
+    while duels < MIN_DUELS or spent < budget:
+        workspace.rng.seed(run_seed(seed, duels))
+        start = time.perf_counter()
+        try:
+            played = fight(side1, side2, ct, False, max_rounds)["rounds"]
+        except ENGINE_FAULTS as error:                      # - Timed, but No Rounds to Divide By
+            if not engine_fault(error):
+                raise
+            played = None
+        elapsed = time.perf_counter() - start
+        spent += elapsed
+        duels += 1
+        if played is None:
+            faults += 1
+        else:
+            rounds += played
+            completed_time += elapsed
+    return {
+        "team_size": size,
+        "duels": duels,
+        "faults": faults,
+        "avg_rounds": rounds / (duels - faults) if duels > faults else 0.0,
+        "duel_ms": spent / duels * 1000,
+        "round_ms": completed_time / rounds * 1000 if rounds else None,
+    }
+
+def exponent(points):
+    """Least-Squares Slope of log Cost on log Size - None With Fewer Than Two Points"""
+    points = [(math.log(size), math.log(cost)) for size, cost in points if cost]
+    if len(points) < 2:
+        return None
+    mean_x = sum(x for x, _ in points) / len(points)
+    mean_y = sum(y for _, y in points) / len(points)
+    spread = sum((x - mean_x) ** 2 for x, _ in points)
+    if not spread:
+        return None
+    return sum((x - mean_x) * (y - mean_y) for x, y in points) / spread
+
+def scaling_curve(engine, sizes=SIZES, loadout="none", ct="steel", seed=1, budget=1.0, progress=None):
+    """Cost Curve Over Team Sizes With Fitted & Local Complexity Exponents"""
+    points = []
+    for size in sizes:
+        point = time_size(engine, size, loadout, ct, seed, budget)
+        points.append(point)
+        if progress is not None:
+            progress(engine, point)
+
+    fitted = [point for point in points if point["team_size"] >= FIT_FROM]
+    local = []
+    for low, high in zip(points, points[1:]):
+        local.append({
+            "sizes": [low["team_size"], high["team_size"]],
+            "duel": exponent([(low["team_size"], low["duel_ms"]), (high["team_size"], high["duel_ms"])]),
+            "round": exponent([(low["team_size"], low["round_ms"]), (high["team_size"], high["round_ms"])]),
+        })
+    return {
+        "engine": engine,
+        "loadout": loadout,
+        "ct": ct,
+        "duel_exponent": exponent([(point["team_size"], point["duel_ms"]) for point in fitted]),
+        "round_exponent": exponent([(point["team_size"], point["round_ms"]) for point in fitted]),
+        "local_exponents": local,
+        "points": points,
+    }
+
+######################################################################################################
+# CLI Interface
+######################################################################################################
+
+def main(argv=None):
+    """Team Size Scaling CLI"""
+    parser = argparse.ArgumentParser(description="Duel cost against team size, with its complexity exponent.")
+    parser.add_argument("-o", "--output", default="-", help="JSON report file (default: stdout)")
+    parser.add_argument("--engine", action="append", choices=list(ENGINES), help=f"engine to sweep (repeatable, default: {' & '.join(SCALING_ENGINES)})")
+    parser.add_argument("--sizes", type=int, nargs="+", default=list(SIZES), help="team sizes per side")
+    parser.add_argument("--loadout", choices=("none", "heavy"), default="none", help="loadout for both sides")
+    parser.add_argument("--ct", choices=("steel", "blunted"), default="steel", help="combat type")
+    parser.add_argument("--seed", type=int, default=1, help="master seed")
+    parser.add_argument("--budget", type=float, default=1.0, help="seconds of duels per size")
+    parser.add_argument("--max-exponent", type=float, help="exit 1 if a fitted exponent is over this")
+    args = parser.parse_args(argv)
+
+    def progress(engine, point):
+        round_ms = f"{point['round_ms']:9.3f}" if point["round_ms"] is not None else f"{'-':>9}"
+        print(f"{engine:14} {point['team_size']:4}v{point['team_size']:<4} {point['duel_ms']:10.3f} ms/duel  "
+              f"{round_ms} ms/round  ({point['duels']} duels)", file=sys.stderr)
+
+    curves = [scaling_curve(engine, sorted(args.sizes), args.loadout, args.ct, args.seed, args.budget, progress)
+              for engine in args.engine or SCALING_ENGINES]
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    try:
+        json.dump({"seed": args.seed, "fit_from": FIT_FROM, "curves": curves}, out, indent=2)
+        out.write("\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    failed = False
+    for curve in curves:
+        print(f"{curve['engine']:14} exponent per duel {curve['duel_exponent'] or 0:5.2f}  per round {curve['round_exponent'] or 0:5.2f}",
+              file=sys.stderr)
+        if args.max_exponent is not None:
+            failed |= any(value is not None and value > args.max_exponent
+                          for value in (curve["duel_exponent"], curve["round_exponent"]))
+    sys.exit(1 if failed else 0)
+
+if __name__ == "__main__":
+    main()
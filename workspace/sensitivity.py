@@ -0,0 +1,149 @@
+﻿######################################################################################################
+################################# CROWNED DUELS - STAT SENSITIVITY ###################################
+######################################################################################################
+# How much one point of speed, attack, defense, starting morale or morale threshold is worth to
+# each combatant of a matchup, in win probability for that combatant's side.
+#
+# - Speed, attack & defense are nudged +1 / -1 after melee_ / ranged_initialization through the
+#   character's "stat_adjustments", starting morale likewise, and morale_threshold directly.
+# - Every variant plays the same seeded runs as the unchanged matchup (common random numbers), so
+#   the differences are paired run by run.
+# - Variants run in parallel, in chunks of runs.
+#
+# Scenario Format - A Batch Runner Scenario:
+# {"combat_data": "Live Melee vs Melee", "runs": 4000, "seed": 1, "side1_data": [...], "side2_data": [...]}
+#
+# Usage: python sensitivity.py scenario.json --workers 8
+######################################################################################################
+
+import argparse
+import copy
+import json
+import multiprocessing
+import sys
+
+from batch import new_seed, run_duel
+from optimizer import paired_difference
+
+STATS = ("speed", "attack", "defense", "morale", "morale_threshold")
+CHUNK_RUNS = 500                                            # Runs per Worker Task
+
+######################################################################################################
+# Variants
+######################################################################################################
+
+def perturbed(side_data, position, stat, delta):
+    """Copy of a Side With One Combatant's Stat Nudged"""
+    side_data = copy.deepcopy(side_data)
+    spec = side_data[position]
+    if stat == "morale_threshold":                          # - Character Input
+        spec["morale_threshold"] = spec.get("morale_threshold", 15) + delta
+    else:                                                   # - After Stat Initialization
+        adjustments = spec.setdefault("stat_adjustments", {})
+        adjustments[stat] = adjustments.get(stat, 0) + delta
+    return side_data
+
+def variants(side1_data, side2_data):
+    """Every (Side, Position, Stat, Delta) Nudge - Plus the Unchanged Matchup"""
+    matchups = {None: (side1_data, side2_data)}
+    for side, side_data in ((1, side1_data), (2, side2_data)):
+        for position in range(len(side_data)):
+            for stat in STATS:
+                for delta in (1, -1):
+                    nudged = perturbed(side_data, position, stat, delta)
+                    matchups[(side, position, stat, delta)] = (nudged, side2_data) if side == 1 else (side1_data, nudged)
+    return matchups
+
+def run_chunk(task):
+    """Play Runs [start, stop) of One Variant - Returns (Key, Start, Side One Wins, Side Two Wins, Valid) Bits"""
+    key, combat_data, side1_data, side2_data, seed, start, stop, max_rounds = task
+    wins = {1: 0, 2: 0}
+    valid = 0
+    for index in range(start, stop):
+        outcome = run_duel(combat_data, side1_data, side2_data, seed, index, max_rounds)
+        if outcome is None:                                 # - Engine Fault - Run Excluded
+            continue
+        bit = 1 << (index - start)
+        valid |= bit
+        if outcome["winner"] in wins:
+            wins[outcome["winner"]] |= bit
+    return key, start, wins[1], wins[2], valid
+
+######################################################################################################
+# Report
+######################################################################################################
+
+def sensitivity_report(combat_data, side1_data, side2_data, runs=4000, seed=None, max_rounds=1000, workers=1):
+    """Win-Probability Change per Stat Point for Every Combatant"""
+    if seed is None:
+        seed = new_seed()
+    matchups = variants(side1_data, side2_data)
+    tasks = [(key, combat_data, side1, side2, seed, start, min(start + CHUNK_RUNS, runs), max_rounds)
+             for key, (side1, side2) in matchups.items() for start in range(0, runs, CHUNK_RUNS)]
+
+    bits = {key: {1: 0, 2: 0, "valid": 0} for key in matchups}
+    pool = multiprocessing.Pool(workers) if workers > 1 else None
+    try:
+        chunks = pool.imap_unordered(run_chunk, tasks) if pool else map(run_chunk, tasks)
+        for key, start, side1_wins, side2_wins, valid in chunks:
+            bits[key][1] |= side1_wins << start
+            bits[key][2] |= side2_wins << start
+            bits[key]["valid"] |= valid << start
+    finally:
+        if pool:
+            pool.close()
+            pool.join()
+
+    base = bits[None]
+    report = []
+    for side, side_data in ((1, side1_data), (2, side2_data)):
+        for position, spec in enumerate(side_data):
+            entry = {"side": side, "name": spec.get("name"), "stats": {}}
+            for stat in STATS:
+                plus, minus = bits[(side, position, stat, 1)], bits[(side, position, stat, -1)]
+                gain, gain_error = paired_difference(plus[side], plus["valid"], base[side], base["valid"])
+                loss, loss_error = paired_difference(base[side], base["valid"], minus[side], minus["valid"])
+                slope, slope_error = paired_difference(plus[side], plus["valid"], minus[side], minus["valid"])
+                entry["stats"][stat] = {
+                    "plus_one": gain, "plus_one_error": gain_error,    # - P(+1) - P(Base)
+                    "minus_one": loss, "minus_one_error": loss_error,  # - P(Base) - P(-1)
+                    "per_point": slope / 2, "per_point_error": slope_error / 2,  # - Central Difference
+                }
+            report.append(entry)
+
+    valid = base["valid"].bit_count()
+    return {
+        "seed": seed,
+        "runs": runs,
+        "side1_win_rate": (base[1] & base["valid"]).bit_count() / valid if valid else 0.0,
+        "side2_win_rate": (base[2] & base["valid"]).bit_count() / valid if valid else 0.0,
+        "combatants": report,
+    }
+
+######################################################################################################
+# CLI Interface
+######################################################################################################
+
+def main(argv=None):
+    """Stat Sensitivity CLI"""
+    parser = argparse.ArgumentParser(description="Win-probability value of one stat point per combatant.")
+    parser.add_argument("scenario", help="JSON scenario file")
+    parser.add_argument("--workers", type=int, default=multiprocessing.cpu_count(), help="worker processes")
+    args = parser.parse_args(argv)
+
+    with open(args.scenario, encoding="utf-8-sig") as f:
+        scenario = json.load(f)
+    report = sensitivity_report(
+        scenario["combat_data"],
+        scenario["side1_data"],
+        scenario["side2_data"],
+        runs=int(scenario.get("runs", 4000)),
+        seed=scenario.get("seed"),
+        max_rounds=int(scenario.get("max_rounds", 1000)),
+        workers=args.workers,
+    )
+    json.dump(report, sys.stdout, indent=2)
+    print()
+
+if __name__ == "__main__":
+    main()
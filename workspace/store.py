@@ -0,0 +1,242 @@
+﻿######################################################################################################
+################################### CROWNED DUELS - RESULTS STORE ####################################
+######################################################################################################
+# One compact row per duel for research batches, in a columnar store analysis can memory-map instead
+# of loading - so later questions can be asked of the raw duels without rerunning them.
+#
+# Layout - One Directory per Batch:
+#   schema.json                         columns, typecodes & numpy dtypes, rows written, combatants
+#   run.col  seed.col  stratum.col  mirror.col  winner.col  rounds.col
+#   side1_0_morale.col  side1_0_injury.col  side1_0_out.col  side1_1_morale.col ...   (three per combatant)
+#
+# - Each column is a flat array in the machine's byte order (stdlib array typecodes), so it maps
+#   straight into memory: open_store() returns memoryviews over mmap, and numpy.memmap(path, dtype)
+#   reads the same files with the dtype schema.json gives.
+# - seed is the run's dice seed, run_seed(master seed, index). Plain batch rows replay from it alone.
+# - stratum & mirror: stratified batches force the first two d20s to INITIATIVE_STRATA[stratum] and play
+#   every pair twice on one seed - mirror 1 marks the mirrored duel (each die d played as 21 - d). Seed,
+#   stratum & mirror together replay the row. Plain rows hold stratum -1, mirror 0.
+# - winner: 1 / 2 for the standing side, 0 no winner, -1 engine fault (rounds, morale & injuries 0).
+# - injury: the worst injury the combatant took - workspace.INJURY_CODES, 0 none to 4 death.
+# - out: 1 if the combatant was taken out by a critical injury (off the field, morale unbroken).
+# - Rows are buffered & appended CHUNK_ROWS at a time; schema.json's "rows" only moves once a chunk
+#   is on disk, and reopening a store cuts every column back to it, so a killed batch leaves whole rows.
+# - A store that already holds rows is refused unless opened with append=True (then its combatants must
+#   match) - rerunning a batch into its old store would otherwise repeat every run index.
+#
+# Usage:
+# python store.py results/arya-jaime                (row count, win rates & injury codes of a store)
+# python store.py results/arya-jaime --check        (exits 1 if a taken-out combatant shows no critical injury)
+######################################################################################################
+
+import argparse
+import array
+import json
+import mmap
+import os
+import sys
+
+CHUNK_ROWS = 65536                                          # Rows Buffered Between Appends
+BASE_COLUMNS = (("run", "q"), ("seed", "Q"), ("stratum", "h"), ("mirror", "b"), ("winner", "b"), ("rounds", "i"))  # Name, Typecode
+MORALE_TYPE = "i"
+INJURY_TYPE = "b"
+OUT_TYPE = "b"
+CRITICAL = 1
+FAULT = -1                                                  # Winner Code of a Faulted Duel
+
+######################################################################################################
+# Schema
+######################################################################################################
+
+def numpy_dtype(typecode):
+    """numpy dtype String of an array Typecode on This Machine"""
+    kind = "u" if typecode.isupper() else "i"
+    order = "<" if sys.byteorder == "little" else ">"
+    return f"{order}{kind}{array.array(typecode).itemsize}"
+
+def store_columns(side1_data, side2_data):
+    """Every Column of a Store - Base Columns Then Morale, Injury & Taken Out per Combatant"""
+    columns = list(BASE_COLUMNS)
+    for side, side_data in (("side1", side1_data), ("side2", side2_data)):
+        for position in range(len(side_data)):
+            columns.append((f"{side}_{position}_morale", MORALE_TYPE))
+            columns.append((f"{side}_{position}_injury", INJURY_TYPE))
+            columns.append((f"{side}_{position}_out", OUT_TYPE))
+    return columns
+
+def read_schema(path):
+    """A Store's schema.json"""
+    with open(os.path.join(path, "schema.json"), encoding="utf-8") as f:
+        return json.load(f)
+
+######################################################################################################
+# Writing
+######################################################################################################
+
+class ResultsWriter:
+    """Columnar Per-Duel Rows - Buffered, Appended in Chunks"""
+    def __init__(self, path, side1_data, side2_data, meta=None, append=False):
+
+        self.path = path                                    # Store Directory
+        self.columns = store_columns(side1_data, side2_data)  # (Name, Typecode) per Column
+        self.buffers = [array.array(typecode) for _, typecode in self.columns]  # Rows Not Yet on Disk
+        self.schema = {
+            "columns": [{"name": name, "typecode": typecode, "dtype": numpy_dtype(typecode)} for name, typecode in self.columns],
+            "combatants": {"side1": [spec.get("name") for spec in side1_data],
+                           "side2": [spec.get("name") for spec in side2_data]},
+            "rows": 0,
+            "meta": meta or {},
+        }
+
+        os.makedirs(path, exist_ok=True)
+        if os.path.exists(os.path.join(path, "schema.json")):  # Append to an Existing Store
+            stored = read_schema(path)
+            if stored["rows"] and not append:
+                raise ValueError(f"Invalid results store: {path} already holds {stored['rows']} rows - remove it first")
+            if stored["columns"] != self.schema["columns"]:
+                raise ValueError(f"Invalid results store: {path} holds different combatants")
+            self.schema["rows"] = stored["rows"]
+            for name, typecode in self.columns:             # - Cut Back to Whole Rows
+                with open(self.column_path(name), "ab") as f:
+                    f.truncate(stored["rows"] * array.array(typecode).itemsize)
+        else:
+            for name, _ in self.columns:
+                open(self.column_path(name), "wb").close()
+        self.save_schema()
+
+    def column_path(self, name):
+        """File Holding One Column"""
+        return os.path.join(self.path, name + ".col")
+
+    def append(self, run, seed, outcome, stratum=-1, mirror=False):
+        """Buffer One Duel's Row - Outcome None for an Engine Fault"""
+        buffers = self.buffers
+        buffers[0].append(run)
+        buffers[1].append(seed)
+        buffers[2].append(stratum)
+        buffers[3].append(mirror)
+        if outcome is None:                                 # - Engine Fault
+            buffers[4].append(FAULT)
+            for column in buffers[5:]:
+                column.append(0)
+        else:
+            buffers[4].append(outcome["winner"])
+            buffers[5].append(outcome["rounds"])
+            index = 6
+            for side in ("side1", "side2"):
+                for morale, injury, out in outcome["final"][side]:
+                    buffers[index].append(morale)
+                    buffers[index + 1].append(injury)
+                    buffers[index + 2].append(out)
+                    index += 3
+        if len(buffers[0]) >= CHUNK_ROWS:
+            self.flush()
+
+    def flush(self):
+        """Append Buffered Rows to the Column Files, Then Count Them in the Schema"""
+        if not self.buffers[0]:
+            return
+        rows = len(self.buffers[0])
+        for (name, _), column in zip(self.columns, self.buffers):
+            with open(self.column_path(name), "ab") as f:
+                column.tofile(f)
+            del column[:]
+        self.schema["rows"] += rows
+        self.save_schema()
+
+    def save_schema(self):
+        """Write schema.json Atomically"""
+        temp_path = os.path.join(self.path, "schema.json.tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(self.schema, f, indent=2)
+        os.replace(temp_path, os.path.join(self.path, "schema.json"))
+
+    def close(self, **meta):
+        """Flush the Last Partial Chunk - Any meta Given (e.g. the Seed a Batch Drew) Is Recorded Too"""
+        self.schema["meta"].update(meta)
+        self.flush()
+        self.save_schema()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+######################################################################################################
+# Reading
+######################################################################################################
+
+def open_store(path):
+    """Schema & Memory-Mapped Columns of a Store - {Name: memoryview}, Nothing Loaded Up Front"""
+    schema = read_schema(path)
+    rows = schema["rows"]
+    columns = {}
+    for column in schema["columns"]:
+        with open(os.path.join(path, column["name"] + ".col"), "rb") as f:
+            if not rows:                                    # - mmap Refuses Empty Files
+                columns[column["name"]] = memoryview(array.array(column["typecode"]))
+                continue
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        columns[column["name"]] = memoryview(mapped).cast(column["typecode"])[:rows]  # - Whole Rows Only
+    return schema, columns
+
+def store_summary(path):
+    """Row Count, Win Rates & Injury Code Counts - Read Straight From the Mapped Columns"""
+    schema, columns = open_store(path)
+    winners = columns["winner"]
+    counts = {code: 0 for code in (FAULT, 0, 1, 2)}
+    for winner in winners:
+        counts[winner] += 1
+    completed = len(winners) - counts[FAULT]
+    injuries = {}
+    for side, names in schema["combatants"].items():
+        for position, name in enumerate(names):
+            codes = [0] * 5
+            for code in columns[f"{side}_{position}_injury"]:
+                codes[code] += 1
+            injuries[f"{side}_{position}"] = {"name": name, "codes": codes}
+    return {
+        "rows": len(winners),
+        "errors": counts[FAULT],
+        "side1_win_rate": counts[1] / completed if completed else 0.0,
+        "side2_win_rate": counts[2] / completed if completed else 0.0,
+        "avg_rounds": sum(columns["rounds"]) / completed if completed else 0.0,
+        "injury_codes": injuries,                           # - Rows per Code, 0 None to 4 Death
+    }
+
+def untreated_takeouts(path):
+    """Rows Where a Taken-Out Combatant Has No Critical Injury Recorded - (Run, Seed, Combatant) Each"""
+    schema, columns = open_store(path)
+    found = []
+    for side, names in schema["combatants"].items():
+        for position in range(len(names)):
+            outs = columns[f"{side}_{position}_out"]
+            injuries = columns[f"{side}_{position}_injury"]
+            for row, out in enumerate(outs):
+                if out and injuries[row] < CRITICAL:
+                    found.append((columns["run"][row], columns["seed"][row], f"{side}_{position}"))
+    return found
+
+######################################################################################################
+# CLI Interface
+######################################################################################################
+
+def main(argv=None):
+    """Results Store CLI"""
+    parser = argparse.ArgumentParser(description="Summarize a columnar per-duel results store.")
+    parser.add_argument("store", help="store directory (one per batch)")
+    parser.add_argument("--check", action="store_true", help="exit 1 if a taken-out combatant has no critical injury recorded")
+    args = parser.parse_args(argv)
+
+    if args.check:
+        found = untreated_takeouts(args.store)
+        for run, seed, combatant in found:
+            print(f"run {run} (seed {seed}): {combatant} taken out without a critical injury")
+        print(f"{len(found)} row(s) with an untreated take-out", file=sys.stderr)
+        sys.exit(1 if found else 0)
+    json.dump(store_summary(args.store), sys.stdout, indent=2)
+    print()
+
+if __name__ == "__main__":
+    main()
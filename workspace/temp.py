@@ -46,6 +46,7 @@ class Character:
 
         # Injury / Perk States
         self.injuries_count = 0                 # total injuries sustained (minor or major)
+        self.critical_injuries = 0              # how many of those were critical injuries
         self.major_injuries_ignored = 0         # how many major injury penalties can be ignored (set by Indomitable)
         self.berserker_triggered = False        # whether Bloodlust (Berserker T1) has triggered the rage buff
         self.berserker_rampage_rounds = 0       # rounds remaining to fight after hitting 0 HP (Berserker T2)
@@ -54,6 +55,27 @@ class Character:
         self.reroll_protection_used = False     # whether Shield Specialist T3 injury reroll was used in current round
         self.old_man_buff: bool = False         # starts inactive
 
+    # Per-run state - everything a duel changes (names, perks & thresholds stay put)
+    STATE_FIELDS = ("base_speed", "base_attack", "base_defense", "base_morale",
+                    "current_speed", "current_attack", "current_defense", "current_morale",
+                    "injuries_count", "critical_injuries", "major_injuries_ignored", "berserker_triggered",
+                    "berserker_rampage_rounds", "used_ff_reroll", "used_ff_opp_reroll",
+                    "reroll_protection_used", "old_man_buff", "combat_type")
+
+    def snapshot(self) -> tuple:
+        """Capture the per-run state as a flat tuple (see STATE_FIELDS)."""
+        return tuple([getattr(self, field) for field in Character.STATE_FIELDS])
+
+    def restore(self, state: tuple) -> None:
+        """Reset the per-run state from a snapshot() tuple."""
+        self.__dict__.update(zip(Character.STATE_FIELDS, state))
+
+    def clone(self) -> "Character":
+        """Cheap copy sharing the read-only perk list - pair with snapshot()/restore() between runs."""
+        twin = Character.__new__(Character)
+        twin.__dict__.update(self.__dict__)
+        return twin
+
     def apply_age_malus(self):
         """Apply age-based stat maluses, reduced by Duelist perks. This modifies base stats in-place."""
         malus = 0
@@ -364,16 +386,24 @@ def resolve_injury_roll(table, mode="nonlethal"):
                 return result
     return "Minor Injury"
 
-def apply_critical_injury(victim: "Character", log: list) -> None:
+def apply_critical_injury(victim: "Character", log: list, verbose: bool = True) -> None:
     """Roll on CRITICAL_INJURY_TABLE and apply the effect."""
     roll = random.randint(1, 20)
     name, fn = CRITICAL_INJURY_TABLE[roll]
     fn(victim)
     victim.injuries_count += 1
-    log.append(f"{victim.name} suffers a **Critical Injury – {name}!**")
+    victim.critical_injuries += 1
+    if verbose:
+        log.append(f"{victim.name} suffers a **Critical Injury – {name}!**")
     if name == "Death":
         victim.current_morale = 0
 
+def record_primary_injury(victim: "Character", outcome: str) -> None:
+    """Count a primary-injury outcome against the victim (every outcome is one injury)."""
+    victim.injuries_count += 1
+    if outcome == "Critical Injury":
+        victim.critical_injuries += 1
+
 def switch_to_melee_context(char: "Character") -> None:
     """
     Convert a ranged combatant to melee stats after the volley phase.
@@ -414,10 +444,12 @@ def switch_to_melee_context(char: "Character") -> None:
     char.combat_type = "melee"
 
 
-def simulate_round(team_a: List[Character], team_b: List[Character], duel_type: str, round_num: int) -> str:
+def simulate_round(team_a: List[Character], team_b: List[Character], duel_type: str, round_num: int,
+                   verbose: bool = True) -> dict:
     """
     Simulate a single round of combat between two teams.
-    Returns a log string describing actions this round.
+    Returns an outcome record: {"status": "played" | "tied" | "retry" | "idle", "log": str}.
+    The log is only built when verbose is True.
     """
     log = []
     # All combatants roll initiative
@@ -432,19 +464,21 @@ def simulate_round(team_a: List[Character], team_b: List[Character], duel_type:
             total, d1, d2 = roll_2d20()        # fresh dice
         total += char.current_speed  # add Speed stat
         rolls.append((total, d1, d2, char))
-        log.append(f"Round {round_num}: "
-                   f"{char.name} rolls {d1} + {d2} + Spd{char.current_speed} = {total}")
+        if verbose:
+            log.append(f"Round {round_num}: "
+                       f"{char.name} rolls {d1} + {d2} + Spd{char.current_speed} = {total}")
     # Determine highest roll
     rolls.sort(key=lambda x: x[0], reverse=True)  # sort by total descending
     # Check for tie for highest
     if len(rolls) == 0:
-        return ""  # no one to act
+        return {"status": "idle", "log": ""}  # no one to act
     highest_total = rolls[0][0] if rolls else 0
     tied = [entry for entry in rolls if entry[0] == highest_total]
     if len(tied) > 1:
         # Tie for top initiative: no attack this round
-        log.append(f"Round {round_num}: **No clear initiative winner** (tie at {highest_total}). Both sides hesitate.")
-        return "\n".join(log)
+        if verbose:
+            log.append(f"Round {round_num}: **No clear initiative winner** (tie at {highest_total}). Both sides hesitate.")
+        return {"status": "tied", "log": "\n".join(log)}
 
     # Otherwise, we have a clear winner
     total, d1, d2, attacker = rolls[0]
@@ -456,7 +490,7 @@ def simulate_round(team_a: List[Character], team_b: List[Character], duel_type:
 
     # If opponent team is empty (shouldn't happen because duel would end), just return
     if not opponent_team:
-        return ""
+        return {"status": "idle", "log": ""}
 
     # Critical checks for attacker (initiative winner) and defender (highest opponent)
     # We consider only attacker's dice for crit success, and also check if defender rolled a 1 for crit fail scenario.
@@ -467,9 +501,10 @@ def simulate_round(team_a: List[Character], team_b: List[Character], duel_type:
     # Favored by Fortune T2: if attacker rolled a 20 and defender has FavFort T2 unused, force reroll of initiative
     if has20 and not has1 and "Favored by Fortune T2" in defender.perks and not defender.used_ff_opp_reroll:
         defender.used_ff_opp_reroll = True
-        log.append(f"Round {round_num}: {defender.name}'s **Favored by Fortune T2** triggers! The opponent's critical initiative is nullified - rerolling the round.")
+        if verbose:
+            log.append(f"Round {round_num}: {defender.name}'s **Favored by Fortune T2** triggers! The opponent's critical initiative is nullified - rerolling the round.")
         # We signal to the outer simulation loop that we should redo this round by returning a special marker.
-        return "RETRY"
+        return {"status": "retry", "log": "\n".join(log)}
 
     # Determine if critical strike or failure apply:
     # Critical Strike if any 20 and attacker actually won initiative
@@ -500,15 +535,16 @@ def simulate_round(team_a: List[Character], team_b: List[Character], duel_type:
     # So above is correct: if defender rolled a 1 on any die, it's a crit fail for them.
 
     # Log initiative result
-    roll_desc = f"{attacker.name} (Initiative {total}"
-    if has20 or has1:
-        roll_desc += " ["
-        if has20: roll_desc += "nat20!"
-        if has20 and has1: roll_desc += " "
-        if has1: roll_desc += "nat1!"
-        roll_desc += "]"
-    roll_desc += f") wins initiative and attacks {defender.name}."
-    log.append(f"Round {round_num}: {roll_desc}")
+    if verbose:
+        roll_desc = f"{attacker.name} (Initiative {total}"
+        if has20 or has1:
+            roll_desc += " ["
+            if has20: roll_desc += "nat20!"
+            if has20 and has1: roll_desc += " "
+            if has1: roll_desc += "nat1!"
+            roll_desc += "]"
+        roll_desc += f") wins initiative and attacks {defender.name}."
+        log.append(f"Round {round_num}: {roll_desc}")
 
     # Critical Strike effects
     if critical_strike:
@@ -522,7 +558,8 @@ def simulate_round(team_a: List[Character], team_b: List[Character], duel_type:
         # Apply malus to defender's highest stat
         key_stat = defender.highest_stat()
         defender.apply_malus(key_stat, malus_amount)
-        log.append(f"**Critical Strike!** {defender.name} suffers –{malus_amount} {key_stat} and a secondary injury.")
+        if verbose:
+            log.append(f"**Critical Strike!** {defender.name} suffers –{malus_amount} {key_stat} and a secondary injury.")
         # Secondary injury roll for defender
         result = resolve_injury_roll(SECONDARY_INJURY_TABLE)
         # Shield Specialist T3 reroll if needed
@@ -530,27 +567,32 @@ def simulate_round(team_a: List[Character], team_b: List[Character], duel_type:
             defender.reroll_protection_used = True
             reroll_result = resolve_injury_roll(SECONDARY_INJURY_TABLE)
             result = reroll_result  # take the second result
-            log.append(f"{defender.name}'s Shield Specialist T3 lets them **reroll** the injury; new result: **{result}**.")
+            if verbose:
+                log.append(f"{defender.name}'s Shield Specialist T3 lets them **reroll** the injury; new result: **{result}**.")
         # Handle injury result
         if result == "Death":
-            log.append(f"{defender.name} suffers a **fatal injury**!")
+            if verbose:
+                log.append(f"{defender.name} suffers a **fatal injury**!")
             defender.injuries_count += 1
             defender.current_morale = 0  # ensure they are down
         elif result == "Critical Injury":
-            apply_critical_injury(defender, log)
+            apply_critical_injury(defender, log, verbose)
         elif result == "Major Injury":
-            log.append(f"{defender.name} suffers a **Major Injury**!")
+            if verbose:
+                log.append(f"{defender.name} suffers a **Major Injury**!")
             defender.injuries_count += 1
             # Major Injury imposes -1 to all stats, unless Indomitable can ignore
             if defender.major_injuries_ignored > 0:
                 defender.major_injuries_ignored -= 1
-                log.append(f"{defender.name} pushes through the pain (Indomitable perk negates stat penalty).")
+                if verbose:
+                    log.append(f"{defender.name} pushes through the pain (Indomitable perk negates stat penalty).")
             else:
                 defender.current_speed   -= 2
                 defender.current_attack  -= 2
                 defender.current_defense -= 2
         elif result == "Minor Injury":
-            log.append(f"{defender.name} suffers a **Minor Injury**.")
+            if verbose:
+                log.append(f"{defender.name} suffers a **Minor Injury**.")
             defender.injuries_count += 1
             key = defender.highest_stat()
             defender.apply_malus(key, 1)
@@ -560,7 +602,8 @@ def simulate_round(team_a: List[Character], team_b: List[Character], duel_type:
             defender.berserker_triggered = True
             defender.current_speed += 2
             defender.current_attack += 2
-            log.append(f"{defender.name} enters a **Bloodlust** fury! (+2 Speed, +2 Attack)")
+            if verbose:
+                log.append(f"{defender.name} enters a **Bloodlust** fury! (+2 Speed, +2 Attack)")
 
     # Critical Failure effects
     if critical_failure:
@@ -572,31 +615,37 @@ def simulate_round(team_a: List[Character], team_b: List[Character], duel_type:
             malus_amount = 2  # no change
         key_stat = defender.highest_stat()
         defender.apply_malus(key_stat, malus_amount)
-        log.append(f"**Critical Failure!** {defender.name} stumbles, suffering –{malus_amount} {key_stat} and a secondary injury.")
+        if verbose:
+            log.append(f"**Critical Failure!** {defender.name} stumbles, suffering –{malus_amount} {key_stat} and a secondary injury.")
         result = resolve_injury_roll(SECONDARY_INJURY_TABLE)
         if result in ("Critical Injury", "Major Injury") and "Shield Specialist T3" in defender.perks and not defender.reroll_protection_used:
             defender.reroll_protection_used = True
             reroll_result = resolve_injury_roll(SECONDARY_INJURY_TABLE)
             result = reroll_result
-            log.append(f"{defender.name}'s Shield Specialist T3 rerolls the injury; new result: **{result}**.")
+            if verbose:
+                log.append(f"{defender.name}'s Shield Specialist T3 rerolls the injury; new result: **{result}**.")
         if result == "Death":
-            log.append(f"{defender.name} suffers a **fatal self-injury**!")
+            if verbose:
+                log.append(f"{defender.name} suffers a **fatal self-injury**!")
             defender.injuries_count += 1
             defender.current_morale = 0
         elif result == "Critical Injury":
-            apply_critical_injury(defender, log)
+            apply_critical_injury(defender, log, verbose)
         elif result == "Major Injury":
-            log.append(f"{defender.name} suffers a **Major Injury** from the mishap!")
+            if verbose:
+                log.append(f"{defender.name} suffers a **Major Injury** from the mishap!")
             defender.injuries_count += 1
             if defender.major_injuries_ignored > 0:
                 defender.major_injuries_ignored -= 1
-                log.append(f"{defender.name}'s Indomitable grit negates the injury's stat penalty.")
+                if verbose:
+                    log.append(f"{defender.name}'s Indomitable grit negates the injury's stat penalty.")
             else:
                 defender.current_speed   -= 2
                 defender.current_attack  -= 2
                 defender.current_defense -= 2
         elif result == "Minor Injury":
-            log.append(f"{defender.name} suffers a **Minor Injury** from the mishap.")
+            if verbose:
+                log.append(f"{defender.name} suffers a **Minor Injury** from the mishap.")
             defender.injuries_count += 1
             key = defender.highest_stat()
             defender.apply_malus(key, 1)
@@ -605,42 +654,47 @@ def simulate_round(team_a: List[Character], team_b: List[Character], duel_type:
             defender.berserker_triggered = True
             defender.current_speed += 2
             defender.current_attack += 2
-            log.append(f"{defender.name} flies into a **Bloodlust** rage! (+2 Speed, +2 Attack)")
+            if verbose:
+                log.append(f"{defender.name} flies into a **Bloodlust** rage! (+2 Speed, +2 Attack)")
 
     # Perform the attack roll (if any attack occurs, i.e., initiative not tied)
     # We already chose 'attacker' and 'defender'. If either was removed due to a death injury from crit, skip attack.
     if attacker.current_morale <= 0 or defender.current_morale <= 0:
         # Someone died from a critical event before the attack could resolve.
         # We will end the round here.
-        return "\n".join(log)
+        return {"status": "played", "log": "\n".join(log)}
     # Calculate attack-roll damage (verbose version)
     ad1, ad2, ad3, dice_sum = roll_3d5_detail()                 # three individual d5
     raw_total = dice_sum + attacker.current_attack - defender.current_defense
     attack_roll = max(raw_total, 1)                            # cannot be less than 1
     defender.take_damage(attack_roll)
 
-    log.append(f"{attacker.name} attack dice: {ad1}+{ad2}+{ad3}={dice_sum}  "
-               f"+Atk{attacker.current_attack} −Def{defender.current_defense} "
-               f"= {raw_total if raw_total>0 else 1} damage  "
-               f"(morale ➞ {defender.current_morale})")
+    if verbose:
+        log.append(f"{attacker.name} attack dice: {ad1}+{ad2}+{ad3}={dice_sum}  "
+                   f"+Atk{attacker.current_attack} −Def{defender.current_defense} "
+                   f"= {raw_total if raw_total>0 else 1} damage  "
+                   f"(morale ➞ {defender.current_morale})")
 
 
     # Berserker T2: if defender was reduced to 0 or below by this attack and defender has Berserker perk (T2)
     if defender.current_morale <= 0 and "Berserker" in defender.perks and defender.berserker_rampage_rounds == 0:
         # Trigger berserker rampage: get 1-3 extra rounds of fighting
         defender.berserker_rampage_rounds = random.randint(1, 3)
-        log.append(f"{defender.name} enters a **Berserker rage** and fights on for {defender.berserker_rampage_rounds} more round(s) despite mortal wounds!")
+        if verbose:
+            log.append(f"{defender.name} enters a **Berserker rage** and fights on for {defender.berserker_rampage_rounds} more round(s) despite mortal wounds!")
         # Increase morale slightly above 0 to keep them "alive" during rage (could also just flag them as unkillable for rounds)
         defender.current_morale = 1
 
     # Check target's morale against threshold for yielding
     if defender.current_morale > 0 and defender.current_morale <= defender.morale_threshold:
         # Defender yields (forfeit)
-        log.append(f"{defender.name} has reached morale threshold ({defender.current_morale} ≤ {defender.morale_threshold}) and **yields** the fight.")
+        if verbose:
+            log.append(f"{defender.name} has reached morale threshold ({defender.current_morale} ≤ {defender.morale_threshold}) and **yields** the fight.")
         defender.current_morale = 0  # mark as out (0 or below means out)
     # Check target's injury threshold for yielding
     if defender.current_morale > 0 and defender.injuries_count >= defender.injury_threshold > 0:
-        log.append(f"{defender.name} has suffered {defender.injuries_count} injuries (≥ {defender.injury_threshold}) and **can no longer continue**.")
+        if verbose:
+            log.append(f"{defender.name} has suffered {defender.injuries_count} injuries (≥ {defender.injury_threshold}) and **can no longer continue**.")
         defender.current_morale = 0
 
     # After main attack, handle free attacks from extras if any (outnumbering)
@@ -650,7 +704,7 @@ def simulate_round(team_a: List[Character], team_b: List[Character], duel_type:
     # Recalculate sides (because someone might have dropped to 0 in this attack)
     # If either side now has no fighters active, we skip free attacks as combat effectively ends.
     if team_a_count == 0 or team_b_count == 0:
-        return "\n".join(log)
+        return {"status": "played", "log": "\n".join(log)}
     if team_a_count and team_b_count:
         if team_a_count > team_b_count:
             larger_team = team_a; smaller_team = team_b
@@ -705,42 +759,115 @@ def simulate_round(team_a: List[Character], team_b: List[Character], duel_type:
                 # Free attack damage
                 fd1, fd2, fd3, fsum = roll_3d5_detail()
                 dmg = max(fsum + extra_attacker.current_attack - extra_target.current_defense, 1)
-                log.append(f"[Free] {extra_attacker.name} dice {fd1}+{fd2}+{fd3}={fsum} "
-                           f"+Atk{extra_attacker.current_attack} −Def{extra_target.current_defense} → {dmg}")
+                if verbose:
+                    log.append(f"[Free] {extra_attacker.name} dice {fd1}+{fd2}+{fd3}={fsum} "
+                               f"+Atk{extra_attacker.current_attack} −Def{extra_target.current_defense} → {dmg}")
                 if dmg < 1: 
                     dmg = 1
                 extra_target.take_damage(dmg)
-                log.append(f"**Free Attack:** {extra_attacker.name} hits {extra_target.name} for {dmg} damage! ({extra_target.current_morale} morale left)")
+                if verbose:
+                    log.append(f"**Free Attack:** {extra_attacker.name} hits {extra_target.name} for {dmg} damage! ({extra_target.current_morale} morale left)")
                 # Check results of free attack on target
                 if extra_target.current_morale <= 0:
                     # Target downed by free attack -> primary injury
-                    log.append(f"{extra_target.name} is down to 0 morale from the free attack!")
+                    if verbose:
+                        log.append(f"{extra_target.name} is down to 0 morale from the free attack!")
                     # We roll primary injury (nonlethal assumption here)
                     outcome = resolve_injury_roll(PRIMARY_INJURY_TABLE, mode="nonlethal")
                     if outcome == "Death":
-                        log.append(f"{extra_target.name} is **killed** in combat!")
+                        if verbose:
+                            log.append(f"{extra_target.name} is **killed** in combat!")
                     elif outcome == "Critical Injury":
-                        log.append(f"{extra_target.name} sustains a **Critical Injury**!")
+                        if verbose:
+                            log.append(f"{extra_target.name} sustains a **Critical Injury**!")
                     elif outcome == "Major Injury":
-                        log.append(f"{extra_target.name} sustains a **Major Injury** and is incapacitated!")
+                        if verbose:
+                            log.append(f"{extra_target.name} sustains a **Major Injury** and is incapacitated!")
                     else:
-                        log.append(f"{extra_target.name} is incapacitated with a **minor injury**.")
-                    extra_target.injuries_count += 1
+                        if verbose:
+                            log.append(f"{extra_target.name} is incapacitated with a **minor injury**.")
+                    record_primary_injury(extra_target, outcome)
                     # We don't apply additional stat malus here because fight is basically over for them.
                 elif extra_target.current_morale <= extra_target.morale_threshold and extra_target.current_morale > 0:
-                    log.append(f"{extra_target.name} falls to morale {extra_target.current_morale} (≤ threshold) and **yields**.")
+                    if verbose:
+                        log.append(f"{extra_target.name} falls to morale {extra_target.current_morale} (≤ threshold) and **yields**.")
                     extra_target.current_morale = 0
                 if extra_target.current_morale > 0 and extra_target.injuries_count >= extra_target.injury_threshold > 0:
-                    log.append(f"{extra_target.name} has reached {extra_target.injuries_count} injuries (≥ threshold) and cannot continue.")
+                    if verbose:
+                        log.append(f"{extra_target.name} has reached {extra_target.injuries_count} injuries (≥ threshold) and cannot continue.")
                     extra_target.current_morale = 0
 
-    return "\n".join(log)
+    return {"status": "played", "log": "\n".join(log)}
+
+def fear_the_old_man(team: List[Character], own_count: int, enemy_count: int) -> None:
+    """
+    Fear the Old Man: +3 Speed/Attack/Defense while the side is outnumbered by 4 or more,
+    removed again once that no longer holds.
+    """
+    outnumbered = enemy_count >= own_count + 4
+    for char in team:
+        if "Fear the Old Man" in char.perks and char.old_man_buff != outnumbered:
+            char.old_man_buff = outnumbered
+            change = 3 if outnumbered else -3
+            char.current_speed   += change
+            char.current_attack  += change
+            char.current_defense += change
+
+class RoundTriggers:
+    """
+    Round-start perk triggers for simulate_duel.
+    The triggers depend only on each side's living count, so they are re-fired only when a count
+    changes. Counts, not list lengths: a Berserker on its rampage stays in its team at 0 morale.
+    """
+    def __init__(self, team_a: List[Character], team_b: List[Character]):
+        """
+        :param team_a: Side A at the start of the main rounds.
+        :param team_b: Side B at the start of the main rounds.
+        """
+        self.counts = None  # living counts at the last check
+        self.old_men = [any("Fear the Old Man" in c.perks for c in team) for team in (team_a, team_b)]
+
+    def round_start(self, team_a: List[Character], team_b: List[Character]) -> None:
+        """Fire the triggers whose condition may have flipped since the last check."""
+        if not any(self.old_men):
+            return
+        count_a = sum(1 for c in team_a if c.current_morale > 0)
+        count_b = sum(1 for c in team_b if c.current_morale > 0)
+        if (count_a, count_b) == self.counts:
+            return
+        self.counts = (count_a, count_b)
+        if self.old_men[0]:
+            fear_the_old_man(team_a, count_a, count_b)
+        if self.old_men[1]:
+            fear_the_old_man(team_b, count_b, count_a)
+
+def duel_outcome(winner: Optional[str], rounds: int, roster: list, log_lines: List[str]) -> dict:
+    """
+    Build a duel's outcome record.
+    :param winner: "A", "B" or None for a draw.
+    :param rounds: Rounds fought after any volley phase (initiative ties count, rerolled rounds don't).
+    :param roster: (character, side, injuries at start, critical injuries at start) for every combatant.
+    :param log_lines: Log lines gathered so far (empty when not verbose).
+    """
+    return {
+        "winner": winner,
+        "rounds": rounds,
+        "characters": [{"name": char.name,
+                        "side": side,
+                        "injuries": char.injuries_count - injuries,
+                        "critical_injuries": char.critical_injuries - criticals}
+                       for char, side, injuries, criticals in roster],
+        "log": "\n".join(log_lines),
+    }
 
 def simulate_duel(team_a: List[Character], team_b: List[Character],
-                  duel_type: str = "melee", max_rounds: int = 100) -> str:
+                  duel_type: str = "melee", max_rounds: int = 100, verbose: bool = True) -> dict:
     """
     Simulate a duel between team A and team B.
     Supports 'melee', 'ranged', or 'mixed' (ranged vs melee) openings.
+    Returns an outcome record: {"winner": "A" | "B" | None, "rounds": int,
+    "characters": [{"name", "side", "injuries", "critical_injuries"}, ...], "log": str}.
+    The log is only built when verbose is True.
     """
     # ── apply static perk bonuses before combat ──
     if duel_type == "mixed":
@@ -752,6 +879,9 @@ def simulate_duel(team_a: List[Character], team_b: List[Character],
 
     log_lines: List[str] = []
     round_num = 1
+    rounds_fought = 0
+    roster = [(c, side, c.injuries_count, c.critical_injuries)
+              for side, team in (("A", team_a), ("B", team_b)) for c in team]
 
     # ───────────────────────── volley phase (Fix # 6) ─────────────────────────
     if duel_type == "mixed":
@@ -776,27 +906,33 @@ def simulate_duel(team_a: List[Character], team_b: List[Character],
                 m_total, md1, md2 = roll_2d20()
                 m_total += target.current_speed
 
-                volley_desc = (
-                    f"Volley {v}: {shooter.name} rolls "
-                    f"{sd1}+{sd2}+Spd{shooter.current_speed} = {r_total}. "
-                )
+                if verbose:
+                    volley_desc = (
+                        f"Volley {v}: {shooter.name} rolls "
+                        f"{sd1}+{sd2}+Spd{shooter.current_speed} = {r_total}. "
+                    )
 
                 if r_total >= 30:
                     dmg = max(roll_3d5() + shooter.current_attack - target.current_defense, 1)
                     target.take_damage(dmg)
-                    volley_desc += (
-                        f"**Hit** for {dmg} (morale {target.current_morale})."
-                    )
+                    if verbose:
+                        volley_desc += (
+                            f"**Hit** for {dmg} (morale {target.current_morale})."
+                        )
 
                     # yield / death checks
                     if target.current_morale <= 0:
                         outcome = resolve_injury_roll(PRIMARY_INJURY_TABLE, mode="live")
-                        volley_desc += f" {target.name} falls – {outcome}!"
+                        record_primary_injury(target, outcome)
+                        if verbose:
+                            volley_desc += f" {target.name} falls – {outcome}!"
                     elif target.current_morale <= target.morale_threshold:
-                        volley_desc += f" {target.name} yields!"
+                        if verbose:
+                            volley_desc += f" {target.name} yields!"
                         target.current_morale = 0
                 else:
-                    volley_desc += "Misses the shot."
+                    if verbose:
+                        volley_desc += "Misses the shot."
 
                 # Counter-throw on the last volley for Thrown-Spec T2/T3
                 if v == volley_rounds and (
@@ -809,35 +945,44 @@ def simulate_duel(team_a: List[Character], team_b: List[Character],
                             1
                         )
                         shooter.take_damage(tdmg)
-                        volley_desc += (
-                            f"  {target.name} retaliates – hits for {tdmg} "
-                            f"(morale {shooter.current_morale})."
-                        )
+                        if verbose:
+                            volley_desc += (
+                                f"  {target.name} retaliates – hits for {tdmg} "
+                                f"(morale {shooter.current_morale})."
+                            )
                         if shooter.current_morale <= 0:
                             outcome = resolve_injury_roll(PRIMARY_INJURY_TABLE, mode="live")
-                            volley_desc += f" {shooter.name} falls – {outcome}!"
+                            record_primary_injury(shooter, outcome)
+                            if verbose:
+                                volley_desc += f" {shooter.name} falls – {outcome}!"
                         elif shooter.current_morale <= shooter.morale_threshold:
-                            volley_desc += f" {shooter.name} yields!"
+                            if verbose:
+                                volley_desc += f" {shooter.name} yields!"
                             shooter.current_morale = 0
 
-                log_lines.append(volley_desc)
+                if verbose:
+                    log_lines.append(volley_desc)
 
             # Free closing strike once melee reaches contact
             if melee_side and ranged_side and target.current_morale > 0 and shooter.current_morale > 0:
                 d1, d2, d3, total_3d5 = roll_3d5_detail()
                 dmg = max(total_3d5 + target.current_attack - shooter.current_defense, 1)
                 shooter.take_damage(dmg)
-                log_lines.append(
-                    f"Closing-strike: {target.name} rolls {d1}+{d2}+{d3}={total_3d5}"
-                    f" +Atk{target.current_attack} −Def{shooter.current_defense} → {dmg} "
-                    f"(morale {shooter.current_morale})."
-                )
+                if verbose:
+                    log_lines.append(
+                        f"Closing-strike: {target.name} rolls {d1}+{d2}+{d3}={total_3d5}"
+                        f" +Atk{target.current_attack} −Def{shooter.current_defense} → {dmg} "
+                        f"(morale {shooter.current_morale})."
+                    )
                 if shooter.current_morale <= 0:
                     outcome = resolve_injury_roll(PRIMARY_INJURY_TABLE, mode="live")
-                    log_lines.append(f"{shooter.name} falls – {outcome}!")
+                    record_primary_injury(shooter, outcome)
+                    if verbose:
+                        log_lines.append(f"{shooter.name} falls – {outcome}!")
                 elif shooter.current_morale <= shooter.morale_threshold:
                     shooter.current_morale = 0
-                    log_lines.append(f"{shooter.name} yields after the strike!")
+                    if verbose:
+                        log_lines.append(f"{shooter.name} yields after the strike!")
 
             # Remove any combatants who yielded or died
             team_a = [c for c in team_a if c.current_morale > 0]
@@ -851,59 +996,31 @@ def simulate_duel(team_a: List[Character], team_b: List[Character],
 
             # Early victory check
             if not team_a or not team_b:
-                winner = "Side A" if team_a else "Side B"
-                log_lines.append(f"**{winner} wins** after the volley phase!")
-                return "\n".join(log_lines)
+                winner = "A" if team_a else "B"
+                if verbose:
+                    log_lines.append(f"**Side {winner} wins** after the volley phase!")
+                return duel_outcome(winner, 0, roster, log_lines)
 
     # Main combat rounds
+    triggers = RoundTriggers(team_a, team_b)
     while round_num <= max_rounds:
         # Reset Shield Specialist T3 reroll usage at start of each round
         for char in team_a + team_b:
             char.reroll_protection_used = False
-        # Apply dynamic perk effects at round start (Fear the Old Man)
-        count_a = sum(1 for c in team_a if c.current_morale > 0)
-        count_b = sum(1 for c in team_b if c.current_morale > 0)
-        for char in team_a:
-            if "Fear the Old Man" in char.perks:
-                # If outnumbered by 4 or more (enemy count >= char side count + 4)
-                if count_b >= count_a + 4:
-                    # Apply +3 all stats (if not already applied; we'll assume can stack or reapply fresh each time based on condition)
-                    if not hasattr(char, 'old_man_buff') or not char.old_man_buff:
-                        char.old_man_buff = True
-                        char.current_speed += 3
-                        char.current_attack += 3
-                        char.current_defense += 3
-                else:
-                    # Remove buff if previously applied and condition no longer holds
-                    if hasattr(char, 'old_man_buff') and char.old_man_buff:
-                        char.old_man_buff = False
-                        char.current_speed   -= 3
-                        char.current_attack  -= 3
-                        char.current_defense -= 3
-        for char in team_b:
-            if "Fear the Old Man" in char.perks:
-                if count_a >= count_b + 4:
-                    if not hasattr(char, 'old_man_buff') or not char.old_man_buff:
-                        char.old_man_buff = True
-                        char.current_speed += 3
-                        char.current_attack += 3
-                        char.current_defense += 3
-                else:
-                    if hasattr(char, 'old_man_buff') and char.old_man_buff:
-                        char.old_man_buff = False
-                        char.current_speed   -= 3
-                        char.current_attack  -= 3
-                        char.current_defense -= 3
+        # Apply dynamic perk effects at round start (Fear the Old Man) - only re-checked when a living count changes
+        triggers.round_start(team_a, team_b)
 
         # Perform one round
-        round_log = simulate_round(team_a, team_b, duel_type, round_num)
-        if not round_log:
+        round_result = simulate_round(team_a, team_b, duel_type, round_num, verbose)
+        if round_result["status"] == "idle":
             # No action (e.g., if no characters, or other break condition)
             break
-        if round_log.strip() == "RETRY":
+        if round_result["status"] == "retry":
             # Favored by Fortune T2 triggered a reroll of the round
             continue  # redo the same round number without incrementing
-        log_lines.append(round_log)
+        rounds_fought += 1
+        if verbose:
+            log_lines.append(round_result["log"])
         # Remove defeated characters (morale <= 0 means out)
         team_a = [c for c in team_a if c.current_morale > 0 or c.berserker_rampage_rounds > 0]
         team_b = [c for c in team_b if c.current_morale > 0 or c.berserker_rampage_rounds > 0]
@@ -914,7 +1031,8 @@ def simulate_duel(team_a: List[Character], team_b: List[Character],
                 if combatant.berserker_rampage_rounds == 0:
                     # Berserker time ended; if they're below 1 morale, they collapse now
                     if combatant.current_morale <= 0:
-                        log_lines.append(f"{combatant.name}'s berserker rage ends and they finally collapse!")
+                        if verbose:
+                            log_lines.append(f"{combatant.name}'s berserker rage ends and they finally collapse!")
                         # They are likely already removed next loop, but ensure morale is 0
                         combatant.current_morale = 0
         # Remove any who collapsed after berserker rage ended
@@ -926,13 +1044,19 @@ def simulate_duel(team_a: List[Character], team_b: List[Character],
         round_num += 1
 
     # Determine outcome
+    winner = None
     if team_a and not team_b:
-        log_lines.append(f"**Side A wins!** {', '.join([c.name for c in team_a])} are victorious.\n")
+        winner = "A"
+        if verbose:
+            log_lines.append(f"**Side A wins!** {', '.join([c.name for c in team_a])} are victorious.\n")
     elif team_b and not team_a:
-        log_lines.append(f"**Side B wins!** {', '.join([c.name for c in team_b])} are victorious.\n")
+        winner = "B"
+        if verbose:
+            log_lines.append(f"**Side B wins!** {', '.join([c.name for c in team_b])} are victorious.\n")
     else:
-        log_lines.append("⚖️ The duel ends in a **draw** (max rounds reached or mutual defeat).\n")
-    return "\n".join(log_lines)
+        if verbose:
+            log_lines.append("⚖️ The duel ends in a **draw** (max rounds reached or mutual defeat).\n")
+    return duel_outcome(winner, rounds_fought, roster, log_lines)
 
 def simulate_batch(team_a: List[Character], team_b: List[Character], duel_type: str = "melee", runs: int = 10000) -> str:
     """
@@ -942,13 +1066,17 @@ def simulate_batch(team_a: List[Character], team_b: List[Character], duel_type:
     a_wins = 0
     b_wins = 0
     rounds_total = 0
-    injuries_a = 0
-    injuries_b = 0
+    injuries = {"A": 0, "B": 0}
+    criticals = {"A": 0, "B": 0}
+    # Clone characters once; each run restores their starting state (to avoid state carry-over)
+    clones_a = [c.clone() for c in team_a]
+    clones_b = [c.clone() for c in team_b]
+    starts = [c.snapshot() for c in team_a + team_b]
     for i in range(runs):
-        # Clone characters for each run (to avoid state carry-over)
-        import copy
-        sim_team_a = [copy.deepcopy(c) for c in team_a]
-        sim_team_b = [copy.deepcopy(c) for c in team_b]
+        for char, state in zip(clones_a + clones_b, starts):
+            char.restore(state)
+        sim_team_a = list(clones_a)
+        sim_team_b = list(clones_b)
         # Re-apply initial perks and stats for each run
         if duel_type == "mixed":
             for char in sim_team_a:
@@ -958,31 +1086,30 @@ def simulate_batch(team_a: List[Character], team_b: List[Character], duel_type:
         else:
             for char in sim_team_a + sim_team_b:
                 char.apply_perks(duel_type)
-        # Simulate duel
-        log = simulate_duel(sim_team_a, sim_team_b, duel_type=duel_type, max_rounds=1000)
-        rounds = log.count("Round")
-        rounds_total += rounds
-        if "wins" in log:
-            if "Side A wins" in log:
-                a_wins += 1
-            elif "Side B wins" in log:
-                b_wins += 1
-        # Count injuries (for simplicity, count total injury rolls from both sides)
-        injuries_a += sum("injury" in line and any(name in line for name in [c.name for c in sim_team_a]) for line in log.splitlines())
-        injuries_b += sum("injury" in line and any(name in line for name in [c.name for c in sim_team_b]) for line in log.splitlines())
+        # Simulate duel (no log text in batch mode)
+        result = simulate_duel(sim_team_a, sim_team_b, duel_type=duel_type, max_rounds=1000, verbose=False)
+        rounds_total += result["rounds"]
+        if result["winner"] == "A":
+            a_wins += 1
+        elif result["winner"] == "B":
+            b_wins += 1
+        for char in result["characters"]:
+            injuries[char["side"]] += char["injuries"]
+            criticals[char["side"]] += char["critical_injuries"]
 
     # Calculate and return statistics
     win_rate_a = a_wins / runs * 100
     win_rate_b = b_wins / runs * 100
     avg_rounds = rounds_total / runs
-    avg_injuries_a = injuries_a / runs
-    avg_injuries_b = injuries_b / runs
+    avg_injuries_a = injuries["A"] / runs
+    avg_injuries_b = injuries["B"] / runs
     summary = (f"Simulated {runs} duels:\n"
                f"- Side A wins: {a_wins} ({win_rate_a:.1f}%)\n"
                f"- Side B wins: {b_wins} ({win_rate_b:.1f}%)\n"
                # f"- Draws: {runs - a_wins - b_wins}\n"
                f"- Average rounds per duel: {avg_rounds:.2f}\n"
-               f"- Average injuries per duel: Side A = {avg_injuries_a:.2f}, Side B = {avg_injuries_b:.2f}\n")
+               f"- Average injuries per duel: Side A = {avg_injuries_a:.2f}, Side B = {avg_injuries_b:.2f}\n"
+               f"- Average critical injuries per duel: Side A = {criticals['A'] / runs:.2f}, Side B = {criticals['B'] / runs:.2f}\n")
     return summary
 
 # --- CLI Interface for user input ---
@@ -1068,7 +1195,7 @@ def main_cli():
         print(summary)
     else:
         # Single simulation
-        result_log = simulate_duel(team_a, team_b, duel_type=duel_type)
+        result_log = simulate_duel(team_a, team_b, duel_type=duel_type)["log"]
         print("\n~~~ Duel Log ~~~\n")
         print(result_log)
 
@@ -0,0 +1,200 @@
+﻿######################################################################################################
+################################# CROWNED DUELS - ROUND-ROBIN TOURNAMENT #############################
+######################################################################################################
+# Builds the pairwise win-probability matrix for a tourney roster under one combat type.
+#
+# - Melee vs Melee and Ranged vs Ranged pairs are simulated once; entrants swap sides every other run
+#   so the side-order advantage cancels, and the result fills both the pairing and its mirror.
+# - Ranged vs Melee is one-sided by design (side one shoots), so both orders are simulated.
+# - Pairs are spread over worker processes, and each finished pair is cached by its definition -
+#   rerunning, or adding entrants to the roster, only simulates pairs not in the cache.
+# - The seed is part of a pair's definition, so cached pairs are only reused under the same seed. A
+#   config without one draws a seed and records it in the cache, and later runs on that cache reuse it.
+# - Partial matrices stream out as pairs finish; cells still running are null.
+#
+# Config Format (JSON):
+# {"combat_data": "Live Melee vs Melee", "runs": 2000, "seed": 1, "max_rounds": 1000,
+#  "entrants": [{"name": "Arya", "age": 18, "perks": ["Born Lucky"]}, {"name": "Jaime", "age": 35}]}
+#
+# Usage: python tournament.py roster.json -o matrix.jsonl --cache pairs.jsonl --workers 8
+######################################################################################################
+
+import argparse
+import json
+import multiprocessing
+import sys
+
+from batch import new_seed, run_duel
+from checkpoint import Checkpoint
+
+######################################################################################################
+# Pairs
+######################################################################################################
+
+def symmetric(combat_data):
+    """Combat Types Where Both Sides Fight Alike"""
+    return "Melee vs Melee" in combat_data or "Ranged vs Ranged" in combat_data
+
+def pairings(entrants, combat_data):
+    """Pairs to Simulate - (Row, Column) Indices"""
+    count = len(entrants)
+    if symmetric(combat_data):                              # - Each Pair Once
+        return [(i, j) for i in range(count) for j in range(i + 1, count)]
+    return [(i, j) for i in range(count) for j in range(count) if i != j]
+
+def pair_job(config, first, second):
+    """Definition of One Pair - Its Cache Key"""
+    return {
+        "combat_data": config["combat_data"],
+        "first": first,
+        "second": second,
+        "runs": config["runs"],
+        "seed": config["seed"],
+        "max_rounds": config["max_rounds"],
+    }
+
+def run_pair(task):
+    """Simulate One Pair - Returns (Row, Column, Result)"""
+    i, j, job = task
+    swap = symmetric(job["combat_data"])
+    result = {"first_wins": 0, "second_wins": 0, "draws": 0, "errors": 0}
+    for index in range(job["runs"]):
+        swapped = swap and index % 2 == 1                   # - Alternate Sides
+        side1, side2 = ([job["second"]], [job["first"]]) if swapped else ([job["first"]], [job["second"]])
+        outcome = run_duel(job["combat_data"], side1, side2, job["seed"], index, job["max_rounds"])
+        if outcome is None:
+            result["errors"] += 1
+        elif outcome["winner"] == 0:
+            result["draws"] += 1
+        elif (outcome["winner"] == 1) != swapped:
+            result["first_wins"] += 1
+        else:
+            result["second_wins"] += 1
+    return i, j, result
+
+def win_chance(result, first=True):
+    """Chance One Entrant of a Pair Wins - Over Completed Runs"""
+    completed = result["first_wins"] + result["second_wins"] + result["draws"]
+    wins = result["first_wins"] if first else result["second_wins"]
+    return wins / completed if completed else None
+
+######################################################################################################
+# Pair Cache
+######################################################################################################
+
+def load_cache(path):
+    """Cached Pair Results by Job Key & the Seed Recorded in the Cache (None if None Was Drawn)"""
+    cache = {}
+    seed = None
+    if path:
+        try:
+            with open(path, encoding="utf-8") as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        if "seed" in entry:                 # - Seed Drawn by an Earlier Run
+                            seed = entry["seed"]
+                        else:
+                            cache[entry["key"]] = entry["result"]
+        except FileNotFoundError:
+            pass
+    return cache, seed
+
+######################################################################################################
+# Tournament
+######################################################################################################
+
+def fill(matrix, i, j, result, combat_data):
+    """Enter a Pair Result - And Its Mirror for Symmetric Combat Types"""
+    matrix[i][j] = win_chance(result, True)
+    if symmetric(combat_data):
+        matrix[j][i] = win_chance(result, False)
+
+def run_tournament(config, workers=1, cache_path=None, every=64, emit=None):
+    """Pairwise Win-Probability Matrix - Row Beats Column"""
+    config = dict(config)
+    config.setdefault("runs", 2000)
+    config.setdefault("max_rounds", 1000)
+    cache, cached_seed = load_cache(cache_path)
+    drawn = config.get("seed") is None and cached_seed is None
+    if config.get("seed") is None:                          # - Reuse the Cache's Seed, Else Draw One
+        config["seed"] = new_seed() if drawn else cached_seed
+    entrants = config["entrants"]
+    combat_data = config["combat_data"]
+    matrix = [[None] * len(entrants) for _ in entrants]
+
+    # Cached Pairs First
+    tasks = []
+    for i, j in pairings(entrants, combat_data):
+        job = pair_job(config, entrants[i], entrants[j])
+        key = Checkpoint.job_key(job)
+        if key in cache:
+            fill(matrix, i, j, cache[key], combat_data)
+        else:
+            tasks.append((i, j, job))
+    done = len(pairings(entrants, combat_data)) - len(tasks)
+    total = done + len(tasks)
+
+    def snapshot(final=False):
+        return {"seed": config["seed"], "done": done, "total": total, "final": final,
+                "entrants": [entrant.get("name") for entrant in entrants], "matrix": matrix}
+
+    # Simulate the Rest
+    pool = multiprocessing.Pool(workers) if workers > 1 and len(tasks) > 1 else None
+    cache_file = open(cache_path, "a", encoding="utf-8") if cache_path else None
+    try:
+        if cache_file and drawn:                            # - Record the Drawn Seed for Later Runs
+            cache_file.write(json.dumps({"seed": config["seed"]}) + "\n")
+            cache_file.flush()
+        results = pool.imap_unordered(run_pair, tasks) if pool else map(run_pair, tasks)
+        for i, j, result in results:
+            fill(matrix, i, j, result, combat_data)
+            done += 1
+            if cache_file:                                  # - Cache As Pairs Finish
+                key = Checkpoint.job_key(pair_job(config, entrants[i], entrants[j]))
+                cache_file.write(json.dumps({"key": key, "result": result}) + "\n")
+                cache_file.flush()
+            if emit is not None and every and done % every == 0 and done < total:
+                emit(snapshot())                            # - Partial Matrix
+    finally:
+        if pool:
+            pool.close()
+            pool.join()
+        if cache_file:
+            cache_file.close()
+
+    final = snapshot(True)
+    if emit is not None:
+        emit(final)
+    return final
+
+######################################################################################################
+# CLI Interface
+######################################################################################################
+
+def main(argv=None):
+    """Round-Robin Tournament CLI"""
+    parser = argparse.ArgumentParser(description="Pairwise win-probability matrix for a tourney roster.")
+    parser.add_argument("config", help="JSON roster config")
+    parser.add_argument("-o", "--output", default="-", help="JSONL matrices file (default: stdout)")
+    parser.add_argument("--cache", help="JSONL pair cache - reused & extended")
+    parser.add_argument("--workers", type=int, default=multiprocessing.cpu_count(), help="worker processes")
+    parser.add_argument("--every", type=int, default=64, help="write a partial matrix every N pairs (0: final only)")
+    args = parser.parse_args(argv)
+
+    with open(args.config, encoding="utf-8-sig") as f:
+        config = json.load(f)
+    out = sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+
+    def emit(snapshot):
+        out.write(json.dumps(snapshot) + "\n")
+        out.flush()
+
+    try:
+        run_tournament(config, workers=args.workers, cache_path=args.cache, every=args.every, emit=emit)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+if __name__ == "__main__":
+    main()
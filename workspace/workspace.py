@@ -13,7 +13,7 @@ import random
 ######################################################################################################
 class Character:
     """Crowned Stag Character Class"""
-    def __init__(self, name, age=18, perks=None, injuries=None, injury_threshold=4, morale_threshold=15, items=None):
+    def __init__(self, name, age=18, perks=None, injuries=None, injury_threshold=4, morale_threshold=15, items=None, stat_adjustments=None):
 
         # Base Stats
         self.name = name                            # Character Name
@@ -23,12 +23,13 @@ class Character:
         self.injury_threshold = injury_threshold    # Injury Threshold
         self.morale_threshold = morale_threshold    # Morale Threshold
         self.items = items or []                    # Character Items
+        self.stat_adjustments = stat_adjustments or {}  # Flat Stat Adjustments (Sensitivity Runs)
 
         # Dynamic Stats
         self.current_speed = 0                      # Current Speed
         self.current_attack = 0                     # Current Attack
         self.current_defense = 0                    # Current Defense
-        self.current_morale = 50                    # Current Morale
+        self.current_morale = 50 + self.stat_adjustments.get("morale", 0)  # Current Morale
 
         # Perk Check
         self.max_combatants = 3                     # Max Combatants Before Free Attack
@@ -46,6 +47,13 @@ class Character:
         self.combatants_faced = 0                   # Combatants Faced
         self.major_injuries = 0                     # Major Injuries Taken
 
+        # Mechanic Counters (Batch Reports)
+        self.crit_successes = 0                     # Crit Successes Rolled
+        self.crit_fails = 0                         # Crit Fails Rolled
+        self.free_throws = 0                        # Thrown Projectile Specialist T3 Free Throws
+        self.free_attacks = 0                       # Attacks on a Target Already Facing Its Max Combatants
+        self.worst_injury = 0                       # Most Severe Injury Taken (INJURY_CODES)
+
 ######################################################################################################
 # Age Malus
 ######################################################################################################
@@ -249,6 +257,12 @@ def melee_initialization(character):
             character.current_attack -= character.injuries[1]
             character.current_defense -= character.injuries[2]
 
+    # Apply Flat Stat Adjustments
+    if character.stat_adjustments:
+        character.current_speed += character.stat_adjustments.get("speed", 0)
+        character.current_attack += character.stat_adjustments.get("attack", 0)
+        character.current_defense += character.stat_adjustments.get("defense", 0)
+
 ######################################################################################################
 # Initialize Ranged Stats
 ######################################################################################################
@@ -315,7 +329,13 @@ def ranged_initialization(character):
             character.current_speed -= character.injuries[0]
             character.current_attack -= character.injuries[1]
             character.current_defense -= character.injuries[2]
-            
+
+    # Apply Flat Stat Adjustments
+    if character.stat_adjustments:
+        character.current_speed += character.stat_adjustments.get("speed", 0)
+        character.current_attack += character.stat_adjustments.get("attack", 0)
+        character.current_defense += character.stat_adjustments.get("defense", 0)
+
 ######################################################################################################
 # Initialize Mixed Stats
 ######################################################################################################
@@ -378,25 +398,27 @@ def mixed_initialization(character):
 # Dice
 ######################################################################################################
 
+rng = random.Random()                                       # Dice Stream - Seed For Reproducible Batches
+
 def roll_1d100():                                           # Roll 1d100   
     """Roll 1d100"""                                        
-    return random.randint(1, 100)                           # Return number between 1 & 100
+    return rng.randint(1, 100)                              # Return number between 1 & 100
 
 def roll_1d20():                                            # Roll 1d20
     """Roll 1d20"""
-    return random.randint(1, 20)                            # Return number between 1 & 20
+    return rng.randint(1, 20)                               # Return number between 1 & 20
 
 def roll_2d20():                                            # Roll 2d20
     """Roll 2d20"""
-    d1 = random.randint(1, 20)                              # Roll 1d20
-    d2 = random.randint(1, 20)                              # Roll 1d20
+    d1 = rng.randint(1, 20)                                 # Roll 1d20
+    d2 = rng.randint(1, 20)                                 # Roll 1d20
     return d1 + d2, (d1, d2)                                # Return sum of 2d20 and the rolls
 
 def roll_3d5():                                             # Roll 3d5
     """Roll 3d5"""
-    d1 = random.randint(1, 5)                               # Roll 1d5
-    d2 = random.randint(1, 5)                               # Roll 1d5
-    d3 = random.randint(1, 5)                               # Roll 1d5
+    d1 = rng.randint(1, 5)                                  # Roll 1d5
+    d2 = rng.randint(1, 5)                                  # Roll 1d5
+    d3 = rng.randint(1, 5)                                  # Roll 1d5
     return d1 + d2 + d3, (d1, d2, d3)                       # Return sum of 3d5 and the rolls
 
 ######################################################################################################
@@ -475,35 +497,88 @@ def critical_injury():
 
     return critical[roll]                                   # -- Critical Injury
 
+INJURY_CODES = {"None": 0, "Minor Injury": 1, "Major Injury": 2, "Critical Injury": 3, "Death": 4}  # Severity Codes
+
+def record_injury(character, outcome):
+    """Keep a Character's Most Severe Injury - From an Injury Roll's Outcome"""
+    if outcome is None:                                     # - Sworn Sword Bonus Pushed the Roll Past 100
+        return
+    if "Death" in outcome:                                  # - Death, or Critical Injury - Death
+        code = INJURY_CODES["Death"]
+    else:                                                   # - Minor / Major, Else a Critical Injury
+        code = INJURY_CODES.get(outcome, INJURY_CODES["Critical Injury"])
+    if code > character.worst_injury:
+        character.worst_injury = code
+
 ######################################################################################################
 # Battlefield Duel Seeking
 ######################################################################################################
 
+SEEKING_BONUSES = {                                                 # Seek Roll Perk Bonuses
+    "Battlefield Champion T3": 5,
+    "Battlefield Champion T2": 5,
+    "Indomitable T1": 5,
+    "Indomitable T2": 10,
+    "Indomitable T3": 15,
+    "Duelist T1": 5,
+    "Duelist T2": 10,
+    "Command & Presence": 10,
+}
+
+D100_FACES = range(1, 101)                                          # Faces of a d100
+
+def seeking_bonus(seeker):
+    """Total Seek Roll Perk Bonus"""
+    return sum(SEEKING_BONUSES.get(perk, 0) for perk in seeker.perks)
+
 # Battlefield Duel Seeking
 def combat_seeking(target, seeker):
-    result = roll_1d100()                                           # - Roll D100
-    if seeker.perks:                                                # - Character Perk Bonuses
-        for perk in seeker.perks:                                   # -- Iterate Through Perks
-            if perk == "Battlefield Champion T3":                   # --- Battlefield Champion T1
-                result += 5                                         # ---- Add 5
-            elif perk == "Battlefield Champion T2":                 # --- Battlefield Champion T2
-                result += 5                                         # ---- Add 10
-            elif perk == "Indomitable T1":                          # --- Indomitable T1
-                result += 5                                         # ---- Add 5
-            elif perk == "Indomitable T2":                          # --- Indomitable T2
-                result += 10                                        # ---- Add 10
-            elif perk == "Indomitable T3":                          # --- Indomitable T3
-                result += 15                                        # ---- Add 15
-            elif perk == "Duelist T1":                              # --- Duelist T1
-                result += 5                                         # ---- Add 5
-            elif perk == "Duelist T2":                              # --- Duelist T2
-                result += 10                                        # ---- Add 10
-            elif perk == "Command & Presence":                      # --- Command & Presence
-                result += 10                                        # ---- Add 10
+    result = roll_1d100() + seeking_bonus(seeker)                   # - Roll D100 Plus Character Perk Bonuses
     if result > 50:                                                 # - Success Threshold
         return "Character Finds Opponent!"                          # -- Found Opponent
     else:                                                           # - Failure Threshold
         return "Character Fails To Find Opponent!"                  # -- Did Not Find Opponent
+
+# Battlefield Duel Seeking - Many Seekers
+def battlefield_seeking(seekers, targets, wanted=None):
+    """Resolve Every Seek Roll at Once - One Duel per Character"""
+    rolls = rng.choices(D100_FACES, k=len(seekers))                 # - Every d100 in One Pass
+    totals = [roll + seeking_bonus(seeker) for roll, seeker in zip(rolls, seekers)]
+    wanted = wanted or [None] * len(seekers)                        # - Target Index Each Seeker Wants (None: Any)
+
+    # Highest Rolls Find Their Opponents First
+    order = sorted((i for i in range(len(seekers)) if totals[i] > 50), key=lambda i: -totals[i])
+    engaged = set()                                                 # - Characters Already in a Duel
+    duels = []
+    unmatched = []
+    free = 0                                                        # - Next Target to Try for Open Seekers
+    for i in order:
+        seeker = seekers[i]
+        if id(seeker) in engaged:                                   # -- Already Found by Someone Else
+            continue
+        target = None
+        if wanted[i] is not None and id(targets[wanted[i]]) not in engaged and targets[wanted[i]] is not seeker:
+            target = targets[wanted[i]]                             # -- Wanted Target Still Free
+        elif wanted[i] is None:
+            while free < len(targets) and id(targets[free]) in engaged:
+                free += 1                                           # -- Engaged Targets Stay Engaged - Pass Them for Good
+            candidate = free
+            while candidate < len(targets) and (id(targets[candidate]) in engaged or targets[candidate] is seeker):
+                candidate += 1                                      # -- Skip the Seeker Themselves, This Lookup Only
+            if candidate < len(targets):                            # -- First Free Target
+                target = targets[candidate]
+        if target is None:
+            unmatched.append(seeker)
+            continue
+        engaged.add(id(seeker))
+        engaged.add(id(target))
+        duels.append({"seeker": seeker, "target": target, "roll": totals[i]})
+
+    return {
+        "duels": duels,                                             # - Seeker, Target & Seek Roll
+        "failed": [seekers[i] for i in range(len(seekers)) if totals[i] <= 50],
+        "unmatched": [seeker for seeker in unmatched if id(seeker) not in engaged],  # - Rolled Well, No Free Target - Nor Found Later
+    }
     
 ######################################################################################################
 # Side Initialization
@@ -530,24 +605,119 @@ def side_initialization(side_data):
             injuries=injuries,
             injury_threshold=spec.get("injury_threshold", 4),
             morale_threshold=spec.get("morale_threshold", 15),
-            items=spec.get("items", [])
+            items=spec.get("items", []),
+            stat_adjustments=spec.get("stat_adjustments", {})
         )
         side.append(char)
     return side
 
 ######################################################################################################
-# Side Initialization
+# Round-Start Triggers
+######################################################################################################
+
+PRESENCE_TIERS = (("Terrifying Presence T1", 10), ("Terrifying Presence T2", 15))  # Perk, Enemy Morale Threshold Raise
+
+def terrifying_presence(side, enemies, combat_log):
+    """Terrifying Presence T1 & T2 - A Lone Fighter Raises Every Enemy's Morale Threshold, Once"""
+    if len(side) != 1 or len(enemies) <= 1 or side[0].imposed_presence != 0:
+        return
+    for perk, raise_by in PRESENCE_TIERS:                          # - Lowest Tier Held Applies
+        if perk in side[0].perks:
+            side[0].imposed_presence = 1
+            for c in enemies:
+                c.morale_threshold += raise_by
+            combat_log.append(f"The terrifying presence of {side[0].name} strikes fear into the heart of their enemies!")
+            return
+
+class RoundTriggers:
+    """Round-Start Perk Triggers - Re-Checked Only When a Side's Headcount Changes"""
+
+    def __init__(self):
+        self.counts = None                                          # Headcounts at the Last Check
+
+    def round_start(self, combat_side_one, combat_side_two, combat_log):
+        """Fire the Triggers Whose Condition Flipped Since the Last Check"""
+        counts = (len(combat_side_one), len(combat_side_two))
+        if counts == self.counts:                                   # - Sides Only Shrink - Same Headcount, Same Fighters
+            return
+        self.counts = counts
+        terrifying_presence(combat_side_one, combat_side_two, combat_log)
+        terrifying_presence(combat_side_two, combat_side_one, combat_log)
+
+def battlefield_champion_aura(champion_side, boosted_side, combat_log):
+    """Battlefield Champion T3 - +7 Morale per Champion, Applied Once Before Combat"""
+    champions = [position for position, c in enumerate(champion_side) if "Battlefield Champion T3" in c.perks]
+    if not champions:
+        return
+    for c in boosted_side:
+        c.current_morale += 7 * len(champions)
+    for order, position in enumerate(champions):
+        skipped = position - order * len(boosted_side)              # - Running-Count Skip: the First Champion Leaves Out Their Own Spot
+        if 0 <= skipped < len(boosted_side):
+            boosted_side[skipped].current_morale -= 7
+        combat_log.append(f"The presence of the Battlefield Champion {champion_side[position].name} boosts the morale of the men around them!")
+
+######################################################################################################
+# Initiative Order
 ######################################################################################################
 
-def combat_log_string(combat_log):
-    for entry in combat_log:
-        print(entry)
+def initiative_order(initiative, side):
+    """Sort a Side & Its Initiative Totals Together - Ascending, Ties Keep Their Order"""
+    pairs = list(zip(initiative, side))
+    if not pairs:                                           # - Side Taken Out Before Its Turn
+        return [], []
+    pairs.sort(key=lambda x: x[0])
+    initiative, side = zip(*pairs)
+    return list(initiative), list(side)
+
+######################################################################################################
+# Combat Log & Outcome
+######################################################################################################
+
+MECHANICS = ("you_lucky", "bloodlusted", "berserked", "imposed_presence",          # Per-Combatant Counters Reported
+             "crit_successes", "crit_fails", "free_throws", "free_attacks")
+
+def mechanic_counts(character):
+    """How Often Each Mechanic Fired for One Combatant"""
+    counts = {"name": character.name}
+    for mechanic in MECHANICS:
+        counts[mechanic] = getattr(character, mechanic)
+    return counts
+
+def taken_out(character, side):
+    """Off the Field Without Breaking - Removed by a Critical Injury Rather Than by Morale or Injuries"""
+    if any(c is character for c in side):
+        return False
+    return (character.current_morale > 0 and character.current_morale > character.morale_threshold
+            and len(character.injuries) < character.injury_threshold)
+
+def duel_outcome(combat_side_one, combat_side_two, round_count, roster=((), ()), stalemates=0):
+    """Summarize a Finished Duel"""
+    winner = 0                                                      # - No Winner
+    if len(combat_side_one) > 0 and len(combat_side_two) == 0:      # -- Side One Standing
+        winner = 1
+    elif len(combat_side_two) > 0 and len(combat_side_one) == 0:    # -- Side Two Standing
+        winner = 2
+    return {
+        "winner": winner,
+        "rounds": round_count,
+        "stalemates": stalemates,
+        "mechanics": {"side1": [mechanic_counts(c) for c in roster[0]],
+                      "side2": [mechanic_counts(c) for c in roster[1]]},
+        "final": {"side1": [(c.current_morale, c.worst_injury, taken_out(c, combat_side_one)) for c in roster[0]],  # (Morale, Injury Code, Taken Out)
+                  "side2": [(c.current_morale, c.worst_injury, taken_out(c, combat_side_two)) for c in roster[1]]},
+    }
+
+def combat_log_string(combat_log, verbose=True):
+    if verbose:                                                     # - Batch Runs Pass verbose=False
+        for entry in combat_log:
+            print(entry)
 
 ######################################################################################################
 # Combat Scenario - Melee vs Melee
 ######################################################################################################
 
-def melee_melee(side1, side2, ct):
+def melee_melee(side1, side2, ct, verbose=True, max_rounds=1000):
 
     # Combat Log
     combat_log = []
@@ -556,6 +726,8 @@ def melee_melee(side1, side2, ct):
     # Side Initialization
     combat_side_one = side_initialization(side1)
     combat_side_two = side_initialization(side2)
+    roster = (list(combat_side_one), list(combat_side_two))        # Everyone Who Fought - For Mechanic Counters
+    stalemates = 0
     # Stat Initialization
     for c in combat_side_one + combat_side_two:
         melee_initialization(c)
@@ -576,66 +748,22 @@ def melee_melee(side1, side2, ct):
     combat_log.append("==============================================================")
 
     # Battlefield Champion T3 Check
-    # Side One
-    bc3_count = 0
-    bc3_check = 0
-    for c in combat_side_one:
-        if "Battlefield Champion T3" in c.perks:
-            for d in combat_side_one:
-                if(bc3_count != bc3_check):
-                    d.current_morale += 7
-                bc3_check +=1
-            combat_log.append(f"The presence of the Battlefield Champion {c.name} boosts the morale of the men around them!")
-        bc3_count += 1
-
-    # Side Two
-    bc3_count = 0
-    bc3_check = 0
-    for e in combat_side_two:
-        if "Battlefield Champion T3" in e.perks:
-            for f in combat_side_one:
-                if(bc3_count != bc3_check):
-                    f.current_morale += 7
-                bc3_check +=1
-            combat_log.append(f"The presence of the Battlefield Champion {e.name} boosts the morale of the men around them!")
-        bc3_count += 1
+    battlefield_champion_aura(combat_side_one, combat_side_one, combat_log)        # Side One
+    battlefield_champion_aura(combat_side_two, combat_side_one, combat_log)        # Side Two
+    triggers = RoundTriggers()
 
     # While Both Teams Have Combatants
-    while len(combat_side_one) > 0 and len(combat_side_two) > 0:
+    while len(combat_side_one) > 0 and len(combat_side_two) > 0 and round_count < max_rounds:
 
         round_count += 1
         combat_log.append("==============================================================")
 
-        # Terrifying Presence T1 Check
-        # Side One
-        if (len(combat_side_one) == 1) and len(combat_side_two) > 1 and ("Terrifying Presence T1" in combat_side_one[0].perks) and (combat_side_one[0].imposed_presence == 0):
-            combat_side_one[0].imposed_presence = 1
-            for c in combat_side_two:
-                c.morale_threshold += 10
-            combat_log.append(f"The terrifying presence of {combat_side_one[0].name} strikes fear into the heart of their enemies!")
-        # Side Two
-        if (len(combat_side_two) == 1) and len(combat_side_one) > 1 and ("Terrifying Presence T1" in combat_side_two[0].perks) and (combat_side_two[0].imposed_presence == 0):
-            combat_side_two[0].imposed_presence = 1
-            for c in combat_side_one:
-                c.morale_threshold += 10
-            combat_log.append(f"The terrifying presence of {combat_side_two[0].name} strikes fear into the heart of their enemies!")
-        # Terrifying Presence T2 Check
-        # Side One
-        if (len(combat_side_one) == 1) and len(combat_side_two) > 1 and ("Terrifying Presence T2" in combat_side_one[0].perks) and (combat_side_one[0].imposed_presence == 0):
-            combat_side_one[0].imposed_presence = 1
-            for c in combat_side_two:
-                c.morale_threshold += 15
-            combat_log.append(f"The terrifying presence of {combat_side_one[0].name} strikes fear into the heart of their enemies!")
-        # Side Two
-        if (len(combat_side_two) == 1) and len(combat_side_one) > 1 and ("Terrifying Presence T2" in combat_side_two[0].perks) and (combat_side_two[0].imposed_presence == 0):
-            combat_side_two[0].imposed_presence = 1
-            for c in combat_side_one:
-                c.morale_threshold += 15
-            combat_log.append(f"The terrifying presence of {combat_side_two[0].name} strikes fear into the heart of their enemies!")
+        # Terrifying Presence T1 & T2 Check - Only When a Headcount Changed
+        triggers.round_start(combat_side_one, combat_side_two, combat_log)
         # Roll Initiative
         # Side One
         combat_side_one_initiative = []
-        for c in combat_side_one:
+        for c in list(combat_side_one):                    # - Snapshot - a Critical Fail Can Take c Out
             initiative_sum, _ = roll_2d20()
             combat_log.append(f"{c.name} rolls initiative: {_} + Speed {c.current_speed} = {initiative_sum + c.current_speed}")
             # Born Lucky Perk Check
@@ -658,10 +786,13 @@ def melee_melee(side1, side2, ct):
             if 1 in _ and 20 in _:
                 c.crit_fail = 0
                 c.crit_success = 0
+            c.crit_successes += c.crit_success                   # Mechanic Counters
+            c.crit_fails += c.crit_fail
             # Thrown Projectile Specialist T3 - Free Throw
-            if initiative_sum >= 30 and "Thrown Projectile Specialist T3" in c.perks and round_count == 1:
+            if initiative_sum >= 30 and "Thrown Projectile Specialist T3" in c.perks and round_count == 1 and combat_side_two:
+                c.free_throws += 1                                  # - Mechanic Counter
                 # Random Target Chosen
-                target = random.sample(combat_side_two, 1)[0]
+                target = rng.sample(combat_side_two, 1)[0]
                 target_index = combat_side_two.index(target)
                 combat_log.append(f"{c.name} throws a projectile at {target.name}")
                 # Critical Strike
@@ -686,6 +817,7 @@ def melee_melee(side1, side2, ct):
                     # Critical Injury
                     if isinstance(critical_strike_injury, str) and "Critical Injury" in critical_strike_injury:
                         combat_log.append(f"{target.name} suffers {critical_strike_injury} and is taken out!")
+                        record_injury(target, critical_strike_injury)
                         combat_side_two.pop(target_index)
                         continue
                     # Major Injury
@@ -709,6 +841,7 @@ def melee_melee(side1, side2, ct):
                             target.current_attack -= 1
                             target.current_defense -= 1
                     combat_log.append(f"{target.name} suffers {critical_strike_injury}")
+                    record_injury(target, critical_strike_injury)
                     combat_log.append(f"{target.name} Current Status - Speed: {target.current_speed} | Attack: {target.current_attack} | Defense: {target.current_defense}")
                 # Status Checks
                 c.currently_engaging = 1
@@ -748,6 +881,7 @@ def melee_melee(side1, side2, ct):
                             bonus += 30
                         morale_injury_roll = primary_injury_roll(ct, bonus)
                         combat_log.append(f"{target.name} has been injured! - {morale_injury_roll}!")
+                        record_injury(target, morale_injury_roll)
                     combat_side_two.pop(target_index)
                 # If Terrifying Presence - Only Take One Hit
                 if ("Terrifying Presence T2" in target.perks) and (target.combatants_faced >= 1) and (len(combat_side_two)) == 1:
@@ -774,7 +908,9 @@ def melee_melee(side1, side2, ct):
                 # Critical Injury
                 if isinstance(critical_fail_injury, str) and "Critical Injury" in critical_fail_injury:
                     combat_log.append(f"{c.name} suffers {critical_fail_injury} and is taken out!")
-                    combat_side_one.pop(c)
+                    record_injury(c, critical_fail_injury)
+                    combat_side_one_initiative.pop(combat_side_one.index(c))
+                    combat_side_one.remove(c)
                 # Major Injury
                 if critical_fail_injury == "Major Injury":
                     if "Ageing With Grace" in c.perks:
@@ -791,11 +927,12 @@ def melee_melee(side1, side2, ct):
                     c.current_attack -= 1
                     c.current_defense -= 1
                 combat_log.append(f"{c.name} suffers {critical_fail_injury}")
+                record_injury(c, critical_fail_injury)
                 combat_log.append(f"{c.name} Current Status - Speed: {c.current_speed} | Attack: {c.current_attack} | Defense: {c.current_defense}")
 
         # Side Two
         combat_side_two_initiative = []
-        for c in combat_side_two:
+        for c in list(combat_side_two):                    # - Snapshot - a Critical Fail Can Take c Out
             initiative_sum, _ = roll_2d20()
             combat_log.append(f"{c.name} rolls initiative: {_} + Speed {c.current_speed} = {initiative_sum + c.current_speed}")
             # Born Lucky Perk Check
@@ -817,10 +954,13 @@ def melee_melee(side1, side2, ct):
             if 1 in _ and 20 in _:
                 c.crit_fail = 0
                 c.crit_success = 0
+            c.crit_successes += c.crit_success                   # Mechanic Counters
+            c.crit_fails += c.crit_fail
             # Thrown Projectile Specialist T3 - Free Throw
-            if initiative_sum >= 30 and "Thrown Projectile Specialist T3" in c.perks and round_count == 1:
+            if initiative_sum >= 30 and "Thrown Projectile Specialist T3" in c.perks and round_count == 1 and combat_side_one:
+                c.free_throws += 1                                  # - Mechanic Counter
                 # Random Target
-                target = random.sample(combat_side_one, 1)[0]
+                target = rng.sample(combat_side_one, 1)[0]
                 target_index = combat_side_one.index(target)
                 combat_log.append(f"{c.name} throws a projectile at {target.name}")
                 # Critical Strike
@@ -845,7 +985,9 @@ def melee_melee(side1, side2, ct):
                     # Critical Injury
                     if isinstance(critical_strike_injury, str) and "Critical Injury" in critical_strike_injury:
                         combat_log.append(f"{c.name} suffers {critical_strike_injury} and is taken out!")
+                        record_injury(target, critical_strike_injury)
                         combat_side_one.pop(target_index)
+                        combat_side_one_initiative.pop(target_index)
                         continue
                     # Major Injury
                     if critical_strike_injury == "Major Injury":
@@ -868,6 +1010,7 @@ def melee_melee(side1, side2, ct):
                             target.current_attack -= 1
                             target.current_defense -= 1
                     combat_log.append(f"{target.name} suffers {critical_strike_injury}")
+                    record_injury(target, critical_strike_injury)
                     combat_log.append(f"{target.name} Current Status - Speed: {target.current_speed} | Attack: {target.current_attack} | Defense: {target.current_defense}")
                 # Status Check
                 c.currently_engaging = 1
@@ -906,7 +1049,9 @@ def melee_melee(side1, side2, ct):
                             bonus += 30
                         morale_injury_roll = primary_injury_roll(ct, bonus)
                         combat_log.append(f"{target.name} has been injured! - {morale_injury_roll}!")
+                        record_injury(target, morale_injury_roll)
                     combat_side_one.pop(target_index)
+                    combat_side_one_initiative.pop(target_index)
                 # Terrifying Presence - Face One Opponent
                 if ("Terrifying Presence T2" in target.perks) and (target.combatants_faced >= 1) and (len(combat_side_one)) == 1:
                     continue
@@ -932,7 +1077,9 @@ def melee_melee(side1, side2, ct):
                 # Critical Injury
                 if isinstance(critical_fail_injury, str) and "Critical Injury" in critical_fail_injury:
                     combat_log.append(f"{c.name} suffers {critical_fail_injury} and is taken out!")
-                    combat_side_two.pop(c)
+                    record_injury(c, critical_fail_injury)
+                    combat_side_two_initiative.pop(combat_side_two.index(c))
+                    combat_side_two.remove(c)
                 # Major Injury
                 if critical_fail_injury == "Major Injury":
                     if "Ageing With Grace" in c.perks:
@@ -954,21 +1101,14 @@ def melee_melee(side1, side2, ct):
                         c.current_attack -= 1
                         c.current_defense -= 1
                 combat_log.append(f"{c.name} suffers {critical_fail_injury}")
+                record_injury(c, critical_fail_injury)
                 combat_log.append(f"{c.name} Current Status - Speed: {c.current_speed} | Attack: {c.current_attack} | Defense: {c.current_defense}")
 
         # Sort combat_side_one and combat_side_one_initiative by initiative (ascending)
-        side_one_pairs = list(zip(combat_side_one_initiative, combat_side_one))
-        side_one_pairs.sort(key=lambda x: x[0])
-        combat_side_one_initiative, combat_side_one = zip(*side_one_pairs)
-        combat_side_one_initiative = list(combat_side_one_initiative)
-        combat_side_one = list(combat_side_one)
+        combat_side_one_initiative, combat_side_one = initiative_order(combat_side_one_initiative, combat_side_one)
 
         # Sort combat_side_two and combat_side_two_initiative by initiative (ascending)
-        side_two_pairs = list(zip(combat_side_two_initiative, combat_side_two))
-        side_two_pairs.sort(key=lambda x: x[0])
-        combat_side_two_initiative, combat_side_two = zip(*side_two_pairs)
-        combat_side_two_initiative = list(combat_side_two_initiative)
-        combat_side_two = list(combat_side_two)
+        combat_side_two_initiative, combat_side_two = initiative_order(combat_side_two_initiative, combat_side_two)
 
         # Check Initiative
         # Iterate Through Combat Side One
@@ -982,6 +1122,8 @@ def melee_melee(side1, side2, ct):
                 c2_init = combat_side_two_initiative[j]
                 # If Combatant Has Rolled Higher
                 if ((c1_init > c2_init) and c1.currently_engaging == 0) or (c2.combatants_faced >= c2.max_combatants):
+                    if c2.combatants_faced >= c2.max_combatants:     # - Mechanic Counter - Target Swarmed
+                        c1.free_attacks += 1
                     combat_log.append(f"{c1.name} attacks {c2.name}!")
                     # Critical Strike
                     if (c1.crit_success == 1):
@@ -1011,8 +1153,9 @@ def melee_melee(side1, side2, ct):
                         # Critical Injury Inflicted
                         if isinstance(critical_strike_injury, str) and "Critical Injury" in critical_strike_injury:
                             combat_log.append(f"{c2.name} suffers {critical_strike_injury} and is taken out!")
-                            combat_side_two.pop(i)
-                            combat_side_two_initiative.pop(i)
+                            record_injury(c2, critical_strike_injury)
+                            combat_side_two.pop(j)
+                            combat_side_two_initiative.pop(j)
                             continue
                         # Major Injury Taken
                         if critical_strike_injury == "Major Injury":
@@ -1038,6 +1181,7 @@ def melee_melee(side1, side2, ct):
                                 c2.current_attack -= 1
                                 c2.current_defense -= 1
                         combat_log.append(f"{c2.name} suffers {critical_strike_injury}")
+                        record_injury(c2, critical_strike_injury)
                         combat_log.append(f"{c2.name} Current Status - Speed: {c2.current_speed} | Attack: {c2.current_attack} | Defense: {c2.current_defense}")
                     # Status Check
                     c1.currently_engaging = 1
@@ -1085,8 +1229,9 @@ def melee_melee(side1, side2, ct):
                                 bonus += 30
                             morale_injury_roll = primary_injury_roll(ct, bonus)
                             combat_log.append(f"{c2.name} has been injured! - {morale_injury_roll}!")
-                        combat_side_two.pop()
-                        combat_side_two_initiative.pop()
+                            record_injury(c2, morale_injury_roll)
+                        combat_side_two.pop(j)
+                        combat_side_two_initiative.pop(j)
                         continue  # Don't increment j, as list has shifted
                     # Only Take One Attack - Terrifying Presence
                     if ("Terrifying Presence T2" in c2.perks) and (c2.combatants_faced >= 1) and (len(combat_side_two)) == 1:
@@ -1119,8 +1264,10 @@ def melee_melee(side1, side2, ct):
                 # Critical Injury Knockout
                 if isinstance(critical_fail_injury, str) and "Critical Injury" in critical_fail_injury:
                     combat_log.append(f"{c1.name} suffers {critical_fail_injury} and is taken out!")
-                    combat_side_one.pop(i)
-                    combat_side_one_initiative.pop(i)
+                    record_injury(c1, critical_fail_injury)
+                    combat_side_one.pop(i - 1)
+                    combat_side_one_initiative.pop(i - 1)
+                    i -= 1  # - Next Combatant Has Shifted Into Its Place
                 # Major Injury Check
                 if critical_fail_injury == "Major Injury":
                     c1.major_injuries += 1
@@ -1145,6 +1292,7 @@ def melee_melee(side1, side2, ct):
                         c1.current_attack -= 1
                         c1.current_defense -= 1
                 combat_log.append(f"{c1.name} suffers {critical_fail_injury}")
+                record_injury(c1, critical_fail_injury)
                 combat_log.append(f"{c1.name} Current Status - Speed: {c1.current_speed} | Attack: {c1.current_attack} | Defense: {c1.current_defense}")
 
         # Iterate Through Combat Side Two
@@ -1158,6 +1306,8 @@ def melee_melee(side1, side2, ct):
                 c1_init = combat_side_one_initiative[j]
                 # If Combatant Has Rolled Higher
                 if ((combat_side_two_initiative[i] > combat_side_one_initiative[j]) and c2.currently_engaging == 0) or (combat_side_one[j].combatants_faced >= combat_side_one[j].max_combatants):
+                    if combat_side_one[j].combatants_faced >= combat_side_one[j].max_combatants:     # - Mechanic Counter - Target Swarmed
+                        c2.free_attacks += 1
                     combat_log.append(f"{c2.name} attacks {c1.name}!")
                     # Critical Strike
                     if (combat_side_two[i].crit_success == 1):
@@ -1187,8 +1337,10 @@ def melee_melee(side1, side2, ct):
                         # Critical Injury
                         if isinstance(critical_strike_injury, str) and "Critical Injury" in critical_strike_injury:
                             combat_log.append(f"{c1.name} suffers {critical_strike_injury} and is taken out!")
-                            combat_side_one.pop(i)
-                            combat_side_one_initiative.pop(i)
+                            record_injury(c1, critical_strike_injury)
+                            combat_side_one.pop(j)
+                            combat_side_one_initiative.pop(j)
+                            continue
                         # Major Injury Check
                         if critical_strike_injury == "Major Injury":
                             combat_side_one[j].major_injuries += 1
@@ -1213,6 +1365,7 @@ def melee_melee(side1, side2, ct):
                                 c1.current_attack -= 1
                                 c1.current_defense -= 1
                             combat_log.append(f"{c1.name} suffers {critical_strike_injury}")
+                            record_injury(c1, critical_strike_injury)
                             combat_log.append(f"{c1.name} Current Status - Speed: {c1.current_speed} | Attack: {c1.current_attack} | Defense: {c1.current_defense}")
                     # Status Check
                     c2.currently_engaging = 1
@@ -1260,6 +1413,7 @@ def melee_melee(side1, side2, ct):
                                 bonus += 30
                             morale_injury_roll = primary_injury_roll(ct, bonus)
                             combat_log.append(f"{c1.name} has been injured! - {morale_injury_roll}!")
+                            record_injury(c1, morale_injury_roll)
                         combat_side_one.pop(j)
                         combat_side_one_initiative.pop(j)
                         continue  # Don't increment j, as list has shifted
@@ -1294,8 +1448,10 @@ def melee_melee(side1, side2, ct):
                 # Critical Injury
                 if isinstance(critical_fail_injury, str) and "Critical Injury" in critical_fail_injury:
                     combat_log.append(f"{c2.name} suffers {critical_fail_injury} and is taken out!")
+                    record_injury(c2, critical_fail_injury)
                     combat_side_two.pop(i)
                     combat_side_two_initiative.pop(i)
+                    i -= 1  # - Next Combatant Has Shifted Into Its Place
                 # Major Injury
                 if critical_fail_injury == "Major Injury":
                     if "Ageing With Grace" in c2.perks:
@@ -1317,6 +1473,7 @@ def melee_melee(side1, side2, ct):
                         c2.current_attack -= 1
                         c2.current_defense -= 1
                 combat_log.append(f"{c2.name} suffers {critical_fail_injury}")
+                record_injury(c2, critical_fail_injury)
                 combat_log.append(f"{c2.name} Current Status - Speed: {c2.current_speed} | Attack: {c2.current_attack} | Defense: {c2.current_defense}")
             i += 1
         
@@ -1330,12 +1487,13 @@ def melee_melee(side1, side2, ct):
             if c.currently_engaging == 1:
                 stalemate = 0
         if stalemate == 1:
+            stalemates += 1
             combat_log.append("This round has ended in a stalemate, neither side have made progress.")
 
         # End Of Round
         # Print Round
         combat_log.append("==============================================================")
-        combat_log_string(combat_log)
+        combat_log_string(combat_log, verbose)
         combat_log = []
         # Reset Initiative
         combat_side_one_initiative = []
@@ -1355,19 +1513,28 @@ def melee_melee(side1, side2, ct):
 
     if len(combat_side_one) == 0:
         combat_log.append("Side Two has won this duel!")
-        combat_log_string(combat_log)
+        combat_log_string(combat_log, verbose)
         combat_log = []
 
     if len(combat_side_two) == 0:
         combat_log.append("Side One has won this duel!")
-        combat_log_string(combat_log)
+        combat_log_string(combat_log, verbose)
         combat_log = []
 
+    # Round Limit Reached
+    if len(combat_side_one) > 0 and len(combat_side_two) > 0:
+        combat_log.append(f"The duel has been called after {round_count} rounds, neither side could finish it!")
+        combat_log_string(combat_log, verbose)
+        combat_log = []
+
+    # Duel Outcome
+    return duel_outcome(combat_side_one, combat_side_two, round_count, roster, stalemates)
+
 ######################################################################################################
 # Combat Scenario - Ranged vs Melee
 ######################################################################################################
 
-def ranged_melee(side1, side2, ct):
+def ranged_melee(side1, side2, ct, verbose=True, max_rounds=1000):
 
     # Combat Log
     combat_log = []
@@ -1376,6 +1543,8 @@ def ranged_melee(side1, side2, ct):
     # Side Initialization
     combat_side_one = side_initialization(side1)
     combat_side_two = side_initialization(side2)
+    roster = (list(combat_side_one), list(combat_side_two))        # Everyone Who Fought - For Mechanic Counters
+    stalemates = 0
     # Stat Initialization
     for i in range(len(combat_side_one)):
         ranged_initialization(combat_side_one[i])
@@ -1398,58 +1567,20 @@ def ranged_melee(side1, side2, ct):
     combat_log.append("==============================================================")
 
     # Battlefield Champion T3 Check
-    # Side One
-    bc3_count = 0
-    bc3_check = 0
-    for c in combat_side_one:
-        if "Battlefield Champion T3" in c.perks:
-            for d in combat_side_one:
-                if(bc3_count != bc3_check):
-                    d.current_morale += 7
-                bc3_check +=1
-            combat_log.append(f"The presence of the Battlefield Champion {c.name} boosts the morale of the men around them!")
-        bc3_count += 1
-        
-    # Side Two
-    bc3_count = 0
-    bc3_check = 0
-    for e in combat_side_two:
-        if "Battlefield Champion T3" in e.perks:
-            for f in combat_side_one:
-                if(bc3_count != bc3_check):
-                    f.current_morale += 7
-                bc3_check +=1
-            combat_log.append(f"The presence of the Battlefield Champion {e.name} boosts the morale of the men around them!")
-        bc3_count += 1
+    battlefield_champion_aura(combat_side_one, combat_side_one, combat_log)        # Side One
+    battlefield_champion_aura(combat_side_two, combat_side_one, combat_log)        # Side Two
+    triggers = RoundTriggers()
     
     # Stage One - Ranged Attacks
     # Keep Track
     ranged_rounds = 0
-    while len(combat_side_one) > 0 and len(combat_side_two) > 0:
+    while len(combat_side_one) > 0 and len(combat_side_two) > 0 and round_count < max_rounds:
 
         round_count += 1
         combat_log.append("==============================================================")
 
-        if (len(combat_side_one) == 1) and len(combat_side_two) > 1 and ("Terrifying Presence T1" in combat_side_one[0].perks) and (combat_side_one[0].imposed_presence == 0):
-            combat_side_one[0].imposed_presence = 1
-            for c in combat_side_two:
-                c.morale_threshold += 10
-            combat_log.append(f"The terrifying presence of {combat_side_one[0].name} strikes fear into the heart of their enemies!")
-        if (len(combat_side_two) == 1) and len(combat_side_one) > 1 and ("Terrifying Presence T1" in combat_side_two[0].perks) and (combat_side_two[0].imposed_presence == 0):
-            combat_side_two[0].imposed_presence = 1
-            for c in combat_side_one:
-                c.morale_threshold += 10
-            combat_log.append(f"The terrifying presence of {combat_side_two[0].name} strikes fear into the heart of their enemies!")
-        if (len(combat_side_one) == 1) and len(combat_side_two) > 1 and ("Terrifying Presence T2" in combat_side_one[0].perks) and (combat_side_one[0].imposed_presence == 0):
-            combat_side_one[0].imposed_presence = 1
-            for c in combat_side_two:
-                c.morale_threshold += 15
-            combat_log.append(f"The terrifying presence of {combat_side_one[0].name} strikes fear into the heart of their enemies!")
-        if (len(combat_side_two) == 1) and len(combat_side_one) > 1 and ("Terrifying Presence T2" in combat_side_two[0].perks) and (combat_side_two[0].imposed_presence == 0):
-            combat_side_two[0].imposed_presence = 1
-            for c in combat_side_one:
-                c.morale_threshold += 15
-            combat_log.append(f"The terrifying presence of {combat_side_two[0].name} strikes fear into the heart of their enemies!")
+        # Terrifying Presence T1 & T2 Check - Only When a Headcount Changed
+        triggers.round_start(combat_side_one, combat_side_two, combat_log)
 
         combat_side_one_initiative = []
         for c in combat_side_one:
@@ -1469,13 +1600,11 @@ def ranged_melee(side1, side2, ct):
             if 1 in _ and 20 in _:
                 c.crit_fail = 0
                 c.crit_success = 0
+            c.crit_successes += c.crit_success                   # Mechanic Counters
+            c.crit_fails += c.crit_fail
         
         # Sort combat_side_one and combat_side_one_initiative by initiative (ascending)
-        side_one_pairs = list(zip(combat_side_one_initiative, combat_side_one))
-        side_one_pairs.sort(key=lambda x: x[0])
-        combat_side_one_initiative, combat_side_one = zip(*side_one_pairs)
-        combat_side_one_initiative = list(combat_side_one_initiative)
-        combat_side_one = list(combat_side_one)
+        combat_side_one_initiative, combat_side_one = initiative_order(combat_side_one_initiative, combat_side_one)
 
         # Check Initiative
         # Iterate Through Combat Side One
@@ -1487,6 +1616,8 @@ def ranged_melee(side1, side2, ct):
                 c2 = combat_side_two[j]
                 # If Combatant Has Rolled Higher
                 if (((combat_side_one_initiative[i] >= 30) and c1.currently_engaging == 0) or (combat_side_two[j].combatants_faced >= combat_side_two[j].max_combatants)) and (c1.max_mixed_rounds >= ranged_rounds):
+                    if combat_side_two[j].combatants_faced >= combat_side_two[j].max_combatants:     # - Mechanic Counter - Target Swarmed
+                        c1.free_attacks += 1
                     combat_log.append(f"{c1.name} attacks {c2.name}!")
                     # Critical Strike
                     if (combat_side_one[i].crit_success == 1):
@@ -1506,7 +1637,9 @@ def ranged_melee(side1, side2, ct):
                         critical_strike_injury = secondary_injury_roll(ct, bonus)
                         if isinstance(critical_strike_injury, str) and "Critical Injury" in critical_strike_injury:
                             combat_log.append(f"{c2.name} suffers {critical_strike_injury} and is taken out!")
-                            combat_side_two.pop(i)
+                            record_injury(c2, critical_strike_injury)
+                            combat_side_two.pop(j)
+                            continue
                         if critical_strike_injury == "Major Injury":
                             if "Ageing With Grace" in c2.perks:
                                 c2.current_speed -= 1
@@ -1526,6 +1659,7 @@ def ranged_melee(side1, side2, ct):
                                 c2.current_attack -= 1
                                 c2.current_defense -= 1
                         combat_log.append(f"{c2.name} suffers {critical_strike_injury}")
+                        record_injury(c2, critical_strike_injury)
                         combat_log.append(f"{c2.name} Current Status - Speed: {c2.current_speed} | Attack: {c2.current_attack} | Defense: {c2.current_defense}")
                     c1.currently_engaging = 1
                     c2.combatants_faced += 1
@@ -1555,6 +1689,7 @@ def ranged_melee(side1, side2, ct):
                                 bonus += 30
                             morale_injury_roll = primary_injury_roll(ct, bonus)
                             combat_log.append(f"{c2.name} has been injured! - {morale_injury_roll}!")
+                            record_injury(c2, morale_injury_roll)
                         combat_side_two.pop(j)
                         continue  # Don't increment j, as list has shifted
                     if ("Terrifying Presence T2" in c2.perks) and (c2.combatants_faced >= 1) and (len(combat_side_two)) == 1:
@@ -1578,8 +1713,10 @@ def ranged_melee(side1, side2, ct):
                 critical_fail_injury = secondary_injury_roll(ct, bonus)
                 if isinstance(critical_fail_injury, str) and "Critical Injury" in critical_fail_injury:
                     combat_log.append(f"{c1.name} suffers {critical_fail_injury} and is taken out!")
-                    combat_side_one.pop(i)
-                    combat_side_one_initiative.pop(i)
+                    record_injury(c1, critical_fail_injury)
+                    combat_side_one.pop(i - 1)
+                    combat_side_one_initiative.pop(i - 1)
+                    i -= 1  # - Next Combatant Has Shifted Into Its Place
                 if critical_fail_injury == "Major Injury":
                     if "Ageing With Grace" in c1.perks:
                         c1.current_speed -= 1
@@ -1599,6 +1736,7 @@ def ranged_melee(side1, side2, ct):
                         c1.current_attack -= 1
                         c1.current_defense -= 1
                 combat_log.append(f"{c1.name} suffers {critical_fail_injury}")
+                record_injury(c1, critical_fail_injury)
                 combat_log.append(f"{c1.name} Current Status - Speed: {c1.current_speed} | Attack: {c1.current_attack} | Defense: {c1.current_defense}")
         ranged_rounds += 1
 
@@ -1612,12 +1750,13 @@ def ranged_melee(side1, side2, ct):
             if c.currently_engaging == 1:
                 stalemate = 0
         if stalemate == 1:
+            stalemates += 1
             combat_log.append("This round has ended in a stalemate, neither side have made progress.")
 
         # End Of Round
         # Print Round
         combat_log.append("==============================================================")
-        combat_log_string(combat_log)
+        combat_log_string(combat_log, verbose)
         combat_log = []
         combat_side_one_initiative = []
         # Prepare For Next Round
@@ -1635,13 +1774,13 @@ def ranged_melee(side1, side2, ct):
 
         if len(combat_side_one) == 0:
             combat_log.append("Side Two has won this duel!")
-            combat_log_string(combat_log)
+            combat_log_string(combat_log, verbose)
             combat_log = []
             continue
 
         if len(combat_side_two) == 0:
             combat_log.append("Side One has won this duel!")
-            combat_log_string(combat_log)
+            combat_log_string(combat_log, verbose)
             combat_log = []
             continue
 
@@ -1655,8 +1794,8 @@ def ranged_melee(side1, side2, ct):
             break
 
     # Stage 1.5 - Thrown Projectiles
-    for c in combat_side_two:
-        if "Thrown Projectile Specialist T2" in c.perks:
+    for c in list(combat_side_two):                            # - Snapshot - a Critical Fail Can Take c Out
+        if "Thrown Projectile Specialist T2" in c.perks and combat_side_one:
 
             round_count += 1
 
@@ -1675,11 +1814,15 @@ def ranged_melee(side1, side2, ct):
             if 1 in _ and 20 in _:
                 c.crit_fail = 0
                 c.crit_success = 0
+            c.crit_successes += c.crit_success                   # Mechanic Counters
+            c.crit_fails += c.crit_fail
             
-            target = random.sample(combat_side_one, 1)[0]
+            target = rng.sample(combat_side_one, 1)[0]
             target_index = combat_side_one.index(target)
 
             if ((initiative_sum >= 30) or (target.combatants_faced >= target.max_combatants)):
+                if target.combatants_faced >= target.max_combatants:     # - Mechanic Counter - Target Swarmed
+                    c.free_attacks += 1
                 combat_log.append(f"{c.name} attacks {target.name}!")
                 # Critical Strike
                 if (c.crit_success == 1):
@@ -1699,6 +1842,7 @@ def ranged_melee(side1, side2, ct):
                     critical_strike_injury = secondary_injury_roll(ct, bonus)
                     if isinstance(critical_strike_injury, str) and "Critical Injury" in critical_strike_injury:
                         combat_log.append(f"{target.name} suffers {critical_strike_injury} and is taken out!")
+                        record_injury(target, critical_strike_injury)
                         combat_side_one.pop(target_index)
                     if critical_strike_injury == "Major Injury":
                         if "Ageing With Grace" in c.perks:
@@ -1719,6 +1863,7 @@ def ranged_melee(side1, side2, ct):
                             target.current_attack -= 1
                             target.current_defense -= 1
                     combat_log.append(f"{target.name} suffers {critical_strike_injury}")
+                    record_injury(target, critical_strike_injury)
                     combat_log.append(f"{target.name} Current Status - Speed: {target.current_speed} | Attack: {target.current_attack} | Defense: {target.current_defense}")
                 c.currently_engaging = 1
                 target.combatants_faced += 1
@@ -1748,6 +1893,7 @@ def ranged_melee(side1, side2, ct):
                             bonus += 30
                         morale_injury_roll = primary_injury_roll(ct, bonus)
                         combat_log.append(f"{target.name} has been injured! - {morale_injury_roll}!")
+                        record_injury(target, morale_injury_roll)
                     combat_side_one.pop(target_index)
                 if ("Terrifying Presence T2" in target.perks) and (target.combatants_faced >= 1) and (len(combat_side_one)) == 1:
                     continue
@@ -1768,7 +1914,8 @@ def ranged_melee(side1, side2, ct):
                 critical_fail_injury = secondary_injury_roll(ct, bonus)
                 if isinstance(critical_fail_injury, str) and "Critical Injury" in critical_fail_injury:
                     combat_log.append(f"{c.name} suffers {critical_fail_injury} and is taken out!")
-                    combat_side_one.pop(c)
+                    record_injury(c, critical_fail_injury)
+                    combat_side_two.remove(c)
                 if critical_fail_injury == "Major Injury":
                     if "Ageing With Grace" in c.perks:
                         c.current_speed -= 1
@@ -1788,28 +1935,29 @@ def ranged_melee(side1, side2, ct):
                         c.current_attack -= 1
                         c.current_defense -= 1
                 combat_log.append(f"{c.name} suffers {critical_fail_injury}")
+                record_injury(c, critical_fail_injury)
                 combat_log.append(f"{c.name} Current Status - Speed: {c.current_speed} | Attack: {c.current_attack} | Defense: {c.current_defense}")
 
             # Print Round
             round_count += 1
             combat_log.append("==============================================================")
-            combat_log_string(combat_log)
+            combat_log_string(combat_log, verbose)
             combat_log = []
 
             if len(combat_side_one) == 0:
                 combat_log.append("Side Two has won this duel!")
-                combat_log_string(combat_log)
+                combat_log_string(combat_log, verbose)
                 combat_log = []
                 continue
 
             if len(combat_side_two) == 0:
                 combat_log.append("Side One has won this duel!")
-                combat_log_string(combat_log)
+                combat_log_string(combat_log, verbose)
                 combat_log = []
                 continue
 
     # Stage 2
-    while len(combat_side_one) > 0 and len(combat_side_two) > 0:
+    while len(combat_side_one) > 0 and len(combat_side_two) > 0 and round_count < max_rounds:
 
         round_count += 1
 
@@ -1851,6 +1999,7 @@ def ranged_melee(side1, side2, ct):
                             bonus += 30
                         morale_injury_roll = primary_injury_roll(ct, bonus)
                         combat_log.append(f"{c1.name} has been injured! - {morale_injury_roll}!")
+                        record_injury(c1, morale_injury_roll)
                     combat_side_one.pop(j)
                     continue  # Don't increment j, as list has shifted
                 if ("Terrifying Presence T2" in c1.perks) and (c1.combatants_faced >= 1) and (len(combat_side_one)) == 1:
@@ -1861,7 +2010,7 @@ def ranged_melee(side1, side2, ct):
         # End Of Round
         # Print Round
         combat_log.append("==============================================================")
-        combat_log_string(combat_log)
+        combat_log_string(combat_log, verbose)
         combat_log = []
         # Prepare For Next Round
         for c in combat_side_one:
@@ -1878,13 +2027,13 @@ def ranged_melee(side1, side2, ct):
 
         if len(combat_side_one) == 0:
             combat_log.append("Side Two has won this duel!")
-            combat_log_string(combat_log)
+            combat_log_string(combat_log, verbose)
             combat_log = []
             continue
 
         if len(combat_side_two) == 0:
             combat_log.append("Side One has won this duel!")
-            combat_log_string(combat_log)
+            combat_log_string(combat_log, verbose)
             combat_log = []
             continue
 
@@ -1897,41 +2046,17 @@ def ranged_melee(side1, side2, ct):
     # Stage 3
     # While Both Teams Have Combatants
     # While Both Teams Have Combatants
-    while len(combat_side_one) > 0 and len(combat_side_two) > 0:
+    while len(combat_side_one) > 0 and len(combat_side_two) > 0 and round_count < max_rounds:
 
         round_count += 1
         combat_log.append("==============================================================")
 
-        # Terrifying Presence T1 Check
-        # Side One
-        if (len(combat_side_one) == 1) and len(combat_side_two) > 1 and ("Terrifying Presence T1" in combat_side_one[0].perks) and (combat_side_one[0].imposed_presence == 0):
-            combat_side_one[0].imposed_presence = 1
-            for c in combat_side_two:
-                c.morale_threshold += 10
-            combat_log.append(f"The terrifying presence of {combat_side_one[0].name} strikes fear into the heart of their enemies!")
-        # Side Two
-        if (len(combat_side_two) == 1) and len(combat_side_one) > 1 and ("Terrifying Presence T1" in combat_side_two[0].perks) and (combat_side_two[0].imposed_presence == 0):
-            combat_side_two[0].imposed_presence = 1
-            for c in combat_side_one:
-                c.morale_threshold += 10
-            combat_log.append(f"The terrifying presence of {combat_side_two[0].name} strikes fear into the heart of their enemies!")
-        # Terrifying Presence T2 Check
-        # Side One
-        if (len(combat_side_one) == 1) and len(combat_side_two) > 1 and ("Terrifying Presence T2" in combat_side_one[0].perks) and (combat_side_one[0].imposed_presence == 0):
-            combat_side_one[0].imposed_presence = 1
-            for c in combat_side_two:
-                c.morale_threshold += 15
-            combat_log.append(f"The terrifying presence of {combat_side_one[0].name} strikes fear into the heart of their enemies!")
-        # Side Two
-        if (len(combat_side_two) == 1) and len(combat_side_one) > 1 and ("Terrifying Presence T2" in combat_side_two[0].perks) and (combat_side_two[0].imposed_presence == 0):
-            combat_side_two[0].imposed_presence = 1
-            for c in combat_side_one:
-                c.morale_threshold += 15
-            combat_log.append(f"The terrifying presence of {combat_side_two[0].name} strikes fear into the heart of their enemies!")
+        # Terrifying Presence T1 & T2 Check - Only When a Headcount Changed
+        triggers.round_start(combat_side_one, combat_side_two, combat_log)
         # Roll Initiative
         # Side One
         combat_side_one_initiative = []
-        for c in combat_side_one:
+        for c in list(combat_side_one):                    # - Snapshot - a Critical Fail Can Take c Out
             initiative_sum, _ = roll_2d20()
             combat_log.append(f"{c.name} rolls initiative: {_} + Speed {c.current_speed} = {initiative_sum + c.current_speed}")
             # Born Lucky Perk Check
@@ -1954,10 +2079,13 @@ def ranged_melee(side1, side2, ct):
             if 1 in _ and 20 in _:
                 c.crit_fail = 0
                 c.crit_success = 0
+            c.crit_successes += c.crit_success                   # Mechanic Counters
+            c.crit_fails += c.crit_fail
             # Thrown Projectile Specialist T3 - Free Throw
-            if initiative_sum >= 30 and "Thrown Projectile Specialist T3" in c.perks and round_count == 1:
+            if initiative_sum >= 30 and "Thrown Projectile Specialist T3" in c.perks and round_count == 1 and combat_side_two:
+                c.free_throws += 1                                  # - Mechanic Counter
                 # Random Target Chosen
-                target = random.sample(combat_side_two, 1)[0]
+                target = rng.sample(combat_side_two, 1)[0]
                 target_index = combat_side_two.index(target)
                 combat_log.append(f"{c.name} throws a projectile at {target.name}")
                 # Critical Strike
@@ -1982,6 +2110,7 @@ def ranged_melee(side1, side2, ct):
                     # Critical Injury
                     if isinstance(critical_strike_injury, str) and "Critical Injury" in critical_strike_injury:
                         combat_log.append(f"{target.name} suffers {critical_strike_injury} and is taken out!")
+                        record_injury(target, critical_strike_injury)
                         combat_side_two.pop(target_index)
                         continue
                     # Major Injury
@@ -2005,6 +2134,7 @@ def ranged_melee(side1, side2, ct):
                             target.current_attack -= 1
                             target.current_defense -= 1
                     combat_log.append(f"{target.name} suffers {critical_strike_injury}")
+                    record_injury(target, critical_strike_injury)
                     combat_log.append(f"{target.name} Current Status - Speed: {target.current_speed} | Attack: {target.current_attack} | Defense: {target.current_defense}")
                 # Status Checks
                 c.currently_engaging = 1
@@ -2044,6 +2174,7 @@ def ranged_melee(side1, side2, ct):
                             bonus += 30
                         morale_injury_roll = primary_injury_roll(ct, bonus)
                         combat_log.append(f"{target.name} has been injured! - {morale_injury_roll}!")
+                        record_injury(target, morale_injury_roll)
                     combat_side_two.pop(target_index)
                 # If Terrifying Presence - Only Take One Hit
                 if ("Terrifying Presence T2" in target.perks) and (target.combatants_faced >= 1) and (len(combat_side_two)) == 1:
@@ -2070,7 +2201,9 @@ def ranged_melee(side1, side2, ct):
                 # Critical Injury
                 if isinstance(critical_fail_injury, str) and "Critical Injury" in critical_fail_injury:
                     combat_log.append(f"{c.name} suffers {critical_fail_injury} and is taken out!")
-                    combat_side_one.pop(c)
+                    record_injury(c, critical_fail_injury)
+                    combat_side_one_initiative.pop(combat_side_one.index(c))
+                    combat_side_one.remove(c)
                 # Major Injury
                 if critical_fail_injury == "Major Injury":
                     if "Ageing With Grace" in c.perks:
@@ -2087,11 +2220,12 @@ def ranged_melee(side1, side2, ct):
                     c.current_attack -= 1
                     c.current_defense -= 1
                 combat_log.append(f"{c.name} suffers {critical_fail_injury}")
+                record_injury(c, critical_fail_injury)
                 combat_log.append(f"{c.name} Current Status - Speed: {c.current_speed} | Attack: {c.current_attack} | Defense: {c.current_defense}")
 
         # Side Two
         combat_side_two_initiative = []
-        for c in combat_side_two:
+        for c in list(combat_side_two):                    # - Snapshot - a Critical Fail Can Take c Out
             initiative_sum, _ = roll_2d20()
             combat_log.append(f"{c.name} rolls initiative: {_} + Speed {c.current_speed} = {initiative_sum + c.current_speed}")
             # Born Lucky Perk Check
@@ -2113,10 +2247,13 @@ def ranged_melee(side1, side2, ct):
             if 1 in _ and 20 in _:
                 c.crit_fail = 0
                 c.crit_success = 0
+            c.crit_successes += c.crit_success                   # Mechanic Counters
+            c.crit_fails += c.crit_fail
             # Thrown Projectile Specialist T3 - Free Throw
-            if initiative_sum >= 30 and "Thrown Projectile Specialist T3" in c.perks and round_count == 1:
+            if initiative_sum >= 30 and "Thrown Projectile Specialist T3" in c.perks and round_count == 1 and combat_side_one:
+                c.free_throws += 1                                  # - Mechanic Counter
                 # Random Target
-                target = random.sample(combat_side_one, 1)[0]
+                target = rng.sample(combat_side_one, 1)[0]
                 target_index = combat_side_one.index(target)
                 combat_log.append(f"{c.name} throws a projectile at {target.name}")
                 # Critical Strike
@@ -2141,7 +2278,9 @@ def ranged_melee(side1, side2, ct):
                     # Critical Injury
                     if isinstance(critical_strike_injury, str) and "Critical Injury" in critical_strike_injury:
                         combat_log.append(f"{c.name} suffers {critical_strike_injury} and is taken out!")
+                        record_injury(target, critical_strike_injury)
                         combat_side_one.pop(target_index)
+                        combat_side_one_initiative.pop(target_index)
                         continue
                     # Major Injury
                     if critical_strike_injury == "Major Injury":
@@ -2164,6 +2303,7 @@ def ranged_melee(side1, side2, ct):
                             target.current_attack -= 1
                             target.current_defense -= 1
                     combat_log.append(f"{target.name} suffers {critical_strike_injury}")
+                    record_injury(target, critical_strike_injury)
                     combat_log.append(f"{target.name} Current Status - Speed: {target.current_speed} | Attack: {target.current_attack} | Defense: {target.current_defense}")
                 # Status Check
                 c.currently_engaging = 1
@@ -2202,7 +2342,9 @@ def ranged_melee(side1, side2, ct):
                             bonus += 30
                         morale_injury_roll = primary_injury_roll(ct, bonus)
                         combat_log.append(f"{target.name} has been injured! - {morale_injury_roll}!")
+                        record_injury(target, morale_injury_roll)
                     combat_side_one.pop(target_index)
+                    combat_side_one_initiative.pop(target_index)
                 # Terrifying Presence - Face One Opponent
                 if ("Terrifying Presence T2" in target.perks) and (target.combatants_faced >= 1) and (len(combat_side_one)) == 1:
                     continue
@@ -2228,7 +2370,9 @@ def ranged_melee(side1, side2, ct):
                 # Critical Injury
                 if isinstance(critical_fail_injury, str) and "Critical Injury" in critical_fail_injury:
                     combat_log.append(f"{c.name} suffers {critical_fail_injury} and is taken out!")
-                    combat_side_two.pop(c)
+                    record_injury(c, critical_fail_injury)
+                    combat_side_two_initiative.pop(combat_side_two.index(c))
+                    combat_side_two.remove(c)
                 # Major Injury
                 if critical_fail_injury == "Major Injury":
                     if "Ageing With Grace" in c.perks:
@@ -2250,21 +2394,14 @@ def ranged_melee(side1, side2, ct):
                         c.current_attack -= 1
                         c.current_defense -= 1
                 combat_log.append(f"{c.name} suffers {critical_fail_injury}")
+                record_injury(c, critical_fail_injury)
                 combat_log.append(f"{c.name} Current Status - Speed: {c.current_speed} | Attack: {c.current_attack} | Defense: {c.current_defense}")
 
         # Sort combat_side_one and combat_side_one_initiative by initiative (ascending)
-        side_one_pairs = list(zip(combat_side_one_initiative, combat_side_one))
-        side_one_pairs.sort(key=lambda x: x[0])
-        combat_side_one_initiative, combat_side_one = zip(*side_one_pairs)
-        combat_side_one_initiative = list(combat_side_one_initiative)
-        combat_side_one = list(combat_side_one)
+        combat_side_one_initiative, combat_side_one = initiative_order(combat_side_one_initiative, combat_side_one)
 
         # Sort combat_side_two and combat_side_two_initiative by initiative (ascending)
-        side_two_pairs = list(zip(combat_side_two_initiative, combat_side_two))
-        side_two_pairs.sort(key=lambda x: x[0])
-        combat_side_two_initiative, combat_side_two = zip(*side_two_pairs)
-        combat_side_two_initiative = list(combat_side_two_initiative)
-        combat_side_two = list(combat_side_two)
+        combat_side_two_initiative, combat_side_two = initiative_order(combat_side_two_initiative, combat_side_two)
 
         # Check Initiative
         # Iterate Through Combat Side One
@@ -2278,6 +2415,8 @@ def ranged_melee(side1, side2, ct):
                 c2_init = combat_side_two_initiative[j]
                 # If Combatant Has Rolled Higher
                 if ((c1_init > c2_init) and c1.currently_engaging == 0) or (c2.combatants_faced >= c2.max_combatants):
+                    if c2.combatants_faced >= c2.max_combatants:     # - Mechanic Counter - Target Swarmed
+                        c1.free_attacks += 1
                     combat_log.append(f"{c1.name} attacks {c2.name}!")
                     # Critical Strike
                     if (c1.crit_success == 1):
@@ -2307,8 +2446,9 @@ def ranged_melee(side1, side2, ct):
                         # Critical Injury Inflicted
                         if isinstance(critical_strike_injury, str) and "Critical Injury" in critical_strike_injury:
                             combat_log.append(f"{c2.name} suffers {critical_strike_injury} and is taken out!")
-                            combat_side_two.pop(i)
-                            combat_side_two_initiative.pop(i)
+                            record_injury(c2, critical_strike_injury)
+                            combat_side_two.pop(j)
+                            combat_side_two_initiative.pop(j)
                             continue
                         # Major Injury Taken
                         if critical_strike_injury == "Major Injury":
@@ -2334,6 +2474,7 @@ def ranged_melee(side1, side2, ct):
                                 c2.current_attack -= 1
                                 c2.current_defense -= 1
                         combat_log.append(f"{c2.name} suffers {critical_strike_injury}")
+                        record_injury(c2, critical_strike_injury)
                         combat_log.append(f"{c2.name} Current Status - Speed: {c2.current_speed} | Attack: {c2.current_attack} | Defense: {c2.current_defense}")
                     # Status Check
                     c1.currently_engaging = 1
@@ -2381,8 +2522,9 @@ def ranged_melee(side1, side2, ct):
                                 bonus += 30
                             morale_injury_roll = primary_injury_roll(ct, bonus)
                             combat_log.append(f"{c2.name} has been injured! - {morale_injury_roll}!")
-                        combat_side_two.pop()
-                        combat_side_two_initiative.pop()
+                            record_injury(c2, morale_injury_roll)
+                        combat_side_two.pop(j)
+                        combat_side_two_initiative.pop(j)
                         continue  # Don't increment j, as list has shifted
                     # Only Take One Attack - Terrifying Presence
                     if ("Terrifying Presence T2" in c2.perks) and (c2.combatants_faced >= 1) and (len(combat_side_two)) == 1:
@@ -2415,8 +2557,10 @@ def ranged_melee(side1, side2, ct):
                 # Critical Injury Knockout
                 if isinstance(critical_fail_injury, str) and "Critical Injury" in critical_fail_injury:
                     combat_log.append(f"{c1.name} suffers {critical_fail_injury} and is taken out!")
-                    combat_side_one.pop(i)
-                    combat_side_one_initiative.pop(i)
+                    record_injury(c1, critical_fail_injury)
+                    combat_side_one.pop(i - 1)
+                    combat_side_one_initiative.pop(i - 1)
+                    i -= 1  # - Next Combatant Has Shifted Into Its Place
                 # Major Injury Check
                 if critical_fail_injury == "Major Injury":
                     c1.major_injuries += 1
@@ -2441,6 +2585,7 @@ def ranged_melee(side1, side2, ct):
                         c1.current_attack -= 1
                         c1.current_defense -= 1
                 combat_log.append(f"{c1.name} suffers {critical_fail_injury}")
+                record_injury(c1, critical_fail_injury)
                 combat_log.append(f"{c1.name} Current Status - Speed: {c1.current_speed} | Attack: {c1.current_attack} | Defense: {c1.current_defense}")
 
         # Iterate Through Combat Side Two
@@ -2454,6 +2599,8 @@ def ranged_melee(side1, side2, ct):
                 c1_init = combat_side_one_initiative[j]
                 # If Combatant Has Rolled Higher
                 if ((combat_side_two_initiative[i] > combat_side_one_initiative[j]) and c2.currently_engaging == 0) or (combat_side_one[j].combatants_faced >= combat_side_one[j].max_combatants):
+                    if combat_side_one[j].combatants_faced >= combat_side_one[j].max_combatants:     # - Mechanic Counter - Target Swarmed
+                        c2.free_attacks += 1
                     combat_log.append(f"{c2.name} attacks {c1.name}!")
                     # Critical Strike
                     if (combat_side_two[i].crit_success == 1):
@@ -2483,8 +2630,10 @@ def ranged_melee(side1, side2, ct):
                         # Critical Injury
                         if isinstance(critical_strike_injury, str) and "Critical Injury" in critical_strike_injury:
                             combat_log.append(f"{c1.name} suffers {critical_strike_injury} and is taken out!")
-                            combat_side_one.pop(i)
-                            combat_side_one_initiative.pop(i)
+                            record_injury(c1, critical_strike_injury)
+                            combat_side_one.pop(j)
+                            combat_side_one_initiative.pop(j)
+                            continue
                         # Major Injury Check
                         if critical_strike_injury == "Major Injury":
                             combat_side_one[j].major_injuries += 1
@@ -2509,6 +2658,7 @@ def ranged_melee(side1, side2, ct):
                                 c1.current_attack -= 1
                                 c1.current_defense -= 1
                             combat_log.append(f"{c1.name} suffers {critical_strike_injury}")
+                            record_injury(c1, critical_strike_injury)
                             combat_log.append(f"{c1.name} Current Status - Speed: {c1.current_speed} | Attack: {c1.current_attack} | Defense: {c1.current_defense}")
                     # Status Check
                     c2.currently_engaging = 1
@@ -2555,6 +2705,7 @@ def ranged_melee(side1, side2, ct):
                                 bonus += 30
                             morale_injury_roll = primary_injury_roll(ct, bonus)
                             combat_log.append(f"{c1.name} has been injured! - {morale_injury_roll}!")
+                            record_injury(c1, morale_injury_roll)
                         combat_side_one.pop(j)
                         combat_side_one_initiative.pop(j)
                         continue  # Don't increment j, as list has shifted
@@ -2589,8 +2740,10 @@ def ranged_melee(side1, side2, ct):
                 # Critical Injury
                 if isinstance(critical_fail_injury, str) and "Critical Injury" in critical_fail_injury:
                     combat_log.append(f"{c2.name} suffers {critical_fail_injury} and is taken out!")
+                    record_injury(c2, critical_fail_injury)
                     combat_side_two.pop(i)
                     combat_side_two_initiative.pop(i)
+                    i -= 1  # - Next Combatant Has Shifted Into Its Place
                 # Major Injury
                 if critical_fail_injury == "Major Injury":
                     if "Ageing With Grace" in c2.perks:
@@ -2612,6 +2765,7 @@ def ranged_melee(side1, side2, ct):
                         c2.current_attack -= 1
                         c2.current_defense -= 1
                 combat_log.append(f"{c2.name} suffers {critical_fail_injury}")
+                record_injury(c2, critical_fail_injury)
                 combat_log.append(f"{c2.name} Current Status - Speed: {c2.current_speed} | Attack: {c2.current_attack} | Defense: {c2.current_defense}")
             i += 1
         
@@ -2625,12 +2779,13 @@ def ranged_melee(side1, side2, ct):
             if c.currently_engaging == 1:
                 stalemate = 0
         if stalemate == 1:
+            stalemates += 1
             combat_log.append("This round has ended in a stalemate, neither side have made progress.")
 
         # End Of Round
         # Print Round
         combat_log.append("==============================================================")
-        combat_log_string(combat_log)
+        combat_log_string(combat_log, verbose)
         combat_log = []
         # Reset Initiative
         combat_side_one_initiative = []
@@ -2650,19 +2805,28 @@ def ranged_melee(side1, side2, ct):
 
     if len(combat_side_one) == 0:
         combat_log.append("Side Two has won this duel!")
-        combat_log_string(combat_log)
+        combat_log_string(combat_log, verbose)
         combat_log = []
 
     if len(combat_side_two) == 0:
         combat_log.append("Side One has won this duel!")
-        combat_log_string(combat_log)
+        combat_log_string(combat_log, verbose)
         combat_log = []
+
+    # Round Limit Reached
+    if len(combat_side_one) > 0 and len(combat_side_two) > 0:
+        combat_log.append(f"The duel has been called after {round_count} rounds, neither side could finish it!")
+        combat_log_string(combat_log, verbose)
+        combat_log = []
+
+    # Duel Outcome
+    return duel_outcome(combat_side_one, combat_side_two, round_count, roster, stalemates)
     
 ######################################################################################################
 # Combat Scenario - Ranged vs Ranged
 ######################################################################################################
 
-def ranged_ranged(side1, side2, ct):
+def ranged_ranged(side1, side2, ct, verbose=True, max_rounds=1000):
 
     # Combat Log
     combat_log = []
@@ -2671,6 +2835,8 @@ def ranged_ranged(side1, side2, ct):
     # Side Initialization
     combat_side_one = side_initialization(side1)
     combat_side_two = side_initialization(side2)
+    roster = (list(combat_side_one), list(combat_side_two))        # Everyone Who Fought - For Mechanic Counters
+    stalemates = 0
     # Stat Initialization
     for c in combat_side_one + combat_side_two:
         ranged_initialization(c)
@@ -2691,55 +2857,17 @@ def ranged_ranged(side1, side2, ct):
     combat_log.append("==============================================================")
 
     # Battlefield Champion T3 Check
-    # Side One
-    bc3_count = 0
-    bc3_check = 0
-    for c in combat_side_one:
-        if "Battlefield Champion T3" in c.perks:
-            for d in combat_side_one:
-                if(bc3_count != bc3_check):
-                    d.current_morale += 7
-                bc3_check +=1
-            combat_log.append(f"The presence of the Battlefield Champion {c.name} boosts the morale of the men around them!")
-        bc3_count += 1
-        
-    # Side Two
-    bc3_count = 0
-    bc3_check = 0
-    for e in combat_side_two:
-        if "Battlefield Champion T3" in e.perks:
-            for f in combat_side_one:
-                if(bc3_count != bc3_check):
-                    f.current_morale += 7
-                bc3_check +=1
-            combat_log.append(f"The presence of the Battlefield Champion {e.name} boosts the morale of the men around them!")
-        bc3_count += 1
-
-    while len(combat_side_one) > 0 and len(combat_side_two) > 0:
+    battlefield_champion_aura(combat_side_one, combat_side_one, combat_log)        # Side One
+    battlefield_champion_aura(combat_side_two, combat_side_one, combat_log)        # Side Two
+    triggers = RoundTriggers()
+
+    while len(combat_side_one) > 0 and len(combat_side_two) > 0 and round_count < max_rounds:
 
         round_count += 1
         combat_log.append("==============================================================")
 
-        if (len(combat_side_one) == 1) and len(combat_side_two) > 1 and ("Terrifying Presence T1" in combat_side_one[0].perks) and (combat_side_one[0].imposed_presence == 0):
-            combat_side_one[0].imposed_presence = 1
-            for c in combat_side_two:
-                c.morale_threshold += 10
-            combat_log.append(f"The terrifying presence of {combat_side_one[0].name} strikes fear into the heart of their enemies!")
-        if (len(combat_side_two) == 1) and len(combat_side_one) > 1 and ("Terrifying Presence T1" in combat_side_two[0].perks) and (combat_side_two[0].imposed_presence == 0):
-            combat_side_two[0].imposed_presence = 1
-            for c in combat_side_one:
-                c.morale_threshold += 10
-            combat_log.append(f"The terrifying presence of {combat_side_two[0].name} strikes fear into the heart of their enemies!")
-        if (len(combat_side_one) == 1) and len(combat_side_two) > 1 and ("Terrifying Presence T2" in combat_side_one[0].perks) and (combat_side_one[0].imposed_presence == 0):
-            combat_side_one[0].imposed_presence = 1
-            for c in combat_side_two:
-                c.morale_threshold += 15
-            combat_log.append(f"The terrifying presence of {combat_side_one[0].name} strikes fear into the heart of their enemies!")
-        if (len(combat_side_two) == 1) and len(combat_side_one) > 1 and ("Terrifying Presence T2" in combat_side_two[0].perks) and (combat_side_two[0].imposed_presence == 0):
-            combat_side_two[0].imposed_presence = 1
-            for c in combat_side_one:
-                c.morale_threshold += 15
-            combat_log.append(f"The terrifying presence of {combat_side_two[0].name} strikes fear into the heart of their enemies!")
+        # Terrifying Presence T1 & T2 Check - Only When a Headcount Changed
+        triggers.round_start(combat_side_one, combat_side_two, combat_log)
         # Roll Initiative
         # Side One
         combat_side_one_initiative = []
@@ -2760,6 +2888,8 @@ def ranged_ranged(side1, side2, ct):
             if 1 in _ and 20 in _:
                 c.crit_fail = 0
                 c.crit_success = 0
+            c.crit_successes += c.crit_success                   # Mechanic Counters
+            c.crit_fails += c.crit_fail
         # Side Two
         combat_side_two_initiative = []
         for c in combat_side_two:
@@ -2779,20 +2909,14 @@ def ranged_ranged(side1, side2, ct):
             if 1 in _ and 20 in _:
                 c.crit_fail = 0
                 c.crit_success = 0
+            c.crit_successes += c.crit_success                   # Mechanic Counters
+            c.crit_fails += c.crit_fail
 
         # Sort combat_side_one and combat_side_one_initiative by initiative (ascending)
-        side_one_pairs = list(zip(combat_side_one_initiative, combat_side_one))
-        side_one_pairs.sort(key=lambda x: x[0])
-        combat_side_one_initiative, combat_side_one = zip(*side_one_pairs)
-        combat_side_one_initiative = list(combat_side_one_initiative)
-        combat_side_one = list(combat_side_one)
+        combat_side_one_initiative, combat_side_one = initiative_order(combat_side_one_initiative, combat_side_one)
 
         # Sort combat_side_two and combat_side_two_initiative by initiative (ascending)
-        side_two_pairs = list(zip(combat_side_two_initiative, combat_side_two))
-        side_two_pairs.sort(key=lambda x: x[0])
-        combat_side_two_initiative, combat_side_two = zip(*side_two_pairs)
-        combat_side_two_initiative = list(combat_side_two_initiative)
-        combat_side_two = list(combat_side_two)
+        combat_side_two_initiative, combat_side_two = initiative_order(combat_side_two_initiative, combat_side_two)
         
         # Check Initiative
         # Iterate Through Combat Side One
@@ -2804,6 +2928,8 @@ def ranged_ranged(side1, side2, ct):
                 c2 = combat_side_two[j]
                 # If Combatant Has Rolled Higher
                 if ((combat_side_one_initiative[i] >= 30) and c1.currently_engaging == 0) or (combat_side_two[j].combatants_faced >= combat_side_two[j].max_combatants):
+                    if combat_side_two[j].combatants_faced >= combat_side_two[j].max_combatants:     # - Mechanic Counter - Target Swarmed
+                        c1.free_attacks += 1
                     combat_log.append(f"{c1.name} attacks {c2.name}!")
                     # Critical Strike
                     if (combat_side_one[i].crit_success == 1):
@@ -2817,8 +2943,10 @@ def ranged_ranged(side1, side2, ct):
                         critical_strike_injury = secondary_injury_roll(ct, bonus)
                         if isinstance(critical_strike_injury, str) and "Critical Injury" in critical_strike_injury:
                             combat_log.append(f"{c2.name} suffers {critical_strike_injury} and is taken out!")
-                            combat_side_two.pop(i)
-                            combat_side_two_initiative.pop(i)
+                            record_injury(c2, critical_strike_injury)
+                            combat_side_two.pop(j)
+                            combat_side_two_initiative.pop(j)
+                            continue
                         if critical_strike_injury == "Major Injury":
                             if "Ageing With Grace" in c2.perks:
                                 c2.current_speed -= 1
@@ -2838,6 +2966,7 @@ def ranged_ranged(side1, side2, ct):
                                 c2.current_attack -= 1
                                 c2.current_defense -= 1
                         combat_log.append(f"{c2.name} suffers {critical_strike_injury}")
+                        record_injury(c2, critical_strike_injury)
                         combat_log.append(f"{c2.name} Current Status - Speed: {c2.current_speed} | Attack: {c2.current_attack} | Defense: {c2.current_defense}")
                     c1.currently_engaging = 1
                     c2.combatants_faced += 1
@@ -2861,6 +2990,7 @@ def ranged_ranged(side1, side2, ct):
                             bonus = 0
                             morale_injury_roll = primary_injury_roll(ct, bonus)
                             combat_log.append(f"{c2.name} has been injured! - {morale_injury_roll}!")
+                            record_injury(c2, morale_injury_roll)
                         combat_side_two.pop(j)
                         combat_side_two_initiative.pop(j)
                         continue  # Don't increment j, as list has shifted
@@ -2879,8 +3009,10 @@ def ranged_ranged(side1, side2, ct):
                 critical_fail_injury = secondary_injury_roll(ct, bonus)
                 if isinstance(critical_fail_injury, str) and "Critical Injury" in critical_fail_injury:
                     combat_log.append(f"{c1.name} suffers {critical_fail_injury} and is taken out!")
-                    combat_side_one.pop(i)
-                    combat_side_one_initiative.pop(i)
+                    record_injury(c1, critical_fail_injury)
+                    combat_side_one.pop(i - 1)
+                    combat_side_one_initiative.pop(i - 1)
+                    i -= 1  # - Next Combatant Has Shifted Into Its Place
                 if critical_fail_injury == "Major Injury":
                     if "Ageing With Grace" in c1.perks:
                         c1.current_speed -= 1
@@ -2900,6 +3032,7 @@ def ranged_ranged(side1, side2, ct):
                         c1.current_attack -= 1
                         c1.current_defense -= 1
                 combat_log.append(f"{c1.name} suffers {critical_fail_injury}")
+                record_injury(c1, critical_fail_injury)
                 combat_log.append(f"{c1.name} Current Status - Speed: {c1.current_speed} | Attack: {c1.current_attack} | Defense: {c1.current_defense}")
 
         # Iterate Through Combat Side Two
@@ -2911,6 +3044,8 @@ def ranged_ranged(side1, side2, ct):
                 c1 = combat_side_one[j]
                 # If Combatant Has Rolled Higher
                 if ((combat_side_two_initiative[i] > 30) and c2.currently_engaging == 0) or (combat_side_one[j].combatants_faced >= combat_side_one[j].max_combatants):
+                    if combat_side_one[j].combatants_faced >= combat_side_one[j].max_combatants:     # - Mechanic Counter - Target Swarmed
+                        c2.free_attacks += 1
                     combat_log.append(f"{c2.name} attacks {c1.name}!")
                     # Critical Strike
                     if (c2.crit_success == 1):
@@ -2924,8 +3059,10 @@ def ranged_ranged(side1, side2, ct):
                         critical_strike_injury = secondary_injury_roll(ct, bonus)
                         if isinstance(critical_strike_injury, str) and "Critical Injury" in critical_strike_injury:
                             combat_log.append(f"{c1.name} suffers {critical_strike_injury} and is taken out!")
-                            combat_side_one.pop(i)
-                            combat_side_one_initiative.pop(i)
+                            record_injury(c1, critical_strike_injury)
+                            combat_side_one.pop(j)
+                            combat_side_one_initiative.pop(j)
+                            continue
                         if critical_strike_injury == "Major Injury":
                             if "Ageing With Grace" in c1.perks:
                                 c1.current_speed -= 1
@@ -2945,6 +3082,7 @@ def ranged_ranged(side1, side2, ct):
                                 c1.current_attack -= 1
                                 c1.current_defense -= 1
                         combat_log.append(f"{c1.name} suffers {critical_strike_injury}")
+                        record_injury(c1, critical_strike_injury)
                         combat_log.append(f"{c1.name} Current Status - Speed: {c1.current_speed} | Attack: {c1.current_attack} | Defense: {c1.current_defense}")
                     # One Combatant Only
                     c2.currently_engaging = 1
@@ -2970,6 +3108,7 @@ def ranged_ranged(side1, side2, ct):
                             bonus = 0
                             morale_injury_roll = primary_injury_roll(ct, bonus)
                             combat_log.append(f"{c1.name} has been injured! - {morale_injury_roll}!")
+                            record_injury(c1, morale_injury_roll)
                         combat_side_one.pop(j)
                         combat_side_one_initiative.pop(j)
                         continue  # Don't increment j, as list has shifted
@@ -2988,8 +3127,10 @@ def ranged_ranged(side1, side2, ct):
                 critical_fail_injury = secondary_injury_roll(ct, bonus)
                 if isinstance(critical_fail_injury, str) and "Critical Injury" in critical_fail_injury:
                     combat_log.append(f"{c2.name} suffers {critical_fail_injury} and is taken out!")
+                    record_injury(c2, critical_fail_injury)
                     combat_side_two.pop(i)
                     combat_side_two_initiative.pop(i)
+                    i -= 1  # - Next Combatant Has Shifted Into Its Place
                 if critical_fail_injury == "Major Injury":
                     if "Ageing With Grace" in c2.perks:
                         c2.current_speed -= 1
@@ -3009,6 +3150,7 @@ def ranged_ranged(side1, side2, ct):
                         c2.current_attack -= 1
                         c2.current_defense -= 1
                 combat_log.append(f"{c2.name} suffers {critical_fail_injury}")
+                record_injury(c2, critical_fail_injury)
                 combat_log.append(f"{c2.name} Current Status - Speed: {c2.current_speed} | Attack: {c2.current_attack} | Defense: {c2.current_defense}")
             i += 1
         
@@ -3022,12 +3164,13 @@ def ranged_ranged(side1, side2, ct):
             if c.currently_engaging == 1:
                 stalemate = 0
         if stalemate == 1:
+            stalemates += 1
             combat_log.append("This round has ended in a stalemate, neither side have made progress.")
 
         # End Of Round
         # Print Round
         combat_log.append("==============================================================")
-        combat_log_string(combat_log)
+        combat_log_string(combat_log, verbose)
         combat_log = []
         # Reset Initiative
         combat_side_one_initiative = []
@@ -3047,14 +3190,23 @@ def ranged_ranged(side1, side2, ct):
 
     if len(combat_side_one) == 0:
         combat_log.append("Side Two has won this duel!")
-        combat_log_string(combat_log)
+        combat_log_string(combat_log, verbose)
         combat_log = []
 
     if len(combat_side_two) == 0:
         combat_log.append("Side One has won this duel!")
-        combat_log_string(combat_log)
+        combat_log_string(combat_log, verbose)
+        combat_log = []
+
+    # Round Limit Reached
+    if len(combat_side_one) > 0 and len(combat_side_two) > 0:
+        combat_log.append(f"The duel has been called after {round_count} rounds, neither side could finish it!")
+        combat_log_string(combat_log, verbose)
         combat_log = []
 
+    # Duel Outcome
+    return duel_outcome(combat_side_one, combat_side_two, round_count, roster, stalemates)
+
 
 ######################################################################################################
 # Combat Simulation
@@ -3071,23 +3223,27 @@ def ranged_ranged(side1, side2, ct):
 # side2 = [ygritte, jon]
 
 # Combat Initialization
-def combat_initialization(combat_data, side1_data, side2_data):
+def combat_initialization(combat_data, side1_data, side2_data, verbose=True, max_rounds=1000):
 
     # Live Combat
     if combat_data == "Live Melee vs Melee":
-        melee_melee(side1_data, side2_data, "steel")
+        return melee_melee(side1_data, side2_data, "steel", verbose, max_rounds)
     elif combat_data == "Live Ranged vs Melee":
-        ranged_melee(side1_data, side2_data, "steel")
+        return ranged_melee(side1_data, side2_data, "steel", verbose, max_rounds)
     elif combat_data == "Live Ranged vs Ranged":
-        ranged_ranged(side1_data, side2_data, "steel")
+        return ranged_ranged(side1_data, side2_data, "steel", verbose, max_rounds)
 
     # Blunted Combat
     elif combat_data == "Blunted Melee vs Melee":
-        melee_melee(side1_data, side2_data, "blunted")
+        return melee_melee(side1_data, side2_data, "blunted", verbose, max_rounds)
     elif combat_data == "Blunted Ranged vs Melee":
-        ranged_melee(side1_data, side2_data, "blunted")
+        return ranged_melee(side1_data, side2_data, "blunted", verbose, max_rounds)
     elif combat_data == "Blunted Ranged vs Ranged":
-        ranged_ranged(side1_data, side2_data, "blunted")
+        return ranged_ranged(side1_data, side2_data, "blunted", verbose, max_rounds)
+
+    # Invalid Combat
+    else:
+        raise ValueError(f"Invalid combat type: {combat_data}")
 
 ######################################################################################################
 # Maesty Interface
@@ -3157,171 +3313,175 @@ def combat_initialization(combat_data, side1_data, side2_data):
 # CLI Interface
 ######################################################################################################
 
-while True:
-    # Initialize Sides
-    side1_data = []
-    side2_data = []
-    # Print Menu
-    print("~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
-    print("           Crowned Stag Duel Rework")
-    print("~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
-    print("\n1: Battlefield Duel Seeking")
-    print("2: Melee vs Melee")
-    print("3: Ranged vs Melee")
-    print("4: Ranged vs Ranged\n")
-    # Select Option
-    choice = input("Select an option (1-4): ").strip()
-    # Battlefield Seeking
-    if choice == "1":
-        # Target
-        print("\nSide One:\n")
-        print(f"Target: ")
-        name = input("Name: ").strip()
-        age = input("Age: ").strip()
-        perks = input("Perks (Blade Specialist T3, Born Lucky): ").strip()
-        injuries = input("Injuries: ").strip()
-        injury_threshold = input("Injury Threshold (Default: 4): ").strip()
-        morale_threshold = input("Morale Threshold (Default: 15): ").strip()
-        items = input("Items (Valyrian Steel Sword): ").strip()
-        # Parse injuries as maluses for speed, attack, defense
-        injury_maluses = [int(x.strip()) for x in injuries.split(",") if x.strip()] if injuries else []
-        # Pad to 3 values if needed
-        while len(injury_maluses) < 3:
-            injury_maluses.append(0)
-        target = Character(
-            name,
-            int(age) if age else 18,
-            [p.strip() for p in perks.split(",") if p.strip()] if perks else [],
-            injury_maluses,
-            int(injury_threshold) if injury_threshold else 4,
-            int(morale_threshold) if morale_threshold else 15,
-            [it.strip() for it in items.split(",") if it.strip()] if items else []
-        )
-        # Initiator
-        print("\nSide Two:\n")
-        print(f"Seeker: ")
-        name = input("Name: ").strip()
-        age = input("Age: ").strip()
-        perks = input("Perks (Blade Specialist T3, Born Lucky): ").strip()
-        injuries = input("Injuries: ").strip()
-        injury_threshold = input("Injury Threshold (Default: 4): ").strip()
-        morale_threshold = input("Morale Threshold (Default: 15): ").strip()
-        items = input("Items (Valyrian Steel Sword): ").strip()
-        # Parse injuries as maluses for speed, attack, defense
-        injury_maluses = [int(x.strip()) for x in injuries.split(",") if x.strip()] if injuries else []
-        # Pad to 3 values if needed
-        while len(injury_maluses) < 3:
-            injury_maluses.append(0)
-        initiator = Character(
-            name,
-            int(age) if age else 18,
-            [p.strip() for p in perks.split(",") if p.strip()] if perks else [],
-            [i.strip() for i in injuries.split(",") if i.strip()] if injuries else [],
-            int(injury_threshold) if injury_threshold else 4,
-            int(morale_threshold) if morale_threshold else 15,
-            [it.strip() for it in items.split(",") if it.strip()] if items else []
-        )
-        # Combat Seeking Roll
-        combat_seeking(target, initiator)
-    # Combat
-    elif choice == "2" or choice == "3" or choice == "4":
-        print("\n1: Steel Weapons")
-        print("2: Blunted Weapons\n")
-        combat_type = input("Select an option (1-2): ").strip()
-        if combat_type == "1" or combat_type == "2":
-            print("\n1: Test Run - 1")
-            print("2: Test Run - 10000\n")
-            test_runs = input("Select an option (1-2): ").strip()
-            if test_runs == "1" or test_runs == "2":
-                side_one = input("\nEnter # of Combatants - Side 1: ").strip()
-                side_two = input("Enter # of Combatants - Side 2: ").strip()
-                try:
-                    side_one_int = int(side_one)
-                    side_two_int = int(side_two)
-                    if side_one_int > 0 and side_two_int > 0:
-                        s1 = 0
-                        s2 = 0
-                        while s1 < side_one_int:
-                            if s1 == 0:
-                                print("\nSide One:\n")
-                            print(f"Combatant {s1 + 1}")
-                            name = input("Name: ").strip()
-                            age = input("Age: ").strip()
-                            perks = input("Perks (Blade Specialist T3, Born Lucky): ").strip()
-                            injuries = input("Injuries: ").strip()
-                            injury_threshold = input("Injury Threshold (Default: 4): ").strip()
-                            morale_threshold = input("Morale Threshold (Default: 15): ").strip()
-                            items = input("Items (Valyrian Steel Sword): ").strip()
-                            # Parse injuries as maluses for speed, attack, defense
-                            injury_maluses = [int(x.strip()) for x in injuries.split(",") if x.strip()] if injuries else []
-                            # Pad to 3 values if needed
-                            while len(injury_maluses) < 3:
-                                injury_maluses.append(0)
-                            side1_data.append({
-                                "name": name,
-                                "age": int(age) if age else 18,
-                                "perks": [p.strip() for p in perks.split(",") if p.strip()] if perks else [],
-                                "injuries": [i.strip() for i in injuries.split(",") if i.strip()] if injuries else [],
-                                "injury_threshold": int(injury_threshold) if injury_threshold else 4,
-                                "morale_threshold": int(morale_threshold) if morale_threshold else 15,
-                                "items": [it.strip() for it in items.split(",") if it.strip()] if items else []
-                            })
-                            s1 += 1
-                        while s2 < side_two_int:
-                            if s2 == 0:
-                                print("\nSide Two:\n")
-                            print(f"Combatant {s2 + 1}")
-                            name = input("Name: ").strip()
-                            age = input("Age: ").strip()
-                            perks = input("Perks (Blade Specialist T3, Born Lucky): ").strip()
-                            injuries = input("Injuries: ").strip()
-                            injury_threshold = input("Injury Threshold (Default: 4): ").strip()
-                            morale_threshold = input("Morale Threshold (Default: 15): ").strip()
-                            items = input("Items (Valyrian Steel Sword): ").strip()
-                            # Parse injuries as maluses for speed, attack, defense
-                            injury_maluses = [int(x.strip()) for x in injuries.split(",") if x.strip()] if injuries else []
-                            # Pad to 3 values if needed
-                            while len(injury_maluses) < 3:
-                                injury_maluses.append(0)
-                            side2_data.append({
-                                "name": name,
-                                "age": int(age) if age else 18,
-                                "perks": [p.strip() for p in perks.split(",") if p.strip()] if perks else [],
-                                "injuries": [i.strip() for i in injuries.split(",") if i.strip()] if injuries else [],
-                                "injury_threshold": int(injury_threshold) if injury_threshold else 4,
-                                "morale_threshold": int(morale_threshold) if morale_threshold else 15,
-                                "items": [it.strip() for it in items.split(",") if it.strip()] if items else []
-                            })
-                            s2 += 1
-                        # default
-                        combat_data = "Live Melee vs Melee"
-                        if choice == "2" and combat_type == "1":
+def main():
+    """Crowned Stag Duel Rework CLI"""
+    while True:
+        # Initialize Sides
+        side1_data = []
+        side2_data = []
+        # Print Menu
+        print("~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
+        print("           Crowned Stag Duel Rework")
+        print("~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
+        print("\n1: Battlefield Duel Seeking")
+        print("2: Melee vs Melee")
+        print("3: Ranged vs Melee")
+        print("4: Ranged vs Ranged\n")
+        # Select Option
+        choice = input("Select an option (1-4): ").strip()
+        # Battlefield Seeking
+        if choice == "1":
+            # Target
+            print("\nSide One:\n")
+            print(f"Target: ")
+            name = input("Name: ").strip()
+            age = input("Age: ").strip()
+            perks = input("Perks (Blade Specialist T3, Born Lucky): ").strip()
+            injuries = input("Injuries: ").strip()
+            injury_threshold = input("Injury Threshold (Default: 4): ").strip()
+            morale_threshold = input("Morale Threshold (Default: 15): ").strip()
+            items = input("Items (Valyrian Steel Sword): ").strip()
+            # Parse injuries as maluses for speed, attack, defense
+            injury_maluses = [int(x.strip()) for x in injuries.split(",") if x.strip()] if injuries else []
+            # Pad to 3 values if needed
+            while len(injury_maluses) < 3:
+                injury_maluses.append(0)
+            target = Character(
+                name,
+                int(age) if age else 18,
+                [p.strip() for p in perks.split(",") if p.strip()] if perks else [],
+                injury_maluses,
+                int(injury_threshold) if injury_threshold else 4,
+                int(morale_threshold) if morale_threshold else 15,
+                [it.strip() for it in items.split(",") if it.strip()] if items else []
+            )
+            # Initiator
+            print("\nSide Two:\n")
+            print(f"Seeker: ")
+            name = input("Name: ").strip()
+            age = input("Age: ").strip()
+            perks = input("Perks (Blade Specialist T3, Born Lucky): ").strip()
+            injuries = input("Injuries: ").strip()
+            injury_threshold = input("Injury Threshold (Default: 4): ").strip()
+            morale_threshold = input("Morale Threshold (Default: 15): ").strip()
+            items = input("Items (Valyrian Steel Sword): ").strip()
+            # Parse injuries as maluses for speed, attack, defense
+            injury_maluses = [int(x.strip()) for x in injuries.split(",") if x.strip()] if injuries else []
+            # Pad to 3 values if needed
+            while len(injury_maluses) < 3:
+                injury_maluses.append(0)
+            initiator = Character(
+                name,
+                int(age) if age else 18,
+                [p.strip() for p in perks.split(",") if p.strip()] if perks else [],
+                [i.strip() for i in injuries.split(",") if i.strip()] if injuries else [],
+                int(injury_threshold) if injury_threshold else 4,
+                int(morale_threshold) if morale_threshold else 15,
+                [it.strip() for it in items.split(",") if it.strip()] if items else []
+            )
+            # Combat Seeking Roll
+            combat_seeking(target, initiator)
+        # Combat
+        elif choice == "2" or choice == "3" or choice == "4":
+            print("\n1: Steel Weapons")
+            print("2: Blunted Weapons\n")
+            combat_type = input("Select an option (1-2): ").strip()
+            if combat_type == "1" or combat_type == "2":
+                print("\n1: Test Run - 1")
+                print("2: Test Run - 10000\n")
+                test_runs = input("Select an option (1-2): ").strip()
+                if test_runs == "1" or test_runs == "2":
+                    side_one = input("\nEnter # of Combatants - Side 1: ").strip()
+                    side_two = input("Enter # of Combatants - Side 2: ").strip()
+                    try:
+                        side_one_int = int(side_one)
+                        side_two_int = int(side_two)
+                        if side_one_int > 0 and side_two_int > 0:
+                            s1 = 0
+                            s2 = 0
+                            while s1 < side_one_int:
+                                if s1 == 0:
+                                    print("\nSide One:\n")
+                                print(f"Combatant {s1 + 1}")
+                                name = input("Name: ").strip()
+                                age = input("Age: ").strip()
+                                perks = input("Perks (Blade Specialist T3, Born Lucky): ").strip()
+                                injuries = input("Injuries: ").strip()
+                                injury_threshold = input("Injury Threshold (Default: 4): ").strip()
+                                morale_threshold = input("Morale Threshold (Default: 15): ").strip()
+                                items = input("Items (Valyrian Steel Sword): ").strip()
+                                # Parse injuries as maluses for speed, attack, defense
+                                injury_maluses = [int(x.strip()) for x in injuries.split(",") if x.strip()] if injuries else []
+                                # Pad to 3 values if needed
+                                while len(injury_maluses) < 3:
+                                    injury_maluses.append(0)
+                                side1_data.append({
+                                    "name": name,
+                                    "age": int(age) if age else 18,
+                                    "perks": [p.strip() for p in perks.split(",") if p.strip()] if perks else [],
+                                    "injuries": [i.strip() for i in injuries.split(",") if i.strip()] if injuries else [],
+                                    "injury_threshold": int(injury_threshold) if injury_threshold else 4,
+                                    "morale_threshold": int(morale_threshold) if morale_threshold else 15,
+                                    "items": [it.strip() for it in items.split(",") if it.strip()] if items else []
+                                })
+                                s1 += 1
+                            while s2 < side_two_int:
+                                if s2 == 0:
+                                    print("\nSide Two:\n")
+                                print(f"Combatant {s2 + 1}")
+                                name = input("Name: ").strip()
+                                age = input("Age: ").strip()
+                                perks = input("Perks (Blade Specialist T3, Born Lucky): ").strip()
+                                injuries = input("Injuries: ").strip()
+                                injury_threshold = input("Injury Threshold (Default: 4): ").strip()
+                                morale_threshold = input("Morale Threshold (Default: 15): ").strip()
+                                items = input("Items (Valyrian Steel Sword): ").strip()
+                                # Parse injuries as maluses for speed, attack, defense
+                                injury_maluses = [int(x.strip()) for x in injuries.split(",") if x.strip()] if injuries else []
+                                # Pad to 3 values if needed
+                                while len(injury_maluses) < 3:
+                                    injury_maluses.append(0)
+                                side2_data.append({
+                                    "name": name,
+                                    "age": int(age) if age else 18,
+                                    "perks": [p.strip() for p in perks.split(",") if p.strip()] if perks else [],
+                                    "injuries": [i.strip() for i in injuries.split(",") if i.strip()] if injuries else [],
+                                    "injury_threshold": int(injury_threshold) if injury_threshold else 4,
+                                    "morale_threshold": int(morale_threshold) if morale_threshold else 15,
+                                    "items": [it.strip() for it in items.split(",") if it.strip()] if items else []
+                                })
+                                s2 += 1
+                            # default
                             combat_data = "Live Melee vs Melee"
-                        if choice == "2" and combat_type == "2":
-                            combat_data = "Blunted Melee vs Melee"
-                        if choice == "3" and combat_type == "1":
-                            combat_data = "Live Ranged vs Melee"
-                        if choice == "3" and combat_type == "2":
-                            combat_data = "Blunted Ranged vs Melee"
-                        if choice == "4" and combat_type == "1":
-                            combat_data = "Live Ranged vs Ranged"
-                        if choice == "4" and combat_type == "2":
-                            combat_data = "Blunted Ranged vs Ranged"
-                        if test_runs == "1":
-                            combat_initialization(combat_data, side1_data, side2_data)
-                        if test_runs == "2":
-                            i = 0
-                            while i < 10000:
+                            if choice == "2" and combat_type == "1":
+                                combat_data = "Live Melee vs Melee"
+                            if choice == "2" and combat_type == "2":
+                                combat_data = "Blunted Melee vs Melee"
+                            if choice == "3" and combat_type == "1":
+                                combat_data = "Live Ranged vs Melee"
+                            if choice == "3" and combat_type == "2":
+                                combat_data = "Blunted Ranged vs Melee"
+                            if choice == "4" and combat_type == "1":
+                                combat_data = "Live Ranged vs Ranged"
+                            if choice == "4" and combat_type == "2":
+                                combat_data = "Blunted Ranged vs Ranged"
+                            if test_runs == "1":
                                 combat_initialization(combat_data, side1_data, side2_data)
-                                i = i + 1
-                    else:
+                            if test_runs == "2":
+                                i = 0
+                                while i < 10000:
+                                    combat_initialization(combat_data, side1_data, side2_data)
+                                    i = i + 1
+                        else:
+                            print("Invalid amount.")
+                    except ValueError:
                         print("Invalid amount.")
-                except ValueError:
-                    print("Invalid amount.")
+                else:
+                    print("Invalid option.")
             else:
                 print("Invalid option.")
         else:
             print("Invalid option.")
-    else:
-        print("Invalid option.")
-    
\ No newline at end of file
+
+if __name__ == "__main__":
+    main()